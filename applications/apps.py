@@ -1,6 +1,21 @@
-from django.apps import AppConfig
+from django.apps              import AppConfig
+from django.db.models.signals import post_migrate, post_delete
+
+
+def reinstall_sqlite_content_triggers(sender, using, **kwargs):
+    from django.db                  import connections
+    from applications.content_index import reinstall_sqlite_triggers
+
+    if connections[using].vendor == 'sqlite':
+        reinstall_sqlite_triggers(connections[using])
 
 
 class ApplicationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'applications'
+
+    def ready(self):
+        from applications.uploads import remove_deleted_job_spool
+
+        post_migrate.connect(reinstall_sqlite_content_triggers, sender=self)
+        post_delete.connect(remove_deleted_job_spool, sender='applications.UploadJob', dispatch_uid='upload_job_spool')
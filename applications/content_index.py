@@ -0,0 +1,197 @@
+from django.db                    import connections
+from django.db.models             import CharField, IntegerField
+from django.db.models.expressions import RawSQL
+
+# 필드 -> (content JSON 경로, 타입). 값이 없거나 형식이 다르면 text 는 '', integer 는 -1 로 저장합니다.
+# 항목을 추가하거나 바꾸면 같은 목록으로 install_content_columns 를 실행하는 migration 을 추가해야 합니다.
+CONTENT_COLUMNS = {
+    'name'        : ('$.name', 'text'),
+    'career_years': ('$.careerYears', 'integer'),
+    'school'      : ('$.school', 'text'),
+}
+
+TEXT_LENGTH       = 100
+SQLITE_SIDE_TABLE = 'applications_content_columns'
+
+OUTPUT_FIELDS = {
+    'text'   : CharField,
+    'integer': IntegerField,
+}
+
+def content_keys(columns=CONTENT_COLUMNS):
+    """
+    columns 가 읽는 content 의 최상위 key. ('$.career.years' -> 'career')
+    """
+    return list(dict.fromkeys(path[2:].split('.')[0] for path, _ in columns.values()))
+
+def column_name(field):
+    return f'content_{field}'
+
+def mysql_expression(path, type):
+    if type == 'integer':
+        return f"COALESCE(JSON_VALUE(content, '{path}' RETURNING SIGNED NULL ON ERROR), -1)"
+
+    return f"COALESCE(LEFT(JSON_VALUE(content, '{path}' RETURNING CHAR(512) NULL ON ERROR), {TEXT_LENGTH}), '')"
+
+def sqlite_expression(path, type):
+    value = f"json_extract(new.content, '{path}')"
+
+    if type == 'integer':
+        return f"COALESCE(CASE WHEN json_type(new.content, '{path}') IN ('integer', 'real', 'text') THEN CAST({value} AS INTEGER) END, -1)"
+
+    return f"COALESCE(CASE WHEN json_type(new.content, '{path}') IN ('text', 'integer', 'real') THEN substr({value}, 1, {TEXT_LENGTH}) END, '')"
+
+def sqlite_install_sql(columns):
+    names       = [column_name(field) for field in columns]
+    expressions = [sqlite_expression(path, type) for path, type in columns.values()]
+    definitions = [
+        f"{column_name(field)} {'INTEGER' if type == 'integer' else 'TEXT'} NOT NULL"
+        for field, (path, type) in columns.items()
+    ]
+    upsert = (
+        f"INSERT OR REPLACE INTO {SQLITE_SIDE_TABLE}(application_id, {', '.join(names)}) "
+        f"VALUES (new.id, {', '.join(expressions)});"
+    )
+
+    return [
+        f"CREATE TABLE IF NOT EXISTS {SQLITE_SIDE_TABLE} (application_id INTEGER PRIMARY KEY, {', '.join(definitions)})",
+        *[
+            f"CREATE INDEX IF NOT EXISTS {SQLITE_SIDE_TABLE}_{name}_idx ON {SQLITE_SIDE_TABLE} ({name}, application_id)"
+            for name in names
+        ],
+        f"CREATE TRIGGER IF NOT EXISTS {SQLITE_SIDE_TABLE}_ai AFTER INSERT ON applications BEGIN {upsert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {SQLITE_SIDE_TABLE}_au AFTER UPDATE OF content ON applications BEGIN {upsert} END",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {SQLITE_SIDE_TABLE}_ad AFTER DELETE ON applications BEGIN
+            DELETE FROM {SQLITE_SIDE_TABLE} WHERE application_id = old.id;
+        END
+        """,
+    ]
+
+def sqlite_backfill_sql(columns):
+    names       = [column_name(field) for field in columns]
+    expressions = [sqlite_expression(path, type).replace('new.content', 'content') for path, type in columns.values()]
+
+    return (
+        f"INSERT OR REPLACE INTO {SQLITE_SIDE_TABLE}(application_id, {', '.join(names)}) "
+        f"SELECT id, {', '.join(expressions)} FROM applications"
+    )
+
+def install_content_columns(connection, columns):
+    """
+    MySQL 은 applications 에 content 에서 계산되는 STORED generated column 과 인덱스를 추가하고,
+    SQLite 는 트리거로 유지되는 applications_content_columns 테이블을 만듭니다. (columns 는 전체 목록)
+    """
+    if connection.vendor == 'mysql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = DATABASE() AND table_name = 'applications'"
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+
+            for field, (path, type) in columns.items():
+                name = column_name(field)
+
+                if name in existing:
+                    continue
+
+                definition = 'INT' if type == 'integer' else f'VARCHAR({TEXT_LENGTH})'
+
+                cursor.execute(
+                    f"ALTER TABLE applications "
+                    f"ADD COLUMN {name} {definition} AS ({mysql_expression(path, type)}) STORED NOT NULL, "
+                    f"ADD INDEX applications_{name}_idx ({name})"
+                )
+
+    if connection.vendor == 'sqlite':
+        # 파생 데이터이므로 목록이 바뀌면 다시 만듭니다.
+        uninstall_content_columns(connection, columns)
+
+        with connection.cursor() as cursor:
+            for sql in sqlite_install_sql(columns):
+                cursor.execute(sql)
+
+            cursor.execute(sqlite_backfill_sql(columns))
+
+def uninstall_content_columns(connection, columns):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            for field in columns:
+                cursor.execute(f"ALTER TABLE applications DROP COLUMN {column_name(field)}")
+
+        if connection.vendor == 'sqlite':
+            for suffix in ['ai', 'au', 'ad']:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {SQLITE_SIDE_TABLE}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {SQLITE_SIDE_TABLE}")
+
+def reinstall_sqlite_triggers(connection):
+    # SQLite 는 ALTER 시 applications 를 재생성하면서 트리거를 지우므로 migrate 후 다시 설치합니다.
+    if not SQLITE_SIDE_TABLE in connection.introspection.table_names():
+        return
+
+    with connection.cursor() as cursor:
+        for sql in sqlite_install_sql(CONTENT_COLUMNS):
+            cursor.execute(sql)
+
+def content_column(field, using='default'):
+    """
+    ORM 에서 annotate, filter, order_by 에 쓸 수 있는 컬럼 식
+    """
+    name   = column_name(field)
+    output = OUTPUT_FIELDS[CONTENT_COLUMNS[field][1]]()
+
+    if connections[using].vendor == 'mysql':
+        return RawSQL(f"applications.{name}", [], output_field=output)
+
+    return RawSQL(
+        f"(SELECT {name} FROM {SQLITE_SIDE_TABLE} WHERE {SQLITE_SIDE_TABLE}.application_id = applications.id)",
+        [],
+        output_field = output
+    )
+
+def annotate_content_columns(queryset, fields):
+    return queryset.annotate(**{column_name(field): content_column(field, queryset.db) for field in fields})
+
+CONTENT_ORDERINGS = ['-created_at', 'created_at'] + [
+    f'{direction}{field}' for field in CONTENT_COLUMNS for direction in ['-', '']
+]
+
+def content_filter(params):
+    """
+    text 필드는 ?name=홍길동 처럼 일치, integer 필드는 ?career_years_min=3&career_years_max=5 처럼 범위로 거릅니다.
+    (필요한 필드 목록, 조건) 을 반환하고 integer 값이 숫자가 아니면 ValueError 를 냅니다.
+    """
+    fields     = []
+    conditions = {}
+
+    for field, (path, type) in CONTENT_COLUMNS.items():
+        name = column_name(field)
+
+        if type == 'integer':
+            for suffix, lookup in [('min', 'gte'), ('max', 'lte')]:
+                value = params.get(f'{field}_{suffix}')
+
+                if value not in (None, ''):
+                    conditions[f'{name}__{lookup}'] = int(value)
+                    fields.append(field)
+
+        elif params.get(field):
+            conditions[name] = params[field]
+            fields.append(field)
+
+    return list(dict.fromkeys(fields)), conditions
+
+def content_ordering(value):
+    """
+    ?ordering=-career_years 를 keyset 정렬 목록으로 바꿉니다. (정렬 목록, 필요한 필드 목록)
+    """
+    if value not in CONTENT_ORDERINGS:
+        raise ValueError(value)
+
+    field = value.lstrip('-')
+
+    if field == 'created_at':
+        return [value, '-id'], []
+
+    return [value.replace(field, column_name(field)), '-id'], [field]
@@ -0,0 +1,85 @@
+from django.db        import transaction
+from django.db.models import Count, F
+
+from applications.models import Application, ApplicationCounter
+from recruits.models     import Recruit, RecruitApplication
+
+STATUSES = [status for status, _ in Application.STATUS_CHOICES]
+
+def add_counts(deltas):
+    """
+    deltas: {(recruit_id, status): 증감}. 호출하는 쪽의 트랜잭션 안에서 실행해야 합니다.
+    행이 없으면 0 으로 만든 뒤 count = count + delta 로 갱신하므로 동시에 갱신해도 값을 잃지 않습니다.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+
+    if not deltas:
+        return
+
+    ApplicationCounter.objects.bulk_create(
+        [ApplicationCounter(recruit_id=recruit_id, status=status) for recruit_id, status in deltas],
+        ignore_conflicts = True
+    )
+
+    # 같은 (상태, 증감) 끼리 묶어 UPDATE 한 번으로 처리합니다.
+    groups = {}
+
+    for (recruit_id, status), delta in deltas.items():
+        groups.setdefault((status, delta), []).append(recruit_id)
+
+    for (status, delta), recruit_ids in groups.items():
+        ApplicationCounter.objects.filter(recruit_id__in=recruit_ids, status=status).update(count=F('count') + delta)
+
+def add_count(recruit_ids, status, delta):
+    add_counts({(recruit_id, status): delta for recruit_id in recruit_ids})
+
+def recruit_ids_of(application_ids):
+    return RecruitApplication.objects.filter(application_id__in=application_ids).values_list('recruit_id', flat=True)
+
+def rebuild_counters():
+    """
+    recruits_applications 와 applications 를 GROUP BY 로 다시 세어 어긋난 (recruit, status) 만 고치고 그 수를 반환합니다.
+    """
+    with transaction.atomic():
+        # 기존 행을 잠가 진행 중인 갱신과 겹치지 않게 합니다.
+        current = {
+            (counter.recruit_id, counter.status): counter.count
+            for counter in ApplicationCounter.objects.select_for_update()
+        }
+        actual = {
+            (row['recruit_id'], row['application__status']): row['count']
+            for row in (RecruitApplication.objects.values('recruit_id', 'application__status')
+                                                  .annotate(count=Count('id'))
+                                                  .order_by())
+        }
+        drift = [key for key in current.keys() | actual.keys() if current.get(key, 0) != actual.get(key, 0)]
+
+        for recruit_id, status in drift:
+            ApplicationCounter.objects.update_or_create(
+                recruit_id = recruit_id,
+                status     = status,
+                defaults   = {'count': actual.get((recruit_id, status), 0)}
+            )
+
+    return len(drift)
+
+def recruit_summary():
+    """
+    공고별 상태별 지원서 수. applications 를 읽지 않으므로 비용이 공고 수에 비례합니다.
+    """
+    summary = {
+        recruit.id: {
+            'recruit_id'    : recruit.id,
+            'position_title': recruit.position_title,
+            'counts'        : dict.fromkeys(STATUSES, 0),
+            'total'         : 0,
+        }
+        for recruit in Recruit.objects.only('id', 'position_title').order_by('-id')
+    }
+
+    for recruit_id, status, count in ApplicationCounter.objects.values_list('recruit_id', 'status', 'count'):
+        if recruit_id in summary:
+            summary[recruit_id]['counts'][status] = count
+            summary[recruit_id]['total']         += count
+
+    return list(summary.values())
@@ -0,0 +1,122 @@
+import csv, re
+
+from django.db.models import Prefetch
+
+from core.encoders            import dumps
+from core.responses           import iter_chunks
+from applications.models      import Application
+from applications.serializers import application_recruits
+from recruits.models          import Recruit, ArchivedRecruit
+
+ORDERING = ['-created_at', '-id']
+
+BASE_COLUMNS = ['id', 'status', 'created_at', 'updated_at', 'user_email', 'recruit_id', 'position', 'position_title']
+
+# 엑셀에서 수식으로 실행되지 않도록 앞에 ' 를 붙입니다.
+FORMULA_PREFIXES      = ('=', '+', '-', '@', '\t', '\r')
+ILLEGAL_CHARACTERS_RE = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
+
+def export_queryset(q):
+    return (Application.objects.filter(q)
+                               .select_related('user')
+                               .only('id', 'status', 'created_at', 'updated_at', 'content', 'user', 'user__email'))
+
+def export_prefetch():
+    return [
+        Prefetch('recruits', queryset=Recruit.objects.only('id', 'position', 'position_title').order_by('id')),
+        Prefetch('archived_recruits', queryset=ArchivedRecruit.objects.only('id', 'position', 'position_title').order_by('id')),
+    ]
+
+def flatten_content(content, prefix=''):
+    """
+    {"personal": {"name": ..}} 를 [("personal.name", ..)] 로 펼칩니다. 목록은 JSON 문자열 한 칸으로 넣습니다.
+    """
+    if not isinstance(content, dict):
+        yield prefix.rstrip('.') or 'content', content
+        return
+
+    for key, value in content.items():
+        if isinstance(value, dict) and value:
+            yield from flatten_content(value, f'{prefix}{key}.')
+        else:
+            yield f'{prefix}{key}', value
+
+def content_columns(queryset, chunk_size):
+    """
+    content 의 펼친 key 목록을 처음 나온 순서대로 모읍니다. 헤더를 먼저 써야 하므로 content 만 한 번 더 읽습니다.
+    """
+    columns = {}
+
+    for chunk in iter_chunks(queryset.select_related(None).only('id', 'created_at', 'content'), ORDERING, chunk_size):
+        for application in chunk:
+            for key, _ in flatten_content(application.content):
+                columns.setdefault(key, None)
+
+    return list(columns)
+
+def cell(value):
+    if value is None:
+        return ''
+
+    if isinstance(value, (list, dict)):
+        value = dumps(value).decode()
+
+    if isinstance(value, str):
+        value = ILLEGAL_CHARACTERS_RE.sub('', value)
+
+        if value.startswith(FORMULA_PREFIXES):
+            value = "'" + value
+
+    return value
+
+def iter_rows(q, chunk_size):
+    """
+    헤더와 지원서 한 건당 한 행을 차례로 반환합니다. chunk_size 개씩 읽으므로 메모리 사용량이 일정합니다.
+    """
+    queryset = export_queryset(q)
+    columns  = content_columns(queryset, chunk_size)
+
+    yield BASE_COLUMNS + columns
+
+    for chunk in iter_chunks(queryset, ORDERING, chunk_size, export_prefetch()):
+        for application in chunk:
+            recruits = application_recruits(application)
+            content  = dict(flatten_content(application.content))
+
+            yield [cell(value) for value in [
+                application.id,
+                application.status,
+                application.created_at,
+                application.updated_at,
+                application.user.email,
+                ', '.join(str(recruit.id) for recruit in recruits),
+                ', '.join(recruit.position for recruit in recruits),
+                ', '.join(recruit.position_title for recruit in recruits),
+            ] + [content.get(column) for column in columns]]
+
+class Echo:
+    def write(self, value):
+        return value
+
+def iter_csv(rows):
+    # 엑셀에서 한글이 깨지지 않도록 BOM 을 먼저 씁니다.
+    yield '\ufeff'
+
+    writer = csv.writer(Echo())
+
+    for row in rows:
+        yield writer.writerow(row)
+
+def write_xlsx(rows, file):
+    """
+    write_only 모드는 행을 임시 파일에 바로 기록하므로 전체 행을 메모리에 올리지 않습니다.
+    """
+    from openpyxl import Workbook
+
+    workbook  = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('applications')
+
+    for row in rows:
+        worksheet.append(row)
+
+    workbook.save(file)
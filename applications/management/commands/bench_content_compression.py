@@ -0,0 +1,84 @@
+import json, random, statistics, time
+
+from django.core.management.base import BaseCommand
+from django.db                   import transaction
+from django.test                 import override_settings
+
+from core.compression    import zstandard
+from applications.models import Application
+from recruits.benchmarks import DESCRIPTION_WORDS
+from users.models        import User
+
+def make_content(size_kb):
+    content = {
+        "name"        : "홍길동",
+        "careerYears" : random.randint(0, 15),
+        "school"      : random.choice(["서울대", "부산대", "카이스트"]),
+        "portfolio"   : {"portfolioUrl": "https://example.com"},
+        "careers"     : [],
+    }
+
+    while len(json.dumps(content).encode()) < size_kb * 1024:
+        content["careers"].append({
+            "company"     : random.choice(["스톡폴리오", "위코드", "스톡커스"]),
+            "years"       : random.randint(1, 10),
+            "description" : ' '.join(random.choices(DESCRIPTION_WORDS, k=60)),
+        })
+
+    return content
+
+def median_ms(timings):
+    return statistics.median(timings) * 1000
+
+class Command(BaseCommand):
+    help = "지원서 content 크기별로 무압축, zlib, zstd 의 저장 크기와 저장/조회 시간을 비교합니다. 생성한 데이터는 rollback 합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size-kb', type=int, nargs='+', default=[4, 50, 200])
+        parser.add_argument('--rows', type=int, default=50)
+
+    def handle(self, *args, **options):
+        random.seed(0)
+
+        codecs = ['none', 'zlib'] + (['zstd'] if zstandard else [])
+
+        self.stdout.write(f"{'size':<8}{'codec':<8}{'stored(KB)':>12}{'saved':>8}{'write(ms)':>12}{'read(ms)':>12}")
+
+        for size_kb in options['size_kb']:
+            contents = [make_content(size_kb) for _ in range(options['rows'])]
+            plain    = None
+
+            for codec in codecs:
+                stored, write, read = self.measure(contents, codec)
+                plain = plain or stored
+
+                self.stdout.write(
+                    f"{str(size_kb) + 'KB':<8}{codec:<8}{stored / 1024:>12.1f}{(1 - stored / plain) * 100:>7.1f}%"
+                    f"{write:>12.3f}{read:>12.3f}"
+                )
+
+    def measure(self, contents, codec):
+        threshold = 10 ** 12 if codec == 'none' else 0
+        writes    = []
+        reads     = []
+
+        with override_settings(CONTENT_COMPRESSION=codec, CONTENT_COMPRESSION_THRESHOLD=threshold), transaction.atomic():
+            user = User.objects.create(email='bench@stockers.com', password='password')
+            ids  = []
+
+            for content in contents:
+                started = time.perf_counter()
+                ids.append(Application.objects.create(content=content, user=user).id)
+                writes.append(time.perf_counter() - started)
+
+            for application_id in ids:
+                started = time.perf_counter()
+                Application.objects.get(id=application_id).content
+                reads.append(time.perf_counter() - started)
+
+            field  = Application._meta.get_field('content')
+            stored = statistics.mean(len(field.get_prep_value(content).encode()) for content in contents)
+
+            transaction.set_rollback(True)
+
+        return stored, median_ms(writes), median_ms(reads)
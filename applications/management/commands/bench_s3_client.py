@@ -0,0 +1,96 @@
+import os, statistics, tempfile, time
+
+from boto3.s3.transfer           import TransferConfig
+from django.conf                 import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils           import override_settings
+
+from core.s3 import create_s3_client, get_s3_client, get_transfer_config, reset_s3_client
+
+BENCH_PREFIX = 'bench/'
+
+def median_ms(func, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings)
+
+class Command(BaseCommand):
+    help = (
+        "요청마다 S3 client 를 만드는 경우와 공용 client 를 재사용하는 경우, TransferConfig 별 대용량 업로드 시간을 비교합니다. "
+        "--endpoint-url 로 MinIO, moto_server 같은 로컬 S3 를 지정하거나 --moto 로 moto 서버를 띄워 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--endpoint-url', default=None)
+        parser.add_argument('--moto', action='store_true', help="moto ThreadedMotoServer 를 띄워 사용합니다. (moto[server] 필요)")
+        parser.add_argument('--bucket', default=None)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--small-size', type=int, default=64 * 1024)
+        parser.add_argument('--large-size', type=int, default=64 * 1024 * 1024)
+
+    def handle(self, *args, **options):
+        server       = None
+        endpoint_url = options['endpoint_url'] or settings.S3_ENDPOINT_URL
+
+        if options['moto']:
+            from moto.server import ThreadedMotoServer
+
+            server = ThreadedMotoServer(port=0)
+            server.start()
+            endpoint_url = f"http://{server._server.server_address[0]}:{server._server.server_address[1]}"
+
+        if not endpoint_url:
+            raise CommandError("--endpoint-url 또는 --moto 가 필요합니다. 운영 버킷에 벤치마크를 실행하지 않습니다.")
+
+        try:
+            with override_settings(S3_ENDPOINT_URL=endpoint_url):
+                reset_s3_client()
+                self.run(options['bucket'] or settings.PORTFOLIO_BUCKET, options)
+        finally:
+            reset_s3_client()
+
+            if server:
+                server.stop()
+
+    def run(self, bucket, options):
+        client = get_s3_client()
+
+        if bucket not in [item['Name'] for item in client.list_buckets()['Buckets']]:
+            client.create_bucket(Bucket=bucket)
+
+        self.stdout.write(f"endpoint: {settings.S3_ENDPOINT_URL}, bucket: {bucket}")
+
+        with tempfile.TemporaryDirectory() as directory:
+            small = os.path.join(directory, 'small')
+            large = os.path.join(directory, 'large')
+
+            with open(small, 'wb') as file:
+                file.write(os.urandom(options['small_size']))
+
+            with open(large, 'wb') as file:
+                for _ in range(options['large_size'] // (1024 * 1024)):
+                    file.write(os.urandom(1024 * 1024))
+
+            self.stdout.write(f"\n[{options['small_size']} bytes x {options['repeat']}]")
+            self.stdout.write(f"{'new client per request(ms)':<32}{median_ms(lambda: create_s3_client().upload_file(small, bucket, BENCH_PREFIX + 'small'), options['repeat']):>10.2f}")
+            self.stdout.write(f"{'shared client(ms)':<32}{median_ms(lambda: get_s3_client().upload_file(small, bucket, BENCH_PREFIX + 'small'), options['repeat']):>10.2f}")
+
+            configs = {
+                'single PUT'            : TransferConfig(multipart_threshold=options['large_size'] + 1, use_threads=False),
+                'multipart, 1 thread'   : TransferConfig(multipart_threshold=settings.S3_MULTIPART_THRESHOLD, multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE, use_threads=False),
+                'multipart, settings'   : get_transfer_config(),
+            }
+
+            self.stdout.write(f"\n[{options['large_size']} bytes x 3]")
+
+            for name, config in configs.items():
+                elapsed = median_ms(lambda: client.upload_file(large, bucket, BENCH_PREFIX + 'large', Config=config), 3)
+
+                self.stdout.write(f"{name:<32}{elapsed:>10.2f}")
+
+        client.delete_objects(Bucket=bucket, Delete={'Objects': [{'Key': BENCH_PREFIX + 'small'}, {'Key': BENCH_PREFIX + 'large'}]})
@@ -0,0 +1,53 @@
+import json, time
+
+from django.core.management.base import BaseCommand
+
+from core.compression    import MARKER, pack, is_packed
+from core.responses      import iter_chunks
+from applications.models import Application
+
+class Command(BaseCommand):
+    help = (
+        "CONTENT_COMPRESSION_THRESHOLD 이상인 기존 지원서 content 를 batch 단위로 압축합니다. "
+        "행마다 짧은 UPDATE 로 바꾸고 그 사이 수정된 행은 건너뛰므로 서비스 중에 실행할 수 있으며, 다시 실행하면 남은 행만 처리합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200)
+        parser.add_argument('--sleep', type=float, default=0, help="batch 사이에 쉬는 시간(초). 복제 지연을 줄일 때 사용합니다.")
+        parser.add_argument('--dry-run', action='store_true', help="압축 대상과 예상 절감량만 출력합니다.")
+
+    def handle(self, *args, **options):
+        keep      = Application._meta.get_field('content').keep
+        queryset  = Application.objects.exclude(content__has_key=MARKER).only('id', 'updated_at', 'content')
+        scanned   = 0
+        converted = 0
+        before    = 0
+        after     = 0
+
+        for chunk in iter_chunks(queryset, ['id'], options['batch_size']):
+            for application in chunk:
+                scanned += 1
+                packed   = pack(application.content, keep)
+
+                if not is_packed(packed):
+                    continue
+
+                # 읽은 뒤 지원자가 수정했다면 그 저장에서 이미 압축됐으므로 건너뜁니다.
+                if not options['dry_run'] and not Application.objects.filter(
+                    id         = application.id,
+                    updated_at = application.updated_at
+                ).update(content=packed):
+                    continue
+
+                converted += 1
+                before    += len(json.dumps(application.content).encode())
+                after     += len(json.dumps(packed).encode())
+
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        saved = (1 - after / before) * 100 if before else 0
+
+        self.stdout.write(f"scanned: {scanned}, {'compressible' if options['dry_run'] else 'converted'}: {converted}")
+        self.stdout.write(f"bytes: {before} -> {after} ({saved:.1f}% saved)")
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.responses           import DEFAULT_CHUNK_SIZE
+from applications.export      import iter_rows, iter_csv, write_xlsx
+from applications.serializers import application_admin_filter
+
+class Command(BaseCommand):
+    help = "지원목록을 CSV/XLSX 로 내보냅니다. 관리자 지원목록 조회와 같은 필터를 사용하며, --output 을 주지 않으면 CSV 를 stdout 으로 씁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default='-')
+        parser.add_argument('--format', choices=['csv', 'xlsx'], default=None)
+        parser.add_argument('--career-type', default=None)
+        parser.add_argument('--position', default=None)
+        parser.add_argument('--status', default=None)
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        output = options['output']
+        format = options['format'] or ('xlsx' if output.endswith('.xlsx') else 'csv')
+
+        if format == 'xlsx' and output == '-':
+            raise CommandError("xlsx 는 --output 파일 경로가 필요합니다.")
+
+        q = application_admin_filter(
+            career_type    = options['career_type'],
+            position_title = options['position'],
+            status         = options['status']
+        )
+        rows = iter_rows(q, options['chunk_size'])
+
+        if format == 'xlsx':
+            write_xlsx(rows, output)
+        elif output == '-':
+            for line in iter_csv(rows):
+                self.stdout.write(line, ending='')
+        else:
+            with open(output, 'w', encoding='utf-8', newline='') as file:
+                file.writelines(iter_csv(rows))
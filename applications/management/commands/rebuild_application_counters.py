@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from applications.counters import rebuild_counters
+
+class Command(BaseCommand):
+    help = "application_counters 를 recruits_applications 기준으로 다시 세어 어긋난 값을 바로잡습니다."
+
+    def handle(self, *args, **options):
+        drift = rebuild_counters()
+
+        self.stdout.write(f"repaired: {drift}")
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils                import timezone
+
+from applications.uploads import run_jobs, sweep_spool, SPOOL_ORPHAN_AGE
+
+# 작업이 가리키지 않는 spool 파일은 이 간격(초)마다 정리합니다.
+SWEEP_INTERVAL = 60 * 10
+
+class Command(BaseCommand):
+    help = "upload_jobs 의 포트폴리오 업로드 작업을 처리합니다. --once 가 없으면 계속 실행하며 작업이 없을 때는 --interval 초 쉽니다. 작업이 없는 spool 파일도 주기적으로 정리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10)
+        parser.add_argument('--interval', type=float, default=1.0)
+        parser.add_argument('--once', action='store_true', help="대기 중인 작업을 한 번만 처리하고 종료합니다.")
+
+    def handle(self, *args, **options):
+        processed  = 0
+        last_sweep = None
+
+        while True:
+            if last_sweep is None or time.monotonic() - last_sweep >= SWEEP_INTERVAL:
+                sweep_spool(timezone.now() - SPOOL_ORPHAN_AGE)
+                last_sweep = time.monotonic()
+
+            count      = run_jobs(options['batch_size'])
+            processed += count
+
+            if options['once'] and not count:
+                break
+
+            if not count:
+                time.sleep(options['interval'])
+
+        self.stdout.write(f"processed: {processed}")
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from applications.sweeper import sweep_tombstones, reconcile, MAX_DELETE_KEYS
+
+class Command(BaseCommand):
+    help = (
+        "portfolio_tombstones 에 기록된 포트폴리오 객체를 delete_objects 로 최대 1,000개씩 삭제합니다. "
+        "--reconcile 을 주면 먼저 버킷 목록과 attachments.file_url 을 비교해 참조되지 않는 객체를 기록합니다. cron 등으로 주기적으로 실행합니다. "
+        "reconcile 은 이 앱이 만든 모양의 key(uuid1, <user_id>/<hex>) 만 대상으로 하지만, 처음 켜거나 버킷 설정을 바꾼 뒤에는 "
+        "반드시 --reconcile --dry-run 으로 대상 key 목록을 먼저 확인하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=MAX_DELETE_KEYS)
+        parser.add_argument('--reconcile', action='store_true')
+        parser.add_argument('--min-age-hours', type=float, default=24, help="이 시간보다 최근에 올라온 객체는 reconcile 하지 않습니다.")
+        parser.add_argument('--dry-run', action='store_true', help="reconcile 결과만 출력하고 기록, 삭제하지 않습니다.")
+
+    def handle(self, *args, **options):
+        if options['reconcile']:
+            orphans = reconcile(timedelta(hours=options['min_age_hours']), batch_size=options['batch_size'], dry_run=options['dry_run'])
+
+            for key in orphans if options['dry_run'] else []:
+                self.stdout.write(key)
+
+            self.stdout.write(f"orphans: {len(orphans)}")
+
+        if options['dry_run']:
+            return
+
+        deleted, failed = sweep_tombstones(batch_size=options['batch_size'])
+
+        self.stdout.write(f"deleted: {deleted}, failed: {failed}")
@@ -0,0 +1,42 @@
+# Generated by Django 3.2.5 on 2026-10-18 15:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='status',
+            field=models.CharField(choices=[('PENDING', '업로드 대기'), ('READY', '업로드 완료'), ('FAILED', '업로드 실패')], default='READY', max_length=10),
+        ),
+        migrations.CreateModel(
+            name='UploadJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('spool_path', models.CharField(max_length=255)),
+                ('key', models.CharField(max_length=100)),
+                ('content_type', models.CharField(max_length=100)),
+                ('previous_url', models.CharField(default='', max_length=200)),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('RUNNING', '진행중'), ('DONE', '완료'), ('FAILED', '실패')], default='PENDING', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(default='')),
+                ('attachment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='applications.attachment')),
+            ],
+            options={
+                'db_table': 'upload_jobs',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='uploadjob',
+            index=models.Index(fields=['status', 'id'], name='upload_jobs_status_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.5 on 2026-10-18 16:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_upload_jobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PortfolioTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=200, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'portfolio_tombstones',
+            },
+        ),
+    ]
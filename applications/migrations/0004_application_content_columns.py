@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from applications.content_index import install_content_columns, uninstall_content_columns
+
+# 이 migration 시점의 목록입니다. CONTENT_COLUMNS 가 바뀌어도 그대로 둡니다.
+COLUMNS = {
+    'name'        : ('$.name', 'text'),
+    'career_years': ('$.careerYears', 'integer'),
+    'school'      : ('$.school', 'text'),
+}
+
+def forwards(apps, schema_editor):
+    install_content_columns(schema_editor.connection, COLUMNS)
+
+def backwards(apps, schema_editor):
+    uninstall_content_columns(schema_editor.connection, COLUMNS)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_portfolio_tombstones'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
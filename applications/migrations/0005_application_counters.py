@@ -0,0 +1,43 @@
+# Generated by Django 3.2.5 on 2026-10-18 16:05
+
+from django.db        import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+def backfill(apps, schema_editor):
+    RecruitApplication = apps.get_model('recruits', 'RecruitApplication')
+    ApplicationCounter = apps.get_model('applications', 'ApplicationCounter')
+
+    rows = (RecruitApplication.objects.values('recruit_id', 'application__status')
+                                      .annotate(count=Count('id'))
+                                      .order_by())
+
+    ApplicationCounter.objects.bulk_create([
+        ApplicationCounter(recruit_id=row['recruit_id'], status=row['application__status'], count=row['count'])
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruits', '0006_archived_recruits'),
+        ('applications', '0004_application_content_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('ST1', '서류제출'), ('ST2', '1차면접'), ('ST3', '2차면접'), ('ST4', '합격'), ('ST5', '불합격')], max_length=3)),
+                ('count', models.IntegerField(default=0)),
+                ('recruit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruits.recruit')),
+            ],
+            options={
+                'db_table': 'application_counters',
+                'unique_together': {('recruit', 'status')},
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.5 on 2026-10-18 16:08
+
+import core.compression
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_application_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='content',
+            field=core.compression.CompressedJSONField(keep=['name', 'careerYears', 'school']),
+        ),
+    ]
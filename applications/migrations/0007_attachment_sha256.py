@@ -0,0 +1,18 @@
+# Generated by Django 3.2.5 on 2026-10-18 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_compressed_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='sha256',
+            field=models.CharField(default='', max_length=64),
+        ),
+    ]
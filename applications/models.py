@@ -1,6 +1,9 @@
 from django.db import models
 
-from core.models import TimeStampModel
+from core.models      import TimeStampModel
+from core.compression import CompressedJSONField
+
+from applications.content_index import content_keys
 
 class Application(TimeStampModel):
     STATUS_CHOICES  = (
@@ -11,16 +14,66 @@ class Application(TimeStampModel):
         ('ST5', '불합격'),
     )
 
-    content = models.JSONField(null=False)
+    # 큰 지원서는 압축해 저장합니다. content_index 가 읽는 key 는 압축하지 않고 남겨둡니다.
+    content = CompressedJSONField(null=False, keep=content_keys())
     user    = models.ForeignKey('users.User', on_delete=models.CASCADE)
     status  = models.CharField(max_length=3, choices=STATUS_CHOICES, default='ST1')
 
     class Meta:
         db_table = 'applications'
 
+class ApplicationCounter(models.Model):
+    # 공고별, 상태별 지원서 수. 지원서 생성, 삭제, 상태 변경과 같은 트랜잭션에서 갱신합니다.
+    recruit = models.ForeignKey('recruits.Recruit', on_delete=models.CASCADE)
+    status  = models.CharField(max_length=3, choices=Application.STATUS_CHOICES)
+    count   = models.IntegerField(default=0)
+
+    class Meta:
+        db_table        = 'application_counters'
+        unique_together = [('recruit', 'status')]
+
 class Attachment(models.Model):
+    STATUS_CHOICES = (
+        ('PENDING', '업로드 대기'),
+        ('READY', '업로드 완료'),
+        ('FAILED', '업로드 실패'),
+    )
+
     file_url    = models.URLField()
     application = models.ForeignKey('Application', on_delete=models.CASCADE)
+    status      = models.CharField(max_length=10, choices=STATUS_CHOICES, default='READY')
+    sha256      = models.CharField(max_length=64, default='')
+
+    class Meta:
+        db_table = 'attachments'
+
+class PortfolioTombstone(models.Model):
+    # 더 이상 참조되지 않는 포트폴리오 객체 key. sweep_portfolios 가 모아서 삭제합니다.
+    key        = models.CharField(max_length=200, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'portfolio_tombstones'
+
+class UploadJob(TimeStampModel):
+    STATUS_CHOICES = (
+        ('PENDING', '대기'),
+        ('RUNNING', '진행중'),
+        ('DONE', '완료'),
+        ('FAILED', '실패'),
+    )
+
+    attachment   = models.ForeignKey('Attachment', on_delete=models.CASCADE)
+    spool_path   = models.CharField(max_length=255)
+    key          = models.CharField(max_length=100)
+    content_type = models.CharField(max_length=100)
+    previous_url = models.CharField(max_length=200, default='')
+    status       = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    attempts     = models.PositiveSmallIntegerField(default=0)
+    last_error   = models.TextField(default='')
 
     class Meta:
-        db_table = 'attachments'
\ No newline at end of file
+        db_table = 'upload_jobs'
+        indexes  = [
+            models.Index(fields=['status', 'id'], name='upload_jobs_status_idx'),
+        ]
\ No newline at end of file
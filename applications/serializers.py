@@ -1,11 +1,19 @@
-from rest_framework import serializers
+from django.db.models import Prefetch, Q
+from rest_framework   import serializers
 
-from applications.models import Application
+from applications.models        import Application
+from applications.content_index import CONTENT_COLUMNS, CONTENT_ORDERINGS, column_name, annotate_content_columns, content_filter
+from recruits.models            import Recruit, ArchivedRecruit
 
 class ApplicationSerializer(serializers.Serializer):
     content   = serializers.JSONField()
     portfolio = serializers.FileField()
 
+class ApplicationUploadBodySerializer(serializers.Serializer):
+    content_type = serializers.CharField(help_text="ex) application/pdf")
+    size         = serializers.IntegerField(help_text="파일 크기(byte)")
+    method       = serializers.ChoiceField(choices=['POST', 'PUT'], default='POST')
+
 class ApplicationAdminSerializer(serializers.ModelSerializer):
     class Meta:
         model  = Application
@@ -14,4 +22,160 @@ class ApplicationAdminSerializer(serializers.ModelSerializer):
 class ApplicationAdminPatchSerializer(serializers.ModelSerializer):
     class Meta:
         model  = Application
-        fields = ['status']
\ No newline at end of file
+        fields = ['status']
+
+class ApplicationAdminQuerySerializer(serializers.Serializer):
+    career_type = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="N, C, NC")
+    position    = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="공고 제목")
+    status      = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="ST1, ST2, ST3, ST4, ST5")
+    cursor      = serializers.CharField(allow_blank=True, allow_null=True, default="")
+    limit       = serializers.IntegerField(allow_null=True, default=20, min_value=1, max_value=100)
+    stream      = serializers.BooleanField(default=False)
+    fields      = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="ex) status,created_at,position_title")
+    name             = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="지원자 이름")
+    school           = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="학교")
+    career_years_min = serializers.IntegerField(allow_null=True, default=None, help_text="경력 연차 최소")
+    career_years_max = serializers.IntegerField(allow_null=True, default=None, help_text="경력 연차 최대")
+    ordering         = serializers.ChoiceField(choices=CONTENT_ORDERINGS, default='-created_at')
+
+def application_recruits(application):
+    """
+    지원한 공고 목록. 보관(archive)된 공고는 archived_recruits 로 연결되어 있으므로 함께 반환합니다.
+    """
+    return list(application.recruits.all()) + list(application.archived_recruits.all())
+
+def find_application(user, recruit_id):
+    """
+    공고에 대한 user 의 지원서. 보관된 공고의 지원서도 찾으며, 없으면 Application.DoesNotExist 를 냅니다.
+    """
+    applications = Application.objects.filter(user=user)
+
+    return applications.filter(recruits=recruit_id).first() or applications.get(archived_recruits=recruit_id)
+
+# 응답 필드 -> (값, 필요한 applications 컬럼, 필요한 recruits 컬럼)
+APPLICATION_ADMIN_FIELD_MAP = {
+    'id'            : (lambda application: application.id, 'id', None),
+    'content'       : (lambda application: application.content, 'content', None),
+    'status'        : (lambda application: application.status, 'status', None),
+    'created_at'    : (lambda application: application.created_at, 'created_at', None),
+    'updated_at'    : (lambda application: application.updated_at, 'updated_at', None),
+    'user_id'       : (lambda application: application.user_id, 'user', None),
+    'user_email'    : (lambda application: application.user.email, 'user__email', None),
+    'recruit_id'    : (lambda application: [recruit.id for recruit in application_recruits(application)], None, 'id'),
+    'job_openings'  : (lambda application: [recruit.job_openings for recruit in application_recruits(application)], None, 'job_openings'),
+    'author'        : (lambda application: [recruit.author for recruit in application_recruits(application)], None, 'author'),
+    'work_type'     : (lambda application: [recruit.work_type for recruit in application_recruits(application)], None, 'work_type'),
+    'career_type'   : (lambda application: [recruit.career_type for recruit in application_recruits(application)], None, 'career_type'),
+    'position_title': (lambda application: [recruit.position_title for recruit in application_recruits(application)], None, 'position_title'),
+    'position'      : (lambda application: [recruit.position for recruit in application_recruits(application)], None, 'position'),
+    'deadline'      : (lambda application: [recruit.deadline for recruit in application_recruits(application)], None, 'deadline'),
+}
+
+APPLICATION_ADMIN_FIELDS = [
+    'content', 'status', 'created_at', 'updated_at',
+    'recruit_id', 'job_openings', 'author', 'work_type', 'career_type', 'position_title', 'position', 'deadline'
+]
+
+APPLICATION_ADMIN_DETAIL_FIELDS = [
+    'id', 'content', 'status', 'created_at', 'updated_at', 'user_id', 'user_email',
+    'recruit_id', 'job_openings', 'author', 'work_type', 'career_type', 'position_title', 'position', 'deadline'
+]
+
+class ApplicationStatusFilterSerializer(serializers.Serializer):
+    career_type      = serializers.CharField(required=False, help_text="N, C, NC")
+    position         = serializers.CharField(required=False, help_text="공고 제목")
+    status           = serializers.CharField(required=False, help_text="ST1, ST2, ST3, ST4, ST5")
+    name             = serializers.CharField(required=False)
+    school           = serializers.CharField(required=False)
+    career_years_min = serializers.IntegerField(required=False)
+    career_years_max = serializers.IntegerField(required=False)
+
+class ApplicationStatusBulkSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=['ST1', 'ST2', 'ST3', 'ST4', 'ST5'])
+    ids    = serializers.ListField(child=serializers.IntegerField(), required=False, help_text="지원서 id 목록 (최대 1,000개)")
+    filter = ApplicationStatusFilterSerializer(required=False, help_text="지원목록 조회와 같은 필터")
+
+class ApplicationExportQuerySerializer(serializers.Serializer):
+    career_type = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="N, C, NC")
+    position    = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="공고 제목")
+    status      = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="ST1, ST2, ST3, ST4, ST5")
+    file_format = serializers.ChoiceField(choices=['csv', 'xlsx'], default='csv')
+
+def application_admin_filter(career_type=None, position_title=None, status=None):
+    q = Q()
+
+    if career_type:
+        q.add(Q(recruits__career_type = career_type), q.AND)
+
+    if position_title:
+        q.add(Q(recruits__position_title = position_title), q.AND)
+
+    if status:
+        q.add(Q(status = status), q.AND)
+
+    return q
+
+def application_admin_search(params, annotate=()):
+    """
+    관리자 지원목록 조회와 같은 조건(career_type, position, status, content 필터)의 queryset.
+    annotate 는 정렬 등에 추가로 필요한 content 필드이고, content 필터 값이 잘못되면 ValueError 를 냅니다.
+    """
+    q = application_admin_filter(
+        career_type    = params.get('career_type', None),
+        position_title = params.get('position', None),
+        status         = params.get('status', None)
+    )
+    fields, conditions = content_filter(params)
+
+    queryset = Application.objects.filter(q)
+    queryset = annotate_content_columns(queryset, dict.fromkeys(list(annotate) + fields))
+
+    return queryset.filter(**conditions)
+
+def has_admin_filter(params):
+    """
+    application_admin_search 의 조건이 하나라도 있는지 확인합니다. 빈 필터는 모든 지원서에 해당합니다.
+    """
+    q = application_admin_filter(
+        career_type    = params.get('career_type', None),
+        position_title = params.get('position', None),
+        status         = params.get('status', None)
+    )
+
+    return bool(q) or bool(content_filter(params)[1])
+
+def application_admin_queryset(queryset, fields, ordering=()):
+    """
+    fields 에 필요한 컬럼만 읽도록 only() 를 적용합니다. content 를 요청하지 않으면 읽지 않습니다.
+    """
+    annotated = {column_name(field) for field in CONTENT_COLUMNS}
+    columns   = {'id'} | {field.lstrip('-') for field in ordering} - annotated
+
+    for field in fields:
+        column = APPLICATION_ADMIN_FIELD_MAP[field][1]
+
+        if column:
+            columns.add(column)
+
+    if 'user__email' in columns:
+        queryset = queryset.select_related('user')
+        columns.add('user')
+
+    return queryset.only(*columns)
+
+def application_admin_prefetch(fields):
+    """
+    recruits 컬럼이 필요한 필드가 있을 때만 해당 컬럼으로 보관된 공고와 함께 prefetch 합니다.
+    """
+    columns = {APPLICATION_ADMIN_FIELD_MAP[field][2] for field in fields} - {None}
+
+    if not columns:
+        return []
+
+    return [
+        Prefetch('recruits', queryset=Recruit.objects.only('id', *columns)),
+        Prefetch('archived_recruits', queryset=ArchivedRecruit.objects.only('id', *columns)),
+    ]
+
+def serialize_application_admin(application, fields=APPLICATION_ADMIN_FIELDS):
+    return {field: APPLICATION_ADMIN_FIELD_MAP[field][0](application) for field in fields}
@@ -0,0 +1,83 @@
+import re
+
+from datetime  import datetime, timezone
+from itertools import islice
+
+from applications.models  import Attachment, UploadJob, PortfolioTombstone
+from applications.uploads import get_storage, portfolio_url
+
+MAX_DELETE_KEYS = 1000  # S3 delete_objects 한 번에 지울 수 있는 최대 key 수
+
+# 이 앱이 만드는 포트폴리오 key. 서버로 올린 파일은 uuid1, presigned 업로드는 <user_id>/<uuid4 hex> 입니다.
+# 버킷을 다른 용도와 함께 쓰므로 reconcile 은 이 모양의 key 만 대상으로 합니다.
+PORTFOLIO_KEY_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-1[0-9a-f]{3}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9]+/[0-9a-f]{32}')
+
+def is_portfolio_key(key):
+    return PORTFOLIO_KEY_RE.fullmatch(key) is not None
+
+def referenced_keys(keys):
+    """
+    attachments.file_url 이 가리키거나 아직 업로드 중인 작업의 key
+    """
+    urls = {portfolio_url(key): key for key in keys}
+
+    attached = Attachment.objects.filter(file_url__in=list(urls)).values_list('file_url', flat=True)
+    running  = UploadJob.objects.filter(key__in=list(keys), status__in=['PENDING', 'RUNNING']).values_list('key', flat=True)
+
+    return {urls[file_url] for file_url in attached} | set(running)
+
+def sweep_tombstones(storage=None, batch_size=MAX_DELETE_KEYS):
+    """
+    portfolio_tombstones 를 batch_size(최대 1,000)개씩 delete_objects 로 지우고 (삭제 수, 실패 수) 를 반환합니다.
+    그 사이 다시 참조된 key 는 지우지 않고 기록만 없앱니다. 실패한 key 는 다음 실행 때 다시 시도합니다.
+    """
+    storage    = storage or get_storage()
+    batch_size = min(batch_size, MAX_DELETE_KEYS)
+    deleted    = 0
+    failed     = 0
+    last_id    = 0
+
+    while True:
+        tombstones = list(PortfolioTombstone.objects.filter(id__gt=last_id).order_by('id')[:batch_size])
+
+        if not tombstones:
+            break
+
+        last_id    = tombstones[-1].id
+        keys       = [tombstone.key for tombstone in tombstones]
+        referenced = referenced_keys(keys)
+        targets    = [key for key in keys if key not in referenced]
+        errors     = set(storage.delete_many(targets)) if targets else set()
+
+        PortfolioTombstone.objects.filter(id__in=[tombstone.id for tombstone in tombstones if tombstone.key not in errors]).delete()
+
+        deleted += len(targets) - len(errors)
+        failed  += len(errors)
+
+    return deleted, failed
+
+def reconcile(min_age, storage=None, batch_size=MAX_DELETE_KEYS, dry_run=False):
+    """
+    버킷 목록과 attachments.file_url 을 비교해 min_age 보다 오래됐지만 참조되지 않는 key 를 tombstone 으로 기록합니다.
+    확인되지 않은 presigned 업로드, 지원서 삭제로 남은 객체 등이 대상이며, 이 앱이 만든 모양(is_portfolio_key)이 아닌
+    key 는 건드리지 않습니다. 기록한(dry_run 이면 찾은) key 목록을 반환합니다.
+    """
+    storage = storage or get_storage()
+    keys    = filter(is_portfolio_key, storage.list_keys(older_than=datetime.now(timezone.utc) - min_age))
+    orphans = []
+
+    while True:
+        chunk = list(islice(keys, batch_size))
+
+        if not chunk:
+            break
+
+        referenced = referenced_keys(chunk)
+        found      = [key for key in chunk if key not in referenced]
+
+        if found and not dry_run:
+            PortfolioTombstone.objects.bulk_create([PortfolioTombstone(key=key) for key in found], ignore_conflicts=True)
+
+        orphans += found
+
+    return orphans
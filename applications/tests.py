@@ -1,3 +1,1040 @@
-from django.test import TestCase
+import bcrypt, csv, hashlib, json, jwt, os, shutil, tempfile
 
-# Create your tests here.
+from datetime import datetime, timedelta
+from io       import BytesIO, StringIO
+from pathlib  import Path
+from unittest import mock, skipIf
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management         import call_command
+from django.db                      import connection
+from django.test        import TestCase, Client, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.test.utils  import CaptureQueriesContext
+from django.utils       import timezone
+from openpyxl           import load_workbook
+
+try:
+    from moto import mock_aws
+except ImportError:
+    mock_aws = None
+
+from global_variable          import SECRET_KEY, ALGORITHM
+from users.models             import User
+from recruits.models          import Recruit, RecruitApplication, ArchivedRecruit
+from recruits.archive         import archive_recruits, local_today
+from applications.models      import Application, ApplicationCounter, Attachment, UploadJob, PortfolioTombstone
+from core.s3                  import get_s3_client, reset_s3_client, get_transfer_config
+from core.compression         import MARKER
+from applications.uploads     import run_jobs, sweep_spool, get_storage, portfolio_key, portfolio_url, LocalStorage, MAX_ATTEMPTS, RETRY_DELAY
+from applications.sweeper     import sweep_tombstones, reconcile
+from applications.counters    import rebuild_counters
+from applications.transitions import bulk_transition
+from applications.export      import BASE_COLUMNS
+from core.responses           import DEFAULT_CHUNK_SIZE
+
+class ApplicationAdminQueryCountTest(TestCase):
+    def setUp(self):
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+        self.count  = 0
+
+    def create_applications(self, count):
+        for _ in range(count):
+            self.count += 1
+
+            user    = User.objects.create(email=f'user{self.count}@stockers.com', password='password')
+            recruit = Recruit.objects.create(
+                position       = 'developer',
+                position_title = f'백엔드 개발자 {self.count}',
+                description    = '설명',
+                work_type      = '정규직',
+                career_type    = 'C',
+                job_openings   = '1',
+                author         = 'admin@stockers.com',
+                deadline       = '2030-12-31'
+            )
+            application = Application.objects.create(content={'name': user.email}, user=user)
+
+            RecruitApplication.objects.create(recruit=recruit, application=application)
+
+        return application
+
+    def assert_constant_queries(self, num, request):
+        # 지원서 수와 관계없이 쿼리 수가 같아야 합니다.
+        for count in [2, 10]:
+            self.create_applications(count)
+
+            with self.assertNumQueries(num):
+                response = request()
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_list(self):
+        # user, applications, recruits, archived_recruits prefetch
+        self.assert_constant_queries(4, lambda: self.client.get('/applications?limit=100'))
+
+        results = self.client.get('/applications?limit=5').json()['results']
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[0]['position_title'], ['백엔드 개발자 12'])
+
+    def test_list_with_filter(self):
+        self.assert_constant_queries(4, lambda: self.client.get('/applications?career_type=C&status=ST1'))
+
+    def test_stream(self):
+        def request():
+            response = self.client.get('/applications?stream=true')
+            b''.join(response.streaming_content)
+
+            return response
+
+        self.assert_constant_queries(4, request)
+
+    def test_detail(self):
+        application = self.create_applications(1)
+
+        # user, application + user, recruits, archived_recruits prefetch
+        with self.assertNumQueries(4):
+            response = self.client.get(f'/applications/{application.id}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['user_email'], 'user1@stockers.com')
+
+    def test_detail_not_found(self):
+        self.assertEqual(self.client.get('/applications/999').status_code, 404)
+
+class ApplicationAdminCursorTest(TestCase):
+    def setUp(self):
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        user        = User.objects.create(email='user@stockers.com', password='password')
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+
+        # careerYears 는 3 가지 값만 두어 정렬 값이 같은 행이 page 경계에 걸치게 합니다.
+        Application.objects.bulk_create([
+            Application(content={'name': f'지원자 {number}', 'careerYears': number % 3}, user=user)
+            for number in range(50)
+        ])
+
+        for number, application in enumerate(Application.objects.order_by('id')):
+            Application.objects.filter(id=application.id).update(created_at=datetime(2021, 8, 20, 12, 0, 0, 100000 + number * 10))
+
+        self.names = sorted(f'지원자 {number}' for number in range(50))
+
+    def follow(self, query):
+        names  = []
+        cursor = ''
+
+        while True:
+            response = self.client.get(f'/applications?fields=content&limit=7&{query}&cursor={cursor}')
+
+            self.assertEqual(response.status_code, 200)
+
+            names += [result['content']['name'] for result in response.json()['results']]
+            cursor = response.json()['next_cursor']
+
+            if not cursor:
+                return names
+
+    def test_follow_cursor_returns_every_application_once(self):
+        self.assertEqual(sorted(self.follow('ordering=-created_at')), self.names)
+        self.assertEqual(sorted(self.follow('ordering=created_at')), self.names)
+
+    def test_follow_cursor_with_content_ordering(self):
+        self.assertEqual(sorted(self.follow('ordering=career_years')), self.names)
+        self.assertEqual(sorted(self.follow('ordering=-career_years')), self.names)
+
+class ApplicationAdminFieldsTest(TestCase):
+    def setUp(self):
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        user        = User.objects.create(email='user@stockers.com', password='password')
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+
+        self.application = Application.objects.create(content={'name': '홍길동', 'answers': ['지원 동기']}, user=user)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+
+        return response.json()['results'], [query['sql'] for query in queries if 'FROM "applications"' in query['sql']]
+
+    def test_list_and_detail_do_not_read_content_unless_requested(self):
+        results, queries = self.get('/applications?fields=updated_at,status')
+
+        self.assertEqual(list(results[0]), ['status', 'updated_at'])
+        self.assertTrue(queries)
+        self.assertFalse(any('"applications"."content"' in sql for sql in queries))
+
+        results, queries = self.get(f'/applications/{self.application.id}?fields=id,user_email')
+
+        self.assertEqual(results, [{'id': self.application.id, 'user_email': 'user@stockers.com'}])
+        self.assertFalse(any('"applications"."content"' in sql for sql in queries))
+
+    def test_content_is_read_when_requested(self):
+        results, queries = self.get('/applications?fields=content')
+
+        self.assertEqual(results, [{'content': {'name': '홍길동', 'answers': ['지원 동기']}}])
+        self.assertTrue(any('"applications"."content"' in sql for sql in queries))
+
+    def test_invalid_fields(self):
+        for url in ['/applications?fields=password', f'/applications/{self.application.id}?fields=status,secret']:
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['message'], 'INVALID_FIELDS')
+
+        # user_email 은 상세 조회에서만 쓸 수 있습니다.
+        self.assertEqual(self.client.get('/applications?fields=user_email').json()['message'], 'INVALID_FIELDS')
+
+class ApplicationContentColumnTest(TestCase):
+    def setUp(self):
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+
+        for number, (name, career_years, school) in enumerate([
+            ('홍길동', 3, '서울대'), ('김철수', 7, '부산대'), ('이영희', '5', '서울대'), ('박민수', None, None)
+        ]):
+            user = User.objects.create(email=f'user{number}@stockers.com', password='password')
+            Application.objects.create(content={'name': name, 'careerYears': career_years, 'school': school}, user=user)
+
+    def names(self, query):
+        response = self.client.get(f'/applications?fields=content&{query}')
+
+        self.assertEqual(response.status_code, 200)
+
+        return [result['content']['name'] for result in response.json()['results']]
+
+    def test_filter(self):
+        self.assertEqual(self.names('school=서울대&ordering=name'), ['이영희', '홍길동'])
+        self.assertEqual(self.names('career_years_min=4&ordering=career_years'), ['이영희', '김철수'])
+        self.assertEqual(self.names('career_years_max=5&name=홍길동'), ['홍길동'])
+
+    def test_ordering_with_cursor(self):
+        response = self.client.get('/applications?fields=content&ordering=-career_years&limit=2').json()
+        cursor   = response['next_cursor']
+
+        self.assertEqual([result['content']['name'] for result in response['results']], ['김철수', '이영희'])
+        self.assertEqual(self.names(f'ordering=-career_years&limit=2&cursor={cursor}'), ['홍길동', '박민수'])
+
+    def test_content_update_and_delete_are_reflected(self):
+        application = Application.objects.get(content__name='박민수')
+        application.content = {'name': '박민수', 'careerYears': 10}
+        application.save()
+
+        self.assertEqual(self.names('career_years_min=10'), ['박민수'])
+
+        application.delete()
+
+        self.assertEqual(self.names('career_years_min=10'), [])
+
+    def test_filtered_list_query_count(self):
+        with self.assertNumQueries(2):
+            self.client.get('/applications?fields=content&school=서울대&ordering=-career_years')
+
+    def test_invalid_ordering_and_filter(self):
+        self.assertEqual(self.client.get('/applications?ordering=content').json()['message'], 'INVALID_ORDERING')
+        self.assertEqual(self.client.get('/applications?career_years_min=many').json()['message'], 'INVALID_FILTER')
+
+class ApplicationCounterTest(TestCase):
+    def setUp(self):
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        self.admin  = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+        self.users  = [User.objects.create(email=f'user{number}@stockers.com', password='password') for number in range(2)]
+        self.recruit = Recruit.objects.create(
+            position       = 'developer',
+            position_title = '백엔드 개발자',
+            description    = '설명',
+            work_type      = '정규직',
+            career_type    = 'C',
+            job_openings   = '1',
+            author         = 'admin@stockers.com',
+            deadline       = '2030-12-31'
+        )
+
+        for user in self.users:
+            client  = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': user.id}, SECRET_KEY, ALGORITHM))
+            content = json.dumps({'name': user.email, 'portfolio': {'portfolioUrl': 'https://example.com'}})
+
+            client.post(f'/recruits/{self.recruit.id}/applications', {'content': content})
+
+    def counts(self):
+        return self.admin.get('/applications/summary').json()['results'][0]['counts']
+
+    def test_post_patch_delete_update_counters(self):
+        self.assertEqual(self.counts()['ST1'], 2)
+
+        application = Application.objects.get(user=self.users[0])
+        response    = self.admin.patch(f'/applications/{application.id}', json.dumps({'status': 'ST2'}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([self.counts()['ST1'], self.counts()['ST2']], [1, 1])
+
+        client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': self.users[0].id}, SECRET_KEY, ALGORITHM))
+        client.delete(f'/recruits/{self.recruit.id}/applications')
+
+        self.assertEqual([self.counts()['ST1'], self.counts()['ST2']], [1, 0])
+
+    def test_patch_rejects_unknown_status_and_application(self):
+        application = Application.objects.first()
+
+        self.assertEqual(self.admin.patch(f'/applications/{application.id}', json.dumps({'status': 'ST9'})).status_code, 400)
+        self.assertEqual(self.admin.patch('/applications/999', json.dumps({'status': 'ST2'})).status_code, 404)
+        self.assertEqual(self.counts()['ST1'], 2)
+
+    def test_summary_reads_counters_only(self):
+        # user, recruits, application_counters
+        with self.assertNumQueries(3):
+            results = self.admin.get('/applications/summary').json()['results']
+
+        self.assertEqual(results[0]['total'], 2)
+
+    def test_rebuild_repairs_drift(self):
+        ApplicationCounter.objects.filter(status='ST1').update(count=5)
+        Application.objects.update(status='ST4')
+
+        self.assertEqual(rebuild_counters(), 2)
+        self.assertEqual([self.counts()['ST1'], self.counts()['ST4']], [0, 2])
+        self.assertEqual(rebuild_counters(), 0)
+
+    def test_bulk_transition_by_ids(self):
+        first, second = Application.objects.order_by('id')
+        Application.objects.filter(id=second.id).update(status='ST2')
+        rebuild_counters()
+
+        response = self.admin.patch('/applications/status', json.dumps({'status': 'ST2', 'ids': [first.id, second.id, 999]}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['result'] for result in response.json()['results']], ['UPDATED', 'UNCHANGED', 'NOT_FOUND'])
+        self.assertEqual([self.counts()['ST1'], self.counts()['ST2']], [0, 2])
+        self.assertEqual(rebuild_counters(), 0)
+
+    def test_bulk_transition_by_filter(self):
+        Application.objects.filter(user=self.users[0]).update(content={'name': '홍길동', 'careerYears': 5})
+
+        response = self.admin.patch('/applications/status', json.dumps({'status': 'ST3', 'filter': {'career_years_min': 3}}))
+
+        self.assertEqual(len(response.json()['results']), 1)
+        self.assertEqual(Application.objects.get(user=self.users[0]).status, 'ST3')
+        self.assertEqual([self.counts()['ST1'], self.counts()['ST3']], [1, 1])
+
+    def test_bulk_transition_rejects_empty_filter(self):
+        for body in [{'status': 'ST2', 'filter': {}}, {'status': 'ST2', 'filter': {'status': '', 'name': ''}}]:
+            response = self.admin.patch('/applications/status', json.dumps(body))
+
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['message'], 'EMPTY_FILTER')
+
+        self.assertEqual(self.counts()['ST1'], 2)
+
+    def test_bulk_transition_rechecks_filter_after_locking(self):
+        queryset = Application.objects.filter(status='ST1')
+        ids      = list(queryset.order_by('id').values_list('id', flat=True))
+
+        # id 를 읽은 뒤 잠그기 전에 다른 관리자가 상태를 바꾼 경우
+        Application.objects.filter(id=ids[0]).update(status='ST5')
+        rebuild_counters()
+
+        results = bulk_transition(ids, 'ST2', queryset)
+
+        self.assertEqual([result['result'] for result in results], ['NOT_MATCHED', 'UPDATED'])
+        self.assertEqual(Application.objects.get(id=ids[0]).status, 'ST5')
+        self.assertEqual(rebuild_counters(), 0)
+
+    def test_bulk_transition_is_validated(self):
+        ids = list(Application.objects.values_list('id', flat=True))
+
+        for body, message in [
+            ({'status': 'ST9', 'ids': ids}, 'INVALID_STATUS'),
+            ({'status': 'ST2'}, 'KEY_ERROR'),
+            ({'status': 'ST2', 'ids': list(range(1, 1002))}, 'TOO_MANY_APPLICATIONS'),
+            ({'status': 'ST2', 'ids': 'all'}, 'BAD_REQUEST'),
+        ]:
+            self.assertEqual(self.admin.patch('/applications/status', json.dumps(body)).json()['message'], message)
+
+        self.assertEqual(self.counts()['ST1'], 2)
+
+@override_settings(CONTENT_COMPRESSION_THRESHOLD=200)
+class CompressedContentTest(TestCase):
+    def setUp(self):
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        self.user   = User.objects.create(email='user@stockers.com', password='password')
+        self.admin  = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+        self.content = {'name': '홍길동', 'careerYears': 4, 'answers': ['지원 동기 ' * 50], 'portfolio': {'portfolioUrl': ''}}
+
+    def test_large_content_is_compressed_transparently(self):
+        small       = Application.objects.create(content={'name': '김철수'}, user=self.user)
+        application = Application.objects.create(content=self.content, user=self.user)
+
+        self.assertEqual(list(Application.objects.filter(content__has_key=MARKER).values_list('id', flat=True)), [application.id])
+        self.assertEqual(Application.objects.get(id=application.id).content, self.content)
+        self.assertEqual(Application.objects.get(id=small.id).content, {'name': '김철수'})
+
+        # 압축하지 않은 key 로는 계속 거르고 정렬할 수 있습니다.
+        results = self.admin.get('/applications?fields=content&career_years_min=4').json()['results']
+
+        self.assertEqual(results, [{'content': self.content}])
+
+    def test_command_compresses_existing_rows(self):
+        with override_settings(CONTENT_COMPRESSION_THRESHOLD=10 ** 9):
+            application = Application.objects.create(content=self.content, user=self.user)
+
+        updated_at = Application.objects.get(id=application.id).updated_at
+        output     = StringIO()
+
+        call_command('compress_application_content', '--dry-run', stdout=output)
+
+        self.assertFalse(Application.objects.filter(content__has_key=MARKER).exists())
+
+        call_command('compress_application_content', stdout=output)
+
+        application = Application.objects.get(id=application.id)
+
+        self.assertTrue(Application.objects.filter(content__has_key=MARKER).exists())
+        self.assertEqual(application.content, self.content)
+        self.assertEqual(application.updated_at, updated_at)
+        self.assertIn('converted: 1', output.getvalue())
+
+class ApplicationExportTest(TestCase):
+    def setUp(self):
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        user        = User.objects.create(email='user@stockers.com', password='password')
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+        self.count  = DEFAULT_CHUNK_SIZE + 55
+        recruit     = Recruit.objects.create(
+            position       = 'developer',
+            position_title = '백엔드 개발자',
+            description    = '설명',
+            work_type      = '정규직',
+            career_type    = 'C',
+            job_openings   = '1',
+            author         = 'admin@stockers.com',
+            deadline       = '2030-12-31'
+        )
+
+        Application.objects.bulk_create([
+            Application(content={'name': f'지원자 {number}', 'careerYears': number}, user=user)
+            for number in range(self.count - 1)
+        ] + [
+            # 마지막 chunk 에만 있는 key 도 열로 나와야 합니다.
+            Application(content={'name': '마지막', 'portfolio': {'portfolioUrl': 'https://stockers.com'}}, user=user)
+        ])
+
+        # 같은 밀리초 안에 1µs 간격으로 만들어 chunk 경계가 밀리초 중간에 오도록 합니다.
+        for number, application in enumerate(Application.objects.order_by('-id')):
+            Application.objects.filter(id=application.id).update(created_at=datetime(2021, 8, 20, 12, 0, 0, 100000 + number))
+            RecruitApplication.objects.create(recruit=recruit, application=application)
+
+        self.ids     = sorted(Application.objects.values_list('id', flat=True))
+        self.columns = BASE_COLUMNS + ['name', 'careerYears', 'portfolio.portfolioUrl']
+
+    def assert_rows(self, rows):
+        header, rows = rows[0], rows[1:]
+
+        self.assertEqual(header, self.columns)
+        self.assertEqual(len(rows), self.count)
+        self.assertEqual(sorted(int(row[0]) for row in rows), self.ids)
+        self.assertTrue(all(len(row) == len(self.columns) for row in rows))
+        self.assertEqual(rows[-1][len(BASE_COLUMNS):], ['마지막', '', 'https://stockers.com'])
+        self.assertEqual(rows[0][BASE_COLUMNS.index('position_title')], '백엔드 개발자')
+
+    def read_csv(self, content):
+        return list(csv.reader(StringIO(content.lstrip('\ufeff'))))
+
+    def read_xlsx(self, file):
+        worksheet = load_workbook(file, read_only=True)['applications']
+
+        return [['' if value is None else value for value in row] for row in worksheet.iter_rows(values_only=True)]
+
+    def test_csv(self):
+        response = self.client.get('/applications/export')
+
+        self.assertEqual(response.status_code, 200)
+        self.assert_rows(self.read_csv(b''.join(response.streaming_content).decode()))
+
+    def test_xlsx(self):
+        response = self.client.get('/applications/export?file_format=xlsx')
+
+        self.assertEqual(response.status_code, 200)
+        self.assert_rows(self.read_xlsx(BytesIO(b''.join(response.streaming_content))))
+
+    def test_invalid_format(self):
+        self.assertEqual(self.client.get('/applications/export?file_format=pdf').status_code, 400)
+
+    def test_command_csv(self):
+        output = StringIO()
+
+        call_command('export_applications', '--chunk-size', '100', stdout=output)
+
+        self.assert_rows(self.read_csv(output.getvalue()))
+
+    def test_command_xlsx(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'applications.xlsx')
+
+            call_command('export_applications', '--output', path, '--chunk-size', '100')
+
+            self.assert_rows(self.read_xlsx(path))
+
+class RecruitArchiveTest(TestCase):
+    def setUp(self):
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        self.user   = User.objects.create(email='user@stockers.com', password='password')
+        self.admin  = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': self.user.id}, SECRET_KEY, ALGORITHM))
+
+        self.recruit = Recruit.objects.create(
+            position       = 'developer',
+            position_title = '마감된 공고',
+            description    = '설명',
+            work_type      = '정규직',
+            career_type    = 'C',
+            job_openings   = '1',
+            author         = 'admin@stockers.com',
+            deadline       = '2020-01-31'
+        )
+        self.application = Application.objects.create(content={'name': '홍길동', 'portfolio': {'portfolioUrl': ''}}, user=self.user)
+
+        RecruitApplication.objects.create(recruit=self.recruit, application=self.application)
+        Attachment.objects.create(file_url='https://stockers.com/portfolio.pdf', application=self.application)
+        rebuild_counters()
+
+        self.assertEqual(archive_recruits(local_today()), 1)
+
+    def test_recruit_is_moved_with_its_applications(self):
+        self.assertFalse(Recruit.objects.filter(id=self.recruit.id).exists())
+        self.assertEqual(list(ArchivedRecruit.objects.get(id=self.recruit.id).applications.all()), [self.application])
+        # 공고별 지원서 수는 공고와 함께 삭제됩니다.
+        self.assertFalse(ApplicationCounter.objects.exists())
+
+    def test_user_can_still_read_update_and_delete_application(self):
+        url = f'/recruits/{self.recruit.id}/applications'
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['result']['content']['portfolio']['portfolioUrl'], 'https://stockers.com/portfolio.pdf')
+
+        content  = {'name': '김철수', 'portfolio': {'portfolioUrl': 'https://stockers.com/portfolio.pdf'}}
+        response = self.client.patch(
+            url, encode_multipart(BOUNDARY, {'content': json.dumps(content)}), content_type=MULTIPART_CONTENT
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Application.objects.get(id=self.application.id).content, content)
+
+        self.assertEqual(self.client.delete(url).status_code, 200)
+        self.assertFalse(Application.objects.exists())
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_signin_with_archived_recruit(self):
+        password = 'password1!'
+
+        self.user.password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        self.user.save()
+
+        response = Client().post(
+            '/users/signin',
+            {'email': self.user.email, 'password': password, 'recruit_id': self.recruit.id},
+            content_type = 'application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['is_applied'])
+
+        response = Client().post(
+            '/users/signin',
+            {'email': 'new@stockers.com', 'password': password, 'recruit_id': self.recruit.id},
+            content_type = 'application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['is_applied'])
+
+        response = Client().post(
+            '/users/signin',
+            {'email': self.user.email, 'password': password, 'recruit_id': self.recruit.id + 1},
+            content_type = 'application/json'
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_admin_list_and_export_keep_recruit_columns(self):
+        results = self.admin.get('/applications').json()['results']
+
+        self.assertEqual(results[0]['recruit_id'], [self.recruit.id])
+        self.assertEqual(results[0]['position_title'], ['마감된 공고'])
+
+        rows = list(csv.reader(StringIO(b''.join(self.admin.get('/applications/export').streaming_content).decode().lstrip('\ufeff'))))
+
+        self.assertEqual(rows[1][BASE_COLUMNS.index('recruit_id')], str(self.recruit.id))
+        self.assertEqual(rows[1][BASE_COLUMNS.index('position_title')], '마감된 공고')
+
+    def test_open_only_uses_local_date(self):
+        recruit = Recruit.objects.create(
+            position       = 'developer',
+            position_title = '오늘 마감',
+            description    = '설명',
+            work_type      = '정규직',
+            career_type    = 'C',
+            job_openings   = '1',
+            author         = 'admin@stockers.com',
+            deadline       = local_today()
+        )
+        results = self.client.get('/recruits?open_only=true&fields=id').json()['results']
+
+        self.assertEqual(results, [{'id': recruit.id}])
+
+class FailingStorage:
+    def upload(self, path, key, content_type):
+        raise IOError("S3 unavailable")
+
+class RecordingStorage:
+    def __init__(self, failed=()):
+        self.calls  = []
+        self.failed = list(failed)
+
+    def delete_many(self, keys):
+        self.calls.append(list(keys))
+
+        return [key for key in keys if key in self.failed]
+
+class PortfolioUploadTestCase(TestCase):
+    stream_uploads = False
+
+    def setUp(self):
+        self.root  = tempfile.mkdtemp()
+        self.spool = tempfile.mkdtemp()
+
+        settings = override_settings(
+            PORTFOLIO_STORAGE        = 'local',
+            PORTFOLIO_LOCAL_ROOT     = self.root,
+            UPLOAD_SPOOL_DIR         = self.spool,
+            PORTFOLIO_STREAM_UPLOADS = self.stream_uploads,
+            S3_MULTIPART_CHUNKSIZE   = 4
+        )
+        settings.enable()
+
+        self.addCleanup(settings.disable)
+        self.addCleanup(shutil.rmtree, self.root)
+        self.addCleanup(shutil.rmtree, self.spool)
+
+        user        = User.objects.create(email='user@stockers.com', password='password')
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': user.id}, SECRET_KEY, ALGORITHM))
+        self.recruit = Recruit.objects.create(
+            position       = 'developer',
+            position_title = '백엔드 개발자',
+            description    = '설명',
+            work_type      = '정규직',
+            career_type    = 'C',
+            job_openings   = '1',
+            author         = 'admin@stockers.com',
+            deadline       = '2030-12-31'
+        )
+
+    def upload(self, method, body):
+        content = json.dumps({'name': '홍길동', 'portfolio': {'portfolioUrl': ''}})
+        data    = {'content': content, 'portfolio': SimpleUploadedFile('portfolio.pdf', body, 'application/pdf')}
+
+        if method == 'post':
+            return self.client.post(f'/recruits/{self.recruit.id}/applications', data)
+
+        return self.client.patch(
+            f'/recruits/{self.recruit.id}/applications',
+            encode_multipart(BOUNDARY, data),
+            content_type = MULTIPART_CONTENT
+        )
+
+    def stored(self, attachment):
+        return Path(self.root, portfolio_key(attachment.file_url)).read_bytes()
+
+class PortfolioUploadJobTest(PortfolioUploadTestCase):
+    def test_post_returns_pending_attachment_and_worker_uploads(self):
+        response = self.upload('post', b'first')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['attachment_status'], 'PENDING')
+        self.assertEqual(Attachment.objects.get().file_url, '')
+
+        self.assertEqual(run_jobs(10), 1)
+
+        attachment = Attachment.objects.get()
+        job        = UploadJob.objects.get()
+
+        self.assertEqual(attachment.status, 'READY')
+        self.assertEqual(self.stored(attachment), b'first')
+        self.assertEqual(job.status, 'DONE')
+        self.assertFalse(os.path.exists(job.spool_path))
+
+    def test_patch_replaces_file_after_upload(self):
+        self.upload('post', b'first')
+        run_jobs(10)
+
+        previous = Attachment.objects.get()
+        response = self.upload('patch', b'second')
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(Attachment.objects.get().file_url, previous.file_url)
+
+        run_jobs(10)
+
+        attachment = Attachment.objects.get()
+
+        self.assertEqual(self.stored(attachment), b'second')
+
+        # 요청과 워커는 지우지 않고 기록만 합니다.
+        previous_key = portfolio_key(previous.file_url)
+
+        self.assertTrue(Path(self.root, previous_key).exists())
+        self.assertTrue(PortfolioTombstone.objects.filter(key=previous_key).exists())
+
+        self.assertEqual(sweep_tombstones(), (1, 0))
+        self.assertFalse(Path(self.root, previous_key).exists())
+        self.assertFalse(PortfolioTombstone.objects.exists())
+
+    def test_failed_upload_is_retried_then_marked_failed(self):
+        self.upload('post', b'first')
+
+        for attempt in range(MAX_ATTEMPTS):
+            UploadJob.objects.update(updated_at=timezone.now() - RETRY_DELAY)
+
+            with self.assertLogs('applications.uploads', 'WARNING'):
+                run_jobs(10, storage=FailingStorage())
+
+        job = UploadJob.objects.get()
+
+        self.assertEqual(job.attempts, MAX_ATTEMPTS)
+        self.assertEqual(job.status, 'FAILED')
+        self.assertEqual(Attachment.objects.get().status, 'FAILED')
+
+    def test_deleting_application_with_pending_job_removes_spool(self):
+        self.upload('post', b'first')
+
+        spool_path = UploadJob.objects.get().spool_path
+
+        self.assertTrue(os.path.exists(spool_path))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.client.delete(f'/recruits/{self.recruit.id}/applications').status_code, 200)
+
+        self.assertFalse(UploadJob.objects.exists())
+        self.assertEqual(os.listdir(self.spool), [])
+        self.assertEqual(run_jobs(10), 0)
+
+    def test_sweep_spool_removes_files_without_pending_job(self):
+        self.upload('post', b'first')
+
+        # 작업 등록이 rollback 되면 spool 파일만 남습니다.
+        orphan = Path(self.spool, 'orphan')
+        orphan.write_bytes(b'orphan')
+
+        self.assertEqual(sweep_spool(timezone.now() - timedelta(hours=1)), 0)
+        self.assertEqual(sweep_spool(timezone.now() + timedelta(seconds=1)), 1)
+
+        self.assertFalse(orphan.exists())
+        self.assertTrue(os.path.exists(UploadJob.objects.get().spool_path))
+
+class StreamingUploadTest(PortfolioUploadTestCase):
+    stream_uploads = True
+
+    def files(self):
+        return sorted(path.relative_to(self.root).as_posix() for path in Path(self.root).rglob('*') if path.is_file())
+
+    def test_post_streams_file_to_storage(self):
+        response = self.upload('post', b'first file')
+
+        attachment = Attachment.objects.get()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['attachment_status'], 'READY')
+        self.assertEqual(self.stored(attachment), b'first file')
+        self.assertEqual(attachment.sha256, hashlib.sha256(b'first file').hexdigest())
+        self.assertFalse(UploadJob.objects.exists())
+        self.assertEqual(os.listdir(self.spool), [])
+
+    def test_patch_replaces_file_and_buries_previous(self):
+        self.upload('post', b'first')
+
+        previous = Attachment.objects.get()
+        response = self.upload('patch', b'second')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.stored(Attachment.objects.get()), b'second')
+        self.assertTrue(PortfolioTombstone.objects.filter(key=portfolio_key(previous.file_url)).exists())
+
+    def test_failed_request_aborts_upload(self):
+        self.upload('post', b'first')
+
+        files = self.files()
+
+        # 이미 지원한 공고, 크기 초과 모두 저장소에 파일을 남기지 않습니다.
+        self.assertEqual(self.upload('post', b'again').json()['message'], 'ALREADY_EXISTS')
+
+        with override_settings(PORTFOLIO_MAX_SIZE=4):
+            self.assertEqual(self.upload('patch', b'too large').json()['message'], 'INVALID_SIZE')
+
+        self.assertEqual(self.files(), files)
+        self.assertEqual(Attachment.objects.get().status, 'READY')
+
+    def test_already_exists_is_checked_before_upload_starts(self):
+        self.upload('post', b'first')
+
+        with mock.patch.object(LocalStorage, 'open_multipart') as open_multipart:
+            self.assertEqual(self.upload('post', b'again').json()['message'], 'ALREADY_EXISTS')
+
+        open_multipart.assert_not_called()
+
+class LocalPresignTest(PortfolioUploadTestCase):
+    def test_local_storage_rejects_presigned_upload(self):
+        response = self.client.post(
+            f'/recruits/{self.recruit.id}/applications/upload',
+            json.dumps({'content_type': 'application/pdf', 'size': 5}),
+            content_type = 'application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['message'], 'PRESIGN_NOT_SUPPORTED')
+
+        content  = json.dumps({'name': '홍길동', 'portfolio': {'portfolioUrl': ''}})
+        response = self.client.post(f'/recruits/{self.recruit.id}/applications', {'content': content, 'portfolio_key': f'{User.objects.get().id}/{"a" * 32}'})
+
+        self.assertEqual(response.json()['message'], 'PRESIGN_NOT_SUPPORTED')
+        self.assertFalse(Application.objects.exists())
+
+class PortfolioSweeperTest(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+        settings = override_settings(PORTFOLIO_STORAGE='local', PORTFOLIO_LOCAL_ROOT=self.root)
+        settings.enable()
+
+        self.addCleanup(settings.disable)
+        self.addCleanup(shutil.rmtree, self.root)
+
+        self.user = User.objects.create(email='user@stockers.com', password='password')
+
+    def test_delete_application_records_tombstone(self):
+        recruit = Recruit.objects.create(
+            position       = 'developer',
+            position_title = '백엔드 개발자',
+            description    = '설명',
+            work_type      = '정규직',
+            career_type    = 'C',
+            job_openings   = '1',
+            author         = 'admin@stockers.com',
+            deadline       = '2030-12-31'
+        )
+        application = Application.objects.create(content={}, user=self.user)
+
+        RecruitApplication.objects.create(recruit=recruit, application=application)
+        Attachment.objects.create(application=application, file_url=portfolio_url('1/portfolio'))
+
+        client   = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': self.user.id}, SECRET_KEY, ALGORITHM))
+        response = client.delete(f'/recruits/{recruit.id}/applications')
+
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(list(PortfolioTombstone.objects.values_list('key', flat=True)), ['1/portfolio'])
+
+    def test_sweep_deletes_in_batches_of_1000(self):
+        PortfolioTombstone.objects.bulk_create([PortfolioTombstone(key=f'key{number}') for number in range(1001)])
+
+        storage = RecordingStorage(failed=['key7'])
+
+        self.assertEqual(sweep_tombstones(storage), (1000, 1))
+        self.assertEqual([len(keys) for keys in storage.calls], [1000, 1])
+        self.assertEqual(list(PortfolioTombstone.objects.values_list('key', flat=True)), ['key7'])
+
+    def test_sweep_skips_referenced_key(self):
+        application = Application.objects.create(content={}, user=self.user)
+        Attachment.objects.create(application=application, file_url=portfolio_url('1/portfolio'))
+        PortfolioTombstone.objects.create(key='1/portfolio')
+
+        storage = RecordingStorage()
+
+        self.assertEqual(sweep_tombstones(storage), (0, 0))
+        self.assertEqual(storage.calls, [])
+        self.assertFalse(PortfolioTombstone.objects.exists())
+
+    def test_reconcile_records_unreferenced_objects(self):
+        attached    = f'1/{"a" * 32}'
+        orphans     = [f'1/{"b" * 32}', '6f1c2a3e-3005-11ec-8d3d-0242ac130003']
+        application = Application.objects.create(content={}, user=self.user)
+        Attachment.objects.create(application=application, file_url=portfolio_url(attached))
+
+        # 같은 버킷을 쓰는 다른 서비스의 객체는 이 앱이 만든 key 모양이 아니므로 건드리지 않습니다.
+        for key in [attached, *orphans, 'static/logo.png', 'backup/1/dump.sql', '2/portfolio']:
+            Path(self.root, key).parent.mkdir(parents=True, exist_ok=True)
+            Path(self.root, key).write_bytes(b'pdf')
+
+        self.assertEqual(reconcile(timedelta(hours=1)), [])
+        self.assertEqual(sorted(reconcile(timedelta(0), dry_run=True)), sorted(orphans))
+        self.assertFalse(PortfolioTombstone.objects.exists())
+
+        reconcile(timedelta(0))
+        sweep_tombstones()
+
+        self.assertTrue(Path(self.root, attached).exists())
+        self.assertFalse(any(Path(self.root, key).exists() for key in orphans))
+        self.assertTrue(all(Path(self.root, key).exists() for key in ['static/logo.png', 'backup/1/dump.sql', '2/portfolio']))
+
+    def test_dry_run_command_lists_orphans_without_recording(self):
+        key = f'1/{"c" * 32}'
+
+        Path(self.root, '1').mkdir()
+        Path(self.root, key).write_bytes(b'pdf')
+
+        output = StringIO()
+        call_command('sweep_portfolios', '--reconcile', '--dry-run', '--min-age-hours', '0', stdout=output)
+
+        self.assertEqual(output.getvalue().splitlines(), [key, 'orphans: 1'])
+        self.assertFalse(PortfolioTombstone.objects.exists())
+        self.assertTrue(Path(self.root, key).exists())
+
+class S3UploadTestCase(TestCase):
+    stream_uploads = False
+
+    def setUp(self):
+        aws      = mock_aws()
+        settings = override_settings(
+            PORTFOLIO_STORAGE        = 's3',
+            PORTFOLIO_STREAM_UPLOADS = self.stream_uploads,
+            S3_ENDPOINT_URL          = None,
+            S3_REGION_NAME           = 'us-east-1'
+        )
+
+        aws.start()
+        settings.enable()
+        reset_s3_client()
+
+        self.addCleanup(aws.stop)
+        self.addCleanup(settings.disable)
+        self.addCleanup(reset_s3_client)
+
+        get_s3_client().create_bucket(Bucket='stockers-bucket')
+
+        self.user    = User.objects.create(email='user@stockers.com', password='password')
+        self.client  = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': self.user.id}, SECRET_KEY, ALGORITHM))
+        self.recruit = Recruit.objects.create(
+            position       = 'developer',
+            position_title = '백엔드 개발자',
+            description    = '설명',
+            work_type      = '정규직',
+            career_type    = 'C',
+            job_openings   = '1',
+            author         = 'admin@stockers.com',
+            deadline       = '2030-12-31'
+        )
+
+@skipIf(mock_aws is None, "moto is not installed")
+class PresignedUploadTest(S3UploadTestCase):
+    def presign(self, **body):
+        return self.client.post(
+            f'/recruits/{self.recruit.id}/applications/upload',
+            json.dumps(dict({'content_type': 'application/pdf', 'size': 5}, **body)),
+            content_type = 'application/json'
+        )
+
+    def confirm(self, key):
+        content = json.dumps({'name': '홍길동', 'portfolio': {'portfolioUrl': ''}})
+
+        return self.client.post(f'/recruits/{self.recruit.id}/applications', {'content': content, 'portfolio_key': key})
+
+    def put_object(self, key, body=b'hello', content_type='application/pdf'):
+        get_s3_client().put_object(Bucket='stockers-bucket', Key=key, Body=body, ContentType=content_type)
+
+    def test_presign_post_and_put(self):
+        post = self.presign().json()['result']
+        put  = self.presign(method='PUT').json()['result']
+
+        self.assertTrue(post['key'].startswith(f'{self.user.id}/'))
+        self.assertEqual(post['fields']['key'], post['key'])
+        self.assertEqual(post['fields']['Content-Type'], 'application/pdf')
+        self.assertIn(put['key'], put['url'])
+
+    def test_presign_rejects_content_type_and_size(self):
+        self.assertEqual(self.presign(content_type='text/html').json()['message'], 'INVALID_CONTENT_TYPE')
+
+        with override_settings(PORTFOLIO_MAX_SIZE=4):
+            self.assertEqual(self.presign().json()['message'], 'INVALID_SIZE')
+
+    def test_confirm_attaches_uploaded_object(self):
+        key = self.presign().json()['result']['key']
+        self.put_object(key)
+
+        response = self.confirm(key)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Attachment.objects.get().file_url, portfolio_url(key))
+        self.assertEqual(Attachment.objects.get().status, 'READY')
+        self.assertFalse(UploadJob.objects.exists())
+
+    def test_confirm_rejects_missing_foreign_and_invalid_objects(self):
+        key = self.presign().json()['result']['key']
+
+        self.assertEqual(self.confirm(key).json()['message'], 'UPLOAD_NOT_FOUND')
+
+        self.put_object('999/other')
+        self.assertEqual(self.confirm('999/other').json()['message'], 'INVALID_KEY')
+
+        self.put_object(key, content_type='text/html')
+        self.assertEqual(self.confirm(key).json()['message'], 'INVALID_CONTENT_TYPE')
+        self.assertFalse(Application.objects.exists())
+
+@skipIf(mock_aws is None, "moto is not installed")
+class S3StreamingUploadTest(S3UploadTestCase):
+    stream_uploads = True
+
+    def test_streamed_upload_is_sent_in_parts(self):
+        body    = os.urandom(6 * 1024 * 1024)
+        content = json.dumps({'name': '홍길동', 'portfolio': {'portfolioUrl': ''}})
+        data    = {'content': content, 'portfolio': SimpleUploadedFile('portfolio.pdf', body, 'application/pdf')}
+
+        with override_settings(S3_MULTIPART_CHUNKSIZE=5 * 1024 * 1024):
+            self.assertEqual(self.client.post(f'/recruits/{self.recruit.id}/applications', data).status_code, 201)
+            self.assertEqual(self.client.post(f'/recruits/{self.recruit.id}/applications', data).status_code, 400)
+
+        key    = portfolio_key(Attachment.objects.get().file_url)
+        client = get_s3_client()
+
+        self.assertEqual(client.head_object(Bucket='stockers-bucket', Key=key, PartNumber=1)['PartsCount'], 2)
+        self.assertEqual(client.get_object(Bucket='stockers-bucket', Key=key)['Body'].read(), body)
+        self.assertNotIn('Uploads', client.list_multipart_uploads(Bucket='stockers-bucket'))
+
+@skipIf(mock_aws is None, "moto is not installed")
+class S3ClientTest(S3UploadTestCase):
+    def test_client_is_reused_within_process(self):
+        client = get_s3_client()
+
+        self.assertIs(get_s3_client(), client)
+        self.assertIs(get_storage().client, client)
+
+    def test_forked_process_gets_new_client(self):
+        parent = get_s3_client()
+
+        with mock.patch('core.s3.os.getpid', return_value=os.getpid() + 1):
+            child = get_s3_client()
+
+            self.assertIsNot(child, parent)
+            self.assertIs(get_s3_client(), child)
+            self.assertEqual([bucket['Name'] for bucket in child.list_buckets()['Buckets']], ['stockers-bucket'])
+
+    def test_client_uses_settings(self):
+        reset_s3_client()
+
+        with override_settings(S3_MAX_POOL_CONNECTIONS=7):
+            client = get_s3_client()
+
+        self.assertEqual(client.meta.config.max_pool_connections, 7)
+        self.assertEqual(client.meta.region_name, 'us-east-1')
+
+    @override_settings(S3_MULTIPART_THRESHOLD=16 * 1024 * 1024, S3_MULTIPART_CHUNKSIZE=6 * 1024 * 1024, S3_MAX_CONCURRENCY=2)
+    def test_transfer_config_uses_settings(self):
+        config = get_transfer_config()
+
+        self.assertEqual(config.multipart_threshold, 16 * 1024 * 1024)
+        self.assertEqual(config.multipart_chunksize, 6 * 1024 * 1024)
+        self.assertEqual(config.max_request_concurrency, 2)
+        self.assertTrue(config.use_threads)
+        self.assertEqual(get_storage().transfer_config.multipart_chunksize, 6 * 1024 * 1024)
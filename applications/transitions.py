@@ -0,0 +1,61 @@
+from collections import Counter
+
+from django.db import transaction
+
+from applications.models   import Application
+from applications.counters import add_counts, STATUSES
+from recruits.models       import RecruitApplication
+
+MAX_BULK_SIZE = 1000
+
+class InvalidTransition(ValueError):
+    pass
+
+def bulk_transition(application_ids, status, queryset=None):
+    """
+    application_ids 의 상태를 UPDATE 한 번으로 status 로 바꾸고 application_counters 를 같은 트랜잭션에서 옮깁니다.
+    id 별 결과 UPDATED, UNCHANGED(이미 같은 상태), NOT_FOUND, NOT_MATCHED 를 요청 순서대로 반환합니다.
+    queryset(필터로 id 를 고른 경우) 을 주면 잠근 뒤에 다시 확인해, 그 사이 조건에서 벗어난 지원서는 NOT_MATCHED 로 두고 바꾸지 않습니다.
+    """
+    if not status in STATUSES:
+        raise InvalidTransition("INVALID_STATUS")
+
+    application_ids = list(dict.fromkeys(application_ids))
+
+    if len(application_ids) > MAX_BULK_SIZE:
+        raise InvalidTransition("TOO_MANY_APPLICATIONS")
+
+    with transaction.atomic():
+        # 단건 상태 변경, 지원서 삭제와 겹치지 않도록 대상 행을 잠근 뒤의 상태를 기준으로 합니다.
+        current = dict(Application.objects.select_for_update()
+                                          .filter(id__in=application_ids)
+                                          .values_list('id', 'status'))
+        matched = set(current) if queryset is None else set(queryset.filter(id__in=list(current)).values_list('id', flat=True))
+        changed = [application_id for application_id in application_ids if application_id in matched and current[application_id] != status]
+
+        if changed:
+            Application.objects.filter(id__in=changed).exclude(status=status).update(status=status)
+
+            deltas = Counter()
+
+            for recruit_id, application_id in (RecruitApplication.objects.filter(application_id__in=changed)
+                                                                          .values_list('recruit_id', 'application_id')):
+                deltas[(recruit_id, current[application_id])] -= 1
+                deltas[(recruit_id, status)]                  += 1
+
+            add_counts(deltas)
+
+    changed = set(changed)
+
+    return [
+        {
+            'id'    : application_id,
+            'result': (
+                'NOT_FOUND'   if not application_id in current else
+                'NOT_MATCHED' if not application_id in matched else
+                'UPDATED'     if application_id in changed else
+                'UNCHANGED'
+            )
+        }
+        for application_id in application_ids
+    ]
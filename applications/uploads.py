@@ -0,0 +1,512 @@
+import base64, hashlib, logging, os, shutil, uuid
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib  import Path
+
+from botocore.exceptions import ClientError
+from django.conf         import settings
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+from django.db           import transaction
+from django.db.models    import Q
+from django.utils        import timezone
+
+from core.s3             import get_s3_client, get_transfer_config
+from applications.models import Attachment, UploadJob, PortfolioTombstone
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS    = 5
+RETRY_DELAY     = timedelta(seconds=30)
+RUNNING_TIMEOUT = timedelta(minutes=10)
+
+# 요청이 아직 commit 하지 않은 spool 파일을 지우지 않도록 이 시간이 지난 파일만 정리합니다.
+SPOOL_ORPHAN_AGE = timedelta(hours=1)
+SWEEP_BATCH_SIZE = 500
+
+class S3MultipartUpload:
+    def __init__(self, client, bucket, key, content_type):
+        self.client    = client
+        self.bucket    = bucket
+        self.key       = key
+        self.parts     = []
+        self.upload_id = client.create_multipart_upload(Bucket=bucket, Key=key, ContentType=content_type)['UploadId']
+
+    def upload_part(self, data):
+        # part 마다 Content-MD5 를 보내 S3 가 받은 내용을 검증하게 합니다.
+        response = self.client.upload_part(
+            Bucket     = self.bucket,
+            Key        = self.key,
+            UploadId   = self.upload_id,
+            PartNumber = len(self.parts) + 1,
+            Body       = data,
+            ContentMD5 = base64.b64encode(hashlib.md5(data).digest()).decode()
+        )
+
+        self.parts.append({'PartNumber': len(self.parts) + 1, 'ETag': response['ETag']})
+
+    def complete(self):
+        self.client.complete_multipart_upload(
+            Bucket          = self.bucket,
+            Key             = self.key,
+            UploadId        = self.upload_id,
+            MultipartUpload = {'Parts': self.parts}
+        )
+
+    def abort(self):
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+
+class S3Storage:
+    def __init__(self, bucket, client, transfer_config=None):
+        self.bucket          = bucket
+        self.client          = client
+        self.transfer_config = transfer_config
+
+    def upload(self, path, key, content_type):
+        self.client.upload_file(
+            str(path),
+            self.bucket,
+            key,
+            ExtraArgs = {"ContentType": content_type},
+            Config    = self.transfer_config
+        )
+
+    def delete_many(self, keys):
+        """
+        delete_objects 한 번으로 지웁니다. (최대 1,000개) 삭제하지 못한 key 목록을 반환합니다.
+        """
+        response = self.client.delete_objects(
+            Bucket = self.bucket,
+            Delete = {'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+        )
+
+        return [error['Key'] for error in response.get('Errors', [])]
+
+    def list_keys(self, older_than):
+        paginator = self.client.get_paginator('list_objects_v2')
+
+        for page in paginator.paginate(Bucket=self.bucket):
+            for item in page.get('Contents', []):
+                if item['LastModified'] < older_than:
+                    yield item['Key']
+
+    def head(self, key):
+        """
+        (크기, Content-Type) 을 반환합니다. 객체가 없으면 None 을 반환합니다.
+        """
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as error:
+            if error.response['Error']['Code'] in ['404', 'NoSuchKey', 'NotFound']:
+                return None
+            raise
+
+        return response['ContentLength'], response['ContentType']
+
+    def presign_post(self, key, content_type, max_size, expires_in):
+        return self.client.generate_presigned_post(
+            self.bucket,
+            key,
+            Fields     = {'Content-Type': content_type},
+            Conditions = [{'Content-Type': content_type}, ['content-length-range', 1, max_size]],
+            ExpiresIn  = expires_in
+        )
+
+    def presign_put(self, key, content_type, size, expires_in):
+        url = self.client.generate_presigned_url(
+            'put_object',
+            Params    = {'Bucket': self.bucket, 'Key': key, 'ContentType': content_type, 'ContentLength': size},
+            ExpiresIn = expires_in
+        )
+
+        return {'url': url, 'fields': {}}
+
+    def open_multipart(self, key, content_type):
+        return S3MultipartUpload(self.client, self.bucket, key, content_type)
+
+class LocalMultipartUpload:
+    """
+    part 를 <key>.part 에 이어 쓰고 complete 에서 key 로 옮깁니다.
+    """
+    def __init__(self, root, key):
+        self.key  = key
+        self.path = root / key
+        self.part = self.path.with_name(self.path.name + '.part')
+
+        self.part.parent.mkdir(parents=True, exist_ok=True)
+        self.part.write_bytes(b'')
+
+    def upload_part(self, data):
+        with open(self.part, 'ab') as file:
+            file.write(data)
+
+    def complete(self):
+        os.replace(self.part, self.path)
+
+    def abort(self):
+        self.part.unlink(missing_ok=True)
+
+class LocalStorage:
+    """
+    S3 대신 로컬 디렉터리에 저장합니다. 테스트와 로컬 개발용입니다.
+    클라이언트가 직접 올릴 주소가 없으므로 presigned 업로드(발급, 확인)는 PRESIGN_NOT_SUPPORTED 로 거절합니다.
+    """
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def upload(self, path, key, content_type):
+        target = self.root / key
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        shutil.copyfile(path, target)
+
+    def delete_many(self, keys):
+        for key in keys:
+            (self.root / key).unlink(missing_ok=True)
+
+        return []
+
+    def list_keys(self, older_than):
+        for path in self.root.rglob('*'):
+            if path.is_file() and datetime.fromtimestamp(path.stat().st_mtime, dt_timezone.utc) < older_than:
+                yield path.relative_to(self.root).as_posix()
+
+    def head(self, key):
+        # presigned key 에는 확장자가 없어 Content-Type 을 알 수 없습니다.
+        raise InvalidUpload("PRESIGN_NOT_SUPPORTED")
+
+    def presign_post(self, key, content_type, max_size, expires_in):
+        raise InvalidUpload("PRESIGN_NOT_SUPPORTED")
+
+    def presign_put(self, key, content_type, size, expires_in):
+        raise InvalidUpload("PRESIGN_NOT_SUPPORTED")
+
+    def open_multipart(self, key, content_type):
+        return LocalMultipartUpload(self.root, key)
+
+def get_storage():
+    if settings.PORTFOLIO_STORAGE == 'local':
+        return LocalStorage(settings.PORTFOLIO_LOCAL_ROOT)
+
+    return S3Storage(settings.PORTFOLIO_BUCKET, get_s3_client(), get_transfer_config())
+
+def portfolio_url(key):
+    return settings.PORTFOLIO_URL_PREFIX + key
+
+def portfolio_key(file_url):
+    """
+    우리 저장소에 올린 파일이면 key 를, 외부 링크면 None 을 반환합니다.
+    """
+    if settings.PORTFOLIO_URL_PREFIX in file_url:
+        return file_url.replace(settings.PORTFOLIO_URL_PREFIX, "")
+
+    return None
+
+class InvalidUpload(ValueError):
+    pass
+
+def validate_upload(content_type, size):
+    if not content_type in settings.PORTFOLIO_CONTENT_TYPES:
+        raise InvalidUpload("INVALID_CONTENT_TYPE")
+
+    if not 0 < size <= settings.PORTFOLIO_MAX_SIZE:
+        raise InvalidUpload("INVALID_SIZE")
+
+def presign_upload(user_id, content_type, size, method='POST'):
+    """
+    클라이언트가 S3 에 직접 올릴 presigned POST/PUT 정보를 만듭니다. key 는 사용자 id 로 시작하므로
+    확인 단계에서 다른 사용자가 올린 객체를 연결할 수 없습니다.
+    """
+    validate_upload(content_type, size)
+
+    storage    = get_storage()
+    key        = f"{user_id}/{uuid.uuid4().hex}"
+    expires_in = settings.PORTFOLIO_PRESIGN_EXPIRES
+
+    if method == 'PUT':
+        presigned = storage.presign_put(key, content_type, size, expires_in)
+    else:
+        presigned = storage.presign_post(key, content_type, size, expires_in)
+
+    return {
+        'method'     : method,
+        'key'        : key,
+        'url'        : presigned['url'],
+        'fields'     : presigned['fields'],
+        'expires_in' : expires_in
+    }
+
+def verify_upload(user_id, key):
+    """
+    presigned URL 로 올린 객체를 HEAD 로 확인하고 포트폴리오 주소를 반환합니다.
+    """
+    if not key.startswith(f"{user_id}/"):
+        raise InvalidUpload("INVALID_KEY")
+
+    head = get_storage().head(key)
+
+    if head is None:
+        raise InvalidUpload("UPLOAD_NOT_FOUND")
+
+    size, content_type = head
+
+    validate_upload(content_type, size)
+
+    return portfolio_url(key)
+
+class StreamedPortfolio:
+    """
+    PortfolioUploadHandler 가 request.FILES 에 넣는 파일. 내용은 이미 저장소에 올라가 있으며
+    view 가 DB 저장과 함께 complete() 해야 객체가 만들어집니다.
+    """
+    def __init__(self, name, content_type, upload):
+        self.name         = name
+        self.content_type = content_type
+        self.upload       = upload
+        self.key          = upload.key
+        self.size         = 0
+        self.buffer       = bytearray()
+        self.hash         = hashlib.sha256()
+        self.part_size    = settings.S3_MULTIPART_CHUNKSIZE
+        self.completed    = False
+        self.aborted      = False
+
+    @property
+    def sha256(self):
+        return self.hash.hexdigest()
+
+    def write(self, data):
+        self.size += len(data)
+
+        if self.size > settings.PORTFOLIO_MAX_SIZE:
+            raise InvalidUpload("INVALID_SIZE")
+
+        self.hash.update(data)
+        self.buffer += data
+
+        # 버퍼에는 part 하나 크기까지만 모읍니다.
+        while len(self.buffer) >= self.part_size:
+            self.upload.upload_part(bytes(self.buffer[:self.part_size]))
+            del self.buffer[:self.part_size]
+
+    def flush(self):
+        if not self.size:
+            raise InvalidUpload("INVALID_SIZE")
+
+        if self.buffer:
+            self.upload.upload_part(bytes(self.buffer))
+            self.buffer.clear()
+
+    def complete(self):
+        self.upload.complete()
+        self.completed = True
+
+    def abort(self):
+        if self.completed or self.aborted:
+            return
+
+        self.aborted = True
+
+        try:
+            self.upload.abort()
+        except Exception as error:
+            logger.warning("aborting upload %s failed: %s", self.key, error)
+
+class PortfolioUploadHandler(FileUploadHandler):
+    """
+    portfolio 파일을 spool 하지 않고 받는 대로 저장소의 multipart upload 로 넘기며 sha256 을 함께 계산합니다.
+    다른 필드의 파일은 다음 handler 로 넘깁니다. 요청이 끝날 때 complete 되지 않은 업로드는 abort() 로 취소합니다.
+    """
+    FIELD_NAME = 'portfolio'
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.portfolio  = None
+        self.portfolios = []
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+
+        if field_name != self.FIELD_NAME:
+            self.portfolio = None
+            return
+
+        content_type = content_type or 'application/octet-stream'
+
+        validate_upload(content_type, content_length or 1)
+
+        self.portfolio = StreamedPortfolio(file_name, content_type, get_storage().open_multipart(str(uuid.uuid1()), content_type))
+        self.portfolios.append(self.portfolio)
+
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.portfolio is None:
+            return raw_data
+
+        self.portfolio.write(raw_data)
+
+    def file_complete(self, file_size):
+        if self.portfolio is None:
+            return None
+
+        portfolio, self.portfolio = self.portfolio, None
+        portfolio.flush()
+
+        return portfolio
+
+    def abort(self):
+        for portfolio in self.portfolios:
+            portfolio.abort()
+
+def spool(uploaded_file, key):
+    spool_dir = Path(settings.UPLOAD_SPOOL_DIR)
+    spool_dir.mkdir(parents=True, exist_ok=True)
+
+    path = spool_dir / key
+
+    with open(path, 'wb') as file:
+        for chunk in uploaded_file.chunks():
+            file.write(chunk)
+
+    return path
+
+def enqueue_upload(attachment, uploaded_file, previous_url=''):
+    """
+    업로드 파일을 spool 디렉터리에 저장하고 upload_jobs 에 등록합니다. 실제 업로드는 run_upload_worker 가 합니다.
+    previous_url 은 업로드가 끝난 뒤 지울 이전 포트폴리오 주소입니다.
+    """
+    key = str(uuid.uuid1())
+
+    return UploadJob.objects.create(
+        attachment   = attachment,
+        spool_path   = str(spool(uploaded_file, key)),
+        key          = key,
+        content_type = uploaded_file.content_type or 'application/octet-stream',
+        previous_url = previous_url
+    )
+
+def claim_jobs(limit):
+    """
+    PENDING 작업을 RUNNING 으로 바꾼 것만 가져가므로 워커를 여러 개 실행해도 같은 작업을 중복 처리하지 않습니다.
+    RUNNING_TIMEOUT 동안 끝나지 않은 작업(워커 종료 등)은 다시 PENDING 으로 돌리고, 실패한 작업은 RETRY_DELAY 뒤에 다시 시도합니다.
+    """
+    now = timezone.now()
+
+    UploadJob.objects.filter(status='RUNNING', updated_at__lt=now - RUNNING_TIMEOUT).update(status='PENDING', updated_at=now)
+
+    pending = (UploadJob.objects.filter(status='PENDING')
+                                .filter(Q(attempts=0) | Q(updated_at__lte=now - RETRY_DELAY))
+                                .order_by('id')
+                                .values_list('id', flat=True)[:limit])
+
+    claimed = [
+        job_id for job_id in pending
+        if UploadJob.objects.filter(id=job_id, status='PENDING').update(status='RUNNING', updated_at=now)
+    ]
+
+    return list(UploadJob.objects.filter(id__in=claimed).order_by('id'))
+
+def remove_spool(job):
+    try:
+        os.remove(job.spool_path)
+    except FileNotFoundError:
+        pass
+
+def remove_deleted_job_spool(sender, instance, **kwargs):
+    # 지원서 삭제로 대기 중인 작업이 함께 지워지면 워커가 spool 파일을 가져가지 않으므로 commit 이후에 지웁니다.
+    transaction.on_commit(lambda: remove_spool(instance))
+
+def sweep_spool(older_than):
+    """
+    대기(PENDING), 진행(RUNNING) 중인 작업이 가리키지 않는 spool 파일을 지우고 지운 수를 반환합니다.
+    작업 등록이 rollback 되어 남은 파일, 작업을 끝낸 뒤 지우지 못한 파일이 대상이며 older_than 이전에 만든 파일만 지웁니다.
+    """
+    spool_dir = Path(settings.UPLOAD_SPOOL_DIR)
+
+    if not spool_dir.is_dir():
+        return 0
+
+    cutoff = older_than.timestamp()
+    paths  = [path for path in spool_dir.iterdir() if path.is_file() and path.stat().st_mtime < cutoff]
+    count  = 0
+
+    for start in range(0, len(paths), SWEEP_BATCH_SIZE):
+        batch  = {path.name: path for path in paths[start:start + SWEEP_BATCH_SIZE]}
+        in_use = set(
+            UploadJob.objects.filter(key__in=list(batch), status__in=['PENDING', 'RUNNING']).values_list('key', flat=True)
+        )
+
+        for key, path in batch.items():
+            if not key in in_use:
+                path.unlink(missing_ok=True)
+                count += 1
+
+    return count
+
+def bury_portfolios(file_urls):
+    """
+    우리 저장소의 포트폴리오 주소를 portfolio_tombstones 에 기록합니다. 요청 중에는 S3 를 호출하지 않고
+    sweep_portfolios 가 모아서 삭제합니다.
+    """
+    keys = [portfolio_key(file_url) for file_url in file_urls if file_url]
+
+    PortfolioTombstone.objects.bulk_create(
+        [PortfolioTombstone(key=key) for key in keys if key],
+        ignore_conflicts = True
+    )
+
+def fail_job(job, error):
+    attempts = job.attempts + 1
+    status   = 'FAILED' if attempts >= MAX_ATTEMPTS else 'PENDING'
+
+    UploadJob.objects.filter(id=job.id).update(
+        status     = status,
+        attempts   = attempts,
+        last_error = str(error)[:1000],
+        updated_at = timezone.now()
+    )
+
+    if status == 'FAILED':
+        Attachment.objects.filter(id=job.attachment_id, status='PENDING').update(status='FAILED')
+        remove_spool(job)
+
+def process_job(job, storage):
+    try:
+        storage.upload(job.spool_path, job.key, job.content_type)
+    except Exception as error:
+        logger.warning("upload job %s failed: %s", job.id, error)
+        fail_job(job, error)
+        return False
+
+    with transaction.atomic():
+        # 같은 첨부파일에 더 최근 작업이 있거나 지원서가 삭제됐으면 이 업로드는 반영하지 않고 지울 대상으로 기록합니다.
+        superseded = UploadJob.objects.filter(attachment_id=job.attachment_id, id__gt=job.id).exists()
+        attached   = not superseded and Attachment.objects.filter(id=job.attachment_id).update(
+            file_url = portfolio_url(job.key),
+            status   = 'READY'
+        )
+
+        if attached:
+            bury_portfolios([job.previous_url])
+        else:
+            bury_portfolios([portfolio_url(job.key)])
+
+        UploadJob.objects.filter(id=job.id).update(status='DONE', updated_at=timezone.now())
+
+    remove_spool(job)
+
+    return True
+
+def run_jobs(limit, storage=None):
+    """
+    limit 개까지 작업을 처리하고 처리한 작업 수를 반환합니다.
+    """
+    jobs = claim_jobs(limit)
+
+    if jobs:
+        storage = storage or get_storage()
+
+    for job in jobs:
+        process_job(job, storage)
+
+    return len(jobs)
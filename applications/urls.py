@@ -1,8 +1,11 @@
 from django.urls import path
 
-from applications.views import ApplicationAdminView, ApplicationAdminDetailView
+from applications.views import ApplicationAdminView, ApplicationAdminDetailView, ApplicationExportView, ApplicationSummaryView, ApplicationStatusBulkView
 
 urlpatterns = [
     path('', ApplicationAdminView.as_view()),
+    path('/export', ApplicationExportView.as_view()),
+    path('/summary', ApplicationSummaryView.as_view()),
+    path('/status', ApplicationStatusBulkView.as_view()),
     path('/<int:application_id>', ApplicationAdminDetailView.as_view())
 ]
\ No newline at end of file
@@ -1,19 +1,37 @@
-import boto3
 import json
-import uuid
+import tempfile
 
-from django.db.models     import Q
-from django.http          import JsonResponse
+from django.conf          import settings
+from django.db            import transaction
+from django.db.models     import prefetch_related_objects
+from django.http          import FileResponse, StreamingHttpResponse
 from drf_yasg             import openapi
 from drf_yasg.utils       import swagger_auto_schema
 from rest_framework       import parsers
 from rest_framework.views import APIView
 
-from core.decorators          import login_required, admin_only
-from global_variable          import ADMIN_TOKEN, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
-from recruits.models          import Recruit
-from applications.models      import Application, Attachment
-from applications.serializers import ApplicationSerializer, ApplicationAdminSerializer, ApplicationAdminPatchSerializer
+from core.decorators            import login_required, admin_only
+from core.responses             import FastJsonResponse, StreamingJsonResponse, iter_chunks, DEFAULT_CHUNK_SIZE
+from core.fields                import parse_fields, InvalidFields
+from core.pagination            import KeysetPaginator, InvalidCursor, InvalidLimit
+from global_variable            import ADMIN_TOKEN
+from recruits.models            import Recruit
+from applications.models        import Application, Attachment
+from applications.export        import iter_rows, iter_csv, write_xlsx
+from applications.content_index import content_ordering
+from applications.counters      import add_count, recruit_ids_of, recruit_summary
+from applications.transitions   import bulk_transition, InvalidTransition, MAX_BULK_SIZE
+from applications.uploads       import (
+    enqueue_upload, bury_portfolios, presign_upload, verify_upload, portfolio_url,
+    PortfolioUploadHandler, StreamedPortfolio, InvalidUpload
+)
+from applications.serializers   import (
+    ApplicationSerializer, ApplicationAdminSerializer, ApplicationAdminPatchSerializer, ApplicationAdminQuerySerializer,
+    ApplicationExportQuerySerializer, ApplicationUploadBodySerializer, ApplicationStatusBulkSerializer,
+    APPLICATION_ADMIN_FIELDS, APPLICATION_ADMIN_DETAIL_FIELDS,
+    application_admin_filter, application_admin_search, application_admin_queryset, application_admin_prefetch, serialize_application_admin,
+    find_application, has_admin_filter
+)
 
 class ApplicationView(APIView):
     parameter_token = openapi.Parameter (
@@ -31,6 +49,19 @@ class ApplicationView(APIView):
     )
     parser_classes = (parsers.FormParser, parsers.MultiPartParser, parsers.FileUploadParser)
 
+    def dispatch(self, request, *args, **kwargs):
+        # request.POST, request.FILES 를 읽기 전에 handler 를 등록해야 합니다.
+        if settings.PORTFOLIO_STREAM_UPLOADS and request.method in ['POST', 'PATCH']:
+            request.upload_handlers.insert(0, PortfolioUploadHandler(request))
+
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            # 응답 전에 complete 하지 못한 업로드(검증 실패, 예외, 연결 끊김)는 저장소에 남기지 않습니다.
+            for handler in request.upload_handlers:
+                if isinstance(handler, PortfolioUploadHandler):
+                    handler.abort()
+
     @swagger_auto_schema (
         manual_parameters = [parameter_token],
         responses = {
@@ -46,22 +77,18 @@ class ApplicationView(APIView):
     def get(self, request, recruit_id):
         try:
             user        = request.user
-            recruit     = Recruit.objects.get(id=recruit_id)
-            application = recruit.applications.get(user=user)
+            application = find_application(user, recruit_id)
             attachment  = Attachment.objects.get(application=application)
             
             content = application.content
             content["portfolio"]["portfolioUrl"] = attachment.file_url
             
-            result = {"content": content}
+            result = {"content": content, "attachment_status": attachment.status}
 
-            return JsonResponse({"result": result}, status=200)
+            return FastJsonResponse({"result": result}, status=200)
 
-        except Recruit.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
-        
         except Application.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
+            return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
 
     @swagger_auto_schema (
         manual_parameters = [parameter_token, parameter_upload],
@@ -75,7 +102,9 @@ class ApplicationView(APIView):
         operation_id          = "해당 공고에 대한 지원서 생성",
         operation_description = "header에 토큰이 필요합니다.\n"+
                                 "formData에 json형식의 데이터가 필요합니다.\n"+
-                                "formData에 파일을 첨부할 수 있습니다."
+                                "formData에 파일을 첨부할 수 있습니다.\n"+
+                                "presigned URL 로 직접 올린 경우 formData의 portfolio_key 에 key 를 담아 보내주세요.\n"+
+                                "첨부파일은 요청 중에 저장소로 올립니다. 백그라운드 업로드를 사용하는 경우 완료 전까지 attachment_status 가 PENDING 입니다."
     )
     
     @login_required
@@ -83,74 +112,92 @@ class ApplicationView(APIView):
         try:
             user    = request.user
             recruit = Recruit.objects.get(id=recruit_id)
+
+            # request.POST 를 읽으면 스트리밍 업로드가 시작되므로 먼저 확인합니다.
+            if recruit.applications.filter(user=user).exists():
+                return FastJsonResponse({"message": "ALREADY_EXISTS"}, status=400)
+
             content = request.POST['content']
             content = json.loads(content)
             status  = "ST1"
 
-            if recruit.applications.filter(user=user).exists():
-                return JsonResponse({"message": "ALREADY_EXISTS"}, status=400)
-
             if not request.FILES:
-                file_url = content["portfolio"]["portfolioUrl"]
+                if request.POST.get("portfolio_key"):
+                    file_url = verify_upload(user.id, request.POST["portfolio_key"])
+                else:
+                    file_url = content["portfolio"]["portfolioUrl"]
                 
+                with transaction.atomic():
+                    application = Application.objects.create(
+                                            content = content,
+                                            status  = status,
+                                            user    = user,
+                    )
+                    application.recruits.add(recruit)
+                    add_count([recruit.id], status, 1)
+
+                    Attachment.objects.create(
+                        file_url    = file_url,
+                        application = application
+                    )
+
+                return FastJsonResponse({"message": "SUCCESS"}, status=201)
+
+            portfolio = request.FILES['portfolio']
+
+            if isinstance(portfolio, StreamedPortfolio):
+                with transaction.atomic():
+                    application = Application.objects.create(
+                        content = content,
+                        status  = status,
+                        user    = user,
+                    )
+                    application.recruits.add(recruit)
+                    add_count([recruit.id], status, 1)
+
+                    attachment = Attachment.objects.create(
+                        file_url    = portfolio_url(portfolio.key),
+                        application = application,
+                        sha256      = portfolio.sha256
+                    )
+                    # DB 저장이 실패하면 complete 하지 않으므로 dispatch 에서 업로드가 취소됩니다.
+                    portfolio.complete()
+
+                return FastJsonResponse({"message": "SUCCESS", "attachment_status": attachment.status}, status=201)
+
+            with transaction.atomic():
                 application = Application.objects.create(
-                                        content = content,
-                                        status  = status,
-                                        user    = user,
+                    content = content,
+                    status  = status,
+                    user    = user,
                 )
                 application.recruits.add(recruit)
+                add_count([recruit.id], status, 1)
 
-                Attachment.objects.create(
-                    file_url    = file_url,
-                    application = application
+                attachment = Attachment.objects.create(
+                    file_url    = "",
+                    application = application,
+                    status      = "PENDING"
                 )
+                enqueue_upload(attachment, portfolio)
 
-                return JsonResponse({"message": "SUCCESS"}, status=201)
-
-            portfolio = request.FILES['portfolio']
-            
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id     = AWS_ACCESS_KEY_ID,
-                aws_secret_access_key = AWS_SECRET_ACCESS_KEY
-            )
-
-            file_name = str(uuid.uuid1())
-            
-            s3_client.upload_fileobj(
-                portfolio,
-                "stockers-bucket",
-                file_name,
-                ExtraArgs = {"ContentType": portfolio.content_type}
-            )
-
-            file_url = "stockfolio.coo6llienldy.ap-northeast-2.rds.amazonaws.com/" + file_name
-
-            application = Application.objects.create(
-                content = content,
-                status  = status,
-                user    = user,
-            )
-            application.recruits.add(recruit)
-            
-            Attachment.objects.create(
-                file_url    = file_url,
-                application = application
-            )
-
-            return JsonResponse({"message": "SUCCESS"}, status=201)
+            return FastJsonResponse({"message": "SUCCESS", "attachment_status": attachment.status}, status=201)
 
         except Recruit.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
+            return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
         
         except KeyError:
-            return JsonResponse({"message": "KEY_ERROR"}, status=400)
+            return FastJsonResponse({"message": "KEY_ERROR"}, status=400)
+
+        except InvalidUpload as error:
+            return FastJsonResponse({"message": str(error)}, status=400)
 
     @swagger_auto_schema (
         manual_parameters = [parameter_token, parameter_upload],
         request_body = ApplicationSerializer,
         responses = {
             "200": "SUCCESS",
+            "202": "ACCEPTED",
             "404": "NOT_FOUND",
             "401": "UNAUTHORIZED",
             "400": "BAD_REQUEST"
@@ -158,64 +205,75 @@ class ApplicationView(APIView):
         operation_id          = "해당 공고에 대한 지원서 수정",
         operation_description = "header에 토큰이 필요합니다.\n"+
                                 "formData에 json형식의 수정 데이터가 필요합니다.\n"+
-                                "formData에 파일을 첨부할 수 있습니다."
+                                "formData에 파일을 첨부할 수 있습니다.\n"+
+                                "presigned URL 로 직접 올린 경우 formData의 portfolio_key 에 key 를 담아 보내주세요.\n"+
+                                "파일은 요청 중에 저장소로 올립니다. 백그라운드 업로드를 사용하는 경우 202 를 반환하고, 업로드가 끝날 때까지 이전 포트폴리오 주소가 유지됩니다."
     )
     
     @login_required
     def patch(self, request, recruit_id):
         try:
-            user    = request.user
-            recruit = Recruit.objects.get(id=recruit_id)
-            
+            user        = request.user
+            application = find_application(user, recruit_id)
+
             content = request.POST["content"]
             content = json.loads(content)
+
+            uploaded_url = None
+
+            if not request.FILES and request.POST.get("portfolio_key"):
+                uploaded_url = verify_upload(user.id, request.POST["portfolio_key"])
             
-            application         = recruit.applications.get(user=user)
             application.content = content
             application.save()
 
             attachment = Attachment.objects.get(application=application)
 
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id     = AWS_ACCESS_KEY_ID,
-                aws_secret_access_key = AWS_SECRET_ACCESS_KEY
-            )
+            if request.FILES and isinstance(request.FILES["portfolio"], StreamedPortfolio):
+                portfolio = request.FILES["portfolio"]
+
+                with transaction.atomic():
+                    bury_portfolios([attachment.file_url])
+
+                    attachment.file_url = portfolio_url(portfolio.key)
+                    attachment.status   = "READY"
+                    attachment.sha256   = portfolio.sha256
+                    attachment.save()
+
+                    portfolio.complete()
+
+                return FastJsonResponse({"message": "SUCCESS", "attachment_status": attachment.status}, status=200)
 
             if request.FILES:
-                portfolio = request.FILES["portfolio"]
-                file_name = str(uuid.uuid1())
-            
-                s3_client.upload_fileobj(
-                    portfolio,
-                    "stockers-bucket",
-                    file_name,
-                    ExtraArgs = {"ContentType": portfolio.content_type}
-                )
+                with transaction.atomic():
+                    attachment.status = "PENDING"
+                    attachment.save()
 
-                file_url = "stockfolio.coo6llienldy.ap-northeast-2.rds.amazonaws.com/" + file_name
-                
-            else:
-                file_url = content["portfolio"]["portfolioUrl"]
+                    # 이전 파일은 새 파일 업로드가 끝난 뒤 워커가 지웁니다.
+                    enqueue_upload(attachment, request.FILES["portfolio"], previous_url=attachment.file_url)
+
+                return FastJsonResponse({"message": "SUCCESS", "attachment_status": attachment.status}, status=202)
 
-            if "stockfolio.coo6llienldy.ap-northeast-2.rds.amazonaws.com/" in attachment.file_url:
+            file_url = uploaded_url or content["portfolio"]["portfolioUrl"]
+
+            with transaction.atomic():
                 if not file_url == attachment.file_url:
-                    key = attachment.file_url.replace("stockfolio.coo6llienldy.ap-northeast-2.rds.amazonaws.com/", "")
-                    s3_client.delete_object(Bucket="stockers-bucket", Key=key)
-                
-            attachment.file_url = file_url
-            attachment.save()
+                    bury_portfolios([attachment.file_url])
+
+                attachment.file_url = file_url
+                attachment.status   = "READY"
+                attachment.save()
                 
-            return JsonResponse({"message": "SUCCESS"}, status=200)
+            return FastJsonResponse({"message": "SUCCESS"}, status=200)
 
-        except Recruit.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
-        
         except Application.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
+            return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
         
         except KeyError:
-            return JsonResponse({"message": "KEY_ERROR"}, status=400)    
+            return FastJsonResponse({"message": "KEY_ERROR"}, status=400)    
+
+        except InvalidUpload as error:
+            return FastJsonResponse({"message": str(error)}, status=400)
 
     @swagger_auto_schema (
         manual_parameters = [parameter_token],
@@ -231,19 +289,71 @@ class ApplicationView(APIView):
     @login_required
     def delete(self, request, recruit_id):
         try:
-            user    = request.user
-            recruit = Recruit.objects.get(id=recruit_id)
+            user        = request.user
+            application = find_application(user, recruit_id)
 
-            application = recruit.applications.get(user=user)
-            application.delete()
+            with transaction.atomic():
+                # 관리자의 상태 변경과 겹치지 않도록 잠근 뒤의 상태로 차감합니다.
+                status = Application.objects.select_for_update().values_list('status', flat=True).get(id=application.id)
 
-            return JsonResponse({"message": "SUCCESS"}, status=200)
+                add_count(recruit_ids_of([application.id]), status, -1)
+                bury_portfolios(Attachment.objects.filter(application=application).values_list('file_url', flat=True))
+                application.delete()
+
+            return FastJsonResponse({"message": "SUCCESS"}, status=200)
 
-        except Recruit.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
-        
         except Application.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
+            return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
+
+class ApplicationUploadView(APIView):
+    parameter_token = openapi.Parameter (
+                                        "Authorization",
+                                        openapi.IN_HEADER,
+                                        description = "access_token",
+                                        type        = openapi.TYPE_STRING,
+                                        default     = ADMIN_TOKEN
+    )
+
+    @swagger_auto_schema (
+        manual_parameters = [parameter_token],
+        request_body      = ApplicationUploadBodySerializer,
+        responses = {
+            "201": "SUCCESS",
+            "400": "INVALID_CONTENT_TYPE, INVALID_SIZE, PRESIGN_NOT_SUPPORTED",
+            "401": "UNAUTHORIZED",
+            "404": "NOT_FOUND"
+        },
+        operation_id          = "포트폴리오 업로드 URL 발급",
+        operation_description = "header에 토큰이 필요합니다.\n"+
+                                "body에 파일의 content_type, size(byte), method(POST 또는 PUT)를 담아 보내주세요.\n"+
+                                "POST 는 url 에 fields 와 file 을 multipart 로, PUT 은 url 에 Content-Type 헤더와 파일 본문을 보내면 됩니다.\n"+
+                                "업로드 후 지원서 생성/수정 시 formData의 portfolio_key 에 응답의 key 를 담아 보내주세요."
+    )
+
+    @login_required
+    def post(self, request, recruit_id):
+        try:
+            data   = json.loads(request.body)
+            method = data.get("method", "POST")
+
+            if not (Recruit.objects.filter(id=recruit_id).exists()):
+                return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
+
+            if not method in ["POST", "PUT"]:
+                return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
+
+            result = presign_upload(request.user.id, data["content_type"], int(data["size"]), method)
+
+            return FastJsonResponse({"message": "SUCCESS", "result": result}, status=201)
+
+        except KeyError:
+            return FastJsonResponse({"message": "KEY_ERROR"}, status=400)
+
+        except InvalidUpload as error:
+            return FastJsonResponse({"message": str(error)}, status=400)
+
+        except (TypeError, ValueError):
+            return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
 
 class ApplicationAdminView(APIView):
     parameter_token = openapi.Parameter (
@@ -258,52 +368,63 @@ class ApplicationAdminView(APIView):
 
     @swagger_auto_schema (
         manual_parameters = [parameter_token],
+        query_serializer  = ApplicationAdminQuerySerializer,
         responses = {
             "200": application_admin_response,
             "400": "BAD_REQUEST",
             "401": "UNAUTHORIZED",
         },
         operation_id          = "(관리자 전용) 지원목록 조회",
-        operation_description = "header에 토큰이 필요합니다."
+        operation_description = "header에 토큰이 필요합니다.\n" +
+                                "cursor : 이전 응답의 next_cursor (다음 페이지 조회)\n" +
+                                "limit  : 페이지 크기 (기본 20, 최대 100)\n" +
+                                "stream : true 이면 페이지 없이 전체 목록을 스트리밍으로 내려줍니다.\n" +
+                                "name, school, career_years_min, career_years_max : 지원서 내용으로 필터링합니다.\n" +
+                                "ordering : -created_at(기본), name, -career_years 등"
     )
 
     @admin_only
     def get(self, request):
-        career_type    = request.GET.get('career_type', None)
-        position_title = request.GET.get('position', None)
-        status         = request.GET.get('status', None)
+        try:
+            fields = parse_fields(request.GET.get('fields', ''), APPLICATION_ADMIN_FIELDS)
+        except InvalidFields:
+            return FastJsonResponse({'message': 'INVALID_FIELDS'}, status=400)
 
-        q = Q()
+        try:
+            ordering, ordering_fields = content_ordering(request.GET.get('ordering') or '-created_at')
+        except ValueError:
+            return FastJsonResponse({'message': 'INVALID_ORDERING'}, status=400)
 
-        if career_type:
-            q.add(Q(recruits__career_type = career_type), q.AND)
-        
-        if position_title:
-            q.add(Q(recruits__position_title = position_title), q.AND)
-
-        if status:
-            q.add(Q(status = status), q.AND)
-
-        applications = Application.objects.filter(q).order_by('-created_at')
-
-        results = [
-            {
-                'content'       : application.content,
-                'status'        : application.status,
-                'created_at'    : application.created_at,
-                'updated_at'    : application.updated_at,
-                'recruit_id'    : [recruits.id for recruits in application.recruits.all()],
-                'job_openings'  : [recruits.job_openings for recruits in application.recruits.all()],
-                'author'        : [recruits.author for recruits in application.recruits.all()],
-                'work_type'     : [recruits.work_type for recruits in application.recruits.all()],
-                'career_type'   : [recruits.career_type for recruits in application.recruits.all()],
-                'position_title': [recruit.position_title for recruit in application.recruits.all()],
-                'position'      : [recruits.position for recruits in application.recruits.all()],
-                'deadline'      : [recruits.deadline for recruits in application.recruits.all()]
-            }
-        for application in applications]
-
-        return JsonResponse({'results': results}, status=200)
+        # content 의 generated column(SQLite 는 applications_content_columns) 으로 거르고 정렬합니다.
+        try:
+            queryset = application_admin_search(request.GET, annotate=ordering_fields)
+        except ValueError:
+            return FastJsonResponse({'message': 'INVALID_FILTER'}, status=400)
+
+        queryset = application_admin_queryset(queryset, fields, ordering)
+        prefetch = application_admin_prefetch(fields)
+
+        if request.GET.get('stream') in ['true', '1']:
+            chunks = iter_chunks(queryset, ordering=ordering, prefetch=prefetch)
+
+            return StreamingJsonResponse('results', chunks, lambda application: serialize_application_admin(application, fields), status=200)
+
+        try:
+            paginator = KeysetPaginator(ordering, limit=KeysetPaginator.parse_limit(request.GET.get('limit', None)))
+
+            applications, next_cursor = paginator.paginate(queryset, request.GET.get('cursor', None))
+
+        except InvalidLimit:
+            return FastJsonResponse({'message': 'INVALID_LIMIT'}, status=400)
+        except InvalidCursor:
+            return FastJsonResponse({'message': 'INVALID_CURSOR'}, status=400)
+
+        # 페이지의 모든 지원서에 대해 recruits 를 한 번에 조회합니다.
+        prefetch_related_objects(applications, *prefetch)
+
+        results = [serialize_application_admin(application, fields) for application in applications]
+
+        return FastJsonResponse({'results': results, 'next_cursor': next_cursor}, status=200)
 
 class ApplicationAdminDetailView(APIView):
     parameter_token = openapi.Parameter (
@@ -314,14 +435,22 @@ class ApplicationAdminDetailView(APIView):
                                         default     = ADMIN_TOKEN
     )
     
+    parameter_fields = openapi.Parameter (
+                                        "fields",
+                                        openapi.IN_QUERY,
+                                        description = "응답에 포함할 필드 (ex. id,status,user_email)",
+                                        type        = openapi.TYPE_STRING
+    )
+    
     application_admin_response = openapi.Response("result", ApplicationAdminSerializer)
 
     @swagger_auto_schema (
-        manual_parameters = [parameter_token],
+        manual_parameters = [parameter_token, parameter_fields],
         responses = {
             "200": application_admin_response,
             "400": "BAD_REQUEST",
-            "401": "UNAUTHORIZED"
+            "401": "UNAUTHORIZED",
+            "404": "NOT_FOUND"
         },
         operation_id          = "(관리자 전용) 지원 세부사항 조회",
         operation_description = "header에 토큰이 필요합니다."
@@ -329,29 +458,23 @@ class ApplicationAdminDetailView(APIView):
     
     @admin_only
     def get(self, request, application_id):
-        application = Application.objects.get(id=application_id)
-
-        results = [
-            {   
-                'id'            : application_id,
-                'content'       : application.content,
-                'status'        : application.status,
-                'created_at'    : application.created_at,
-                'updated_at'    : application.updated_at,
-                'user_id'       : application.user.id,
-                'user_email'    : application.user.email,
-                'recruit_id'    : [recruits.id for recruits in application.recruits.all()],
-                'job_openings'  : [recruits.job_openings for recruits in application.recruits.all()],
-                'author'        : [recruits.author for recruits in application.recruits.all()],
-                'work_type'     : [recruits.work_type for recruits in application.recruits.all()],
-                'career_type'   : [recruits.career_type for recruits in application.recruits.all()],
-                'position_title': [recruits.position_type for recruits in application.recruits.all()],
-                'position'      : [recruits.position for recruits in application.recruits.all()],
-                'deadline'      : [recruits.deadline for recruits in application.recruits.all()]
-            }
-        ]
-
-        return JsonResponse({'results': results}, status=200)
+        try:
+            fields = parse_fields(request.GET.get('fields', ''), APPLICATION_ADMIN_DETAIL_FIELDS)
+        except InvalidFields:
+            return FastJsonResponse({'message': 'INVALID_FIELDS'}, status=400)
+
+        try:
+            application = (application_admin_queryset(Application.objects.all(), fields)
+                                        .prefetch_related(*application_admin_prefetch(fields))
+                                        .get(id=application_id)
+                        )
+
+        except Application.DoesNotExist:
+            return FastJsonResponse({'message': 'NOT_FOUND'}, status=404)
+
+        results = [serialize_application_admin(application, fields)]
+
+        return FastJsonResponse({'results': results}, status=200)
     
     @swagger_auto_schema (
         manual_parameters = [parameter_token],
@@ -359,7 +482,8 @@ class ApplicationAdminDetailView(APIView):
         responses = {
             "200": "SUCCESS",
             "400": "BAD_REQUEST",
-            "401": "UNAUTHORIZED"
+            "401": "UNAUTHORIZED",
+            "404": "NOT_FOUND"
         },
         operation_id          = "(관리자 전용) 지원 상태 수정",
         operation_description = "header에 토큰이, body에 json형식 데이터가 필요합니다.\n" +
@@ -371,10 +495,150 @@ class ApplicationAdminDetailView(APIView):
         data = json.loads(request.body)
 
         try:
-            application = Application.objects.filter(id=application_id)
-            application.update(status = data['status'])
+            results = bulk_transition([application_id], data['status'])
+
+            if results[0]['result'] == 'NOT_FOUND':
+                return FastJsonResponse({'message': 'NOT_FOUND'}, status=404)
             
-            return JsonResponse({'message': 'SUCCESS'}, status=200)
+            return FastJsonResponse({'message': 'SUCCESS'}, status=200)
 
-        except Application.DoesNotExist:
-            return JsonResponse({'message': 'NOT_FOUND'}, status=404)
\ No newline at end of file
+        except KeyError:
+            return FastJsonResponse({'message': 'KEY_ERROR'}, status=400)
+
+        except InvalidTransition as error:
+            return FastJsonResponse({'message': str(error)}, status=400)
+
+class ApplicationStatusBulkView(APIView):
+    parameter_token = openapi.Parameter (
+                                        "Authorization",
+                                        openapi.IN_HEADER,
+                                        description = "access_token",
+                                        type        = openapi.TYPE_STRING,
+                                        default     = ADMIN_TOKEN
+    )
+
+    @swagger_auto_schema (
+        manual_parameters = [parameter_token],
+        request_body      = ApplicationStatusBulkSerializer,
+        responses = {
+            "200": "SUCCESS",
+            "400": "BAD_REQUEST",
+            "401": "UNAUTHORIZED"
+        },
+        operation_id          = "(관리자 전용) 지원 상태 일괄 수정",
+        operation_description = "header에 토큰이, body에 json형식 데이터가 필요합니다.\n" +
+                                "ids(지원서 id 목록) 또는 filter(지원목록 조회와 같은 필터) 중 하나와 status 를 보내주세요.\n" +
+                                "filter 에는 조건이 하나 이상 있어야 합니다. (EMPTY_FILTER)\n" +
+                                "한 번에 최대 1,000개까지 수정하며, id 별 결과(UPDATED, UNCHANGED, NOT_FOUND)를 내려줍니다.\n" +
+                                "filter 로 고른 지원서가 수정 직전에 조건에서 벗어나면 바꾸지 않고 NOT_MATCHED 를 내려줍니다."
+    )
+
+    @admin_only
+    def patch(self, request):
+        try:
+            data   = json.loads(request.body)
+            status = data['status']
+
+            queryset = None
+
+            if 'ids' in data:
+                application_ids = [int(application_id) for application_id in data['ids']]
+            else:
+                if not has_admin_filter(data['filter']):
+                    return FastJsonResponse({'message': 'EMPTY_FILTER'}, status=400)
+
+                # 필터에 맞는 지원서가 MAX_BULK_SIZE 를 넘으면 bulk_transition 이 거절합니다.
+                # 잠그기 전에 읽은 id 이므로 bulk_transition 이 잠근 뒤 queryset 으로 다시 확인합니다.
+                queryset        = application_admin_search(data['filter'])
+                application_ids = list(queryset.order_by('id')
+                                               .values_list('id', flat=True)
+                                               .distinct()[:MAX_BULK_SIZE + 1])
+
+            results = bulk_transition(application_ids, status, queryset)
+
+            return FastJsonResponse({'message': 'SUCCESS', 'results': results}, status=200)
+
+        except KeyError:
+            return FastJsonResponse({'message': 'KEY_ERROR'}, status=400)
+
+        except InvalidTransition as error:
+            return FastJsonResponse({'message': str(error)}, status=400)
+
+        except (TypeError, ValueError, AttributeError):
+            return FastJsonResponse({'message': 'BAD_REQUEST'}, status=400)
+
+class ApplicationSummaryView(APIView):
+    parameter_token = openapi.Parameter (
+                                        "Authorization",
+                                        openapi.IN_HEADER,
+                                        description = "access_token",
+                                        type        = openapi.TYPE_STRING,
+                                        default     = ADMIN_TOKEN
+    )
+
+    @swagger_auto_schema (
+        manual_parameters = [parameter_token],
+        responses = {
+            "200": "SUCCESS",
+            "401": "UNAUTHORIZED"
+        },
+        operation_id          = "(관리자 전용) 공고별 지원 현황",
+        operation_description = "header에 토큰이 필요합니다.\n" +
+                                "공고별 상태(ST1~ST5)별 지원서 수와 합계를 내려줍니다."
+    )
+
+    @admin_only
+    def get(self, request):
+        return FastJsonResponse({'results': recruit_summary()}, status=200)
+
+class ApplicationExportView(APIView):
+    parameter_token = openapi.Parameter (
+                                        "Authorization",
+                                        openapi.IN_HEADER,
+                                        description = "access_token",
+                                        type        = openapi.TYPE_STRING,
+                                        default     = ADMIN_TOKEN
+    )
+
+    @swagger_auto_schema (
+        manual_parameters = [parameter_token],
+        query_serializer  = ApplicationExportQuerySerializer,
+        responses = {
+            "200": "CSV/XLSX FILE",
+            "400": "BAD_REQUEST",
+            "401": "UNAUTHORIZED"
+        },
+        operation_id          = "(관리자 전용) 지원목록 내보내기",
+        operation_description = "header에 토큰이 필요합니다.\n" +
+                                "지원목록 조회와 같은 career_type, position, status 필터를 사용합니다.\n" +
+                                "file_format : csv(기본값) 또는 xlsx\n" +
+                                "content 의 항목은 personal.name 처럼 펼쳐서 각각의 열로 내보냅니다."
+    )
+
+    @admin_only
+    def get(self, request):
+        file_format = request.GET.get('file_format', 'csv')
+
+        if not file_format in ['csv', 'xlsx']:
+            return FastJsonResponse({'message': 'BAD_REQUEST'}, status=400)
+
+        q = application_admin_filter(
+            career_type    = request.GET.get('career_type', None),
+            position_title = request.GET.get('position', None),
+            status         = request.GET.get('status', None)
+        )
+        rows = iter_rows(q, DEFAULT_CHUNK_SIZE)
+
+        if file_format == 'csv':
+            response = StreamingHttpResponse(iter_csv(rows), content_type='text/csv; charset=utf-8')
+            response['Content-Disposition'] = 'attachment; filename="applications.csv"'
+
+            return response
+
+        # xlsx 는 zip 파일이라 임시 파일에 다 쓴 뒤 chunk 단위로 내려줍니다.
+        file = tempfile.TemporaryFile()
+
+        write_xlsx(rows, file)
+        file.seek(0)
+
+        return FileResponse(file, as_attachment=True, filename='applications.xlsx')
@@ -0,0 +1,93 @@
+import base64, json, zlib
+
+from django.conf import settings
+from django.db   import models
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 압축한 값은 {"<keep 의 key>": .., "__compressed__": {"codec": "zlib", "data": "<base64>"}} 형태로 저장합니다.
+MARKER = '__compressed__'
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+def available_codec(codec):
+    # zstandard 가 설치되지 않았으면 zlib 을 사용합니다.
+    if codec == 'zstd' and zstandard is None:
+        return 'zlib'
+
+    return codec
+
+def compress(data, codec):
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+    return zlib.compress(data, ZLIB_LEVEL)
+
+def decompress(data, codec):
+    if codec == 'zstd':
+        if zstandard is None:
+            raise ValueError("zstd 로 압축된 값을 읽으려면 zstandard 가 필요합니다.")
+
+        return zstandard.ZstdDecompressor().decompress(data)
+
+    return zlib.decompress(data)
+
+def is_packed(value):
+    return isinstance(value, dict) and MARKER in value
+
+def pack(value, keep=(), codec=None, threshold=None):
+    """
+    인코딩한 크기가 threshold(byte) 이상인 dict 를 압축합니다. keep 의 key 는 압축하지 않고 그대로 두므로
+    generated column, content__<key> 조회에서 계속 읽을 수 있습니다.
+    """
+    if not isinstance(value, dict) or is_packed(value):
+        return value
+
+    codec     = available_codec(codec or settings.CONTENT_COMPRESSION)
+    threshold = settings.CONTENT_COMPRESSION_THRESHOLD if threshold is None else threshold
+    encoded   = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode()
+
+    # 사용자가 보낸 값에 MARKER 가 있으면 읽을 때 압축한 값으로 오인하지 않도록 크기와 관계없이 압축합니다.
+    if len(encoded) < threshold and not MARKER in value:
+        return value
+
+    packed = {key: value[key] for key in keep if key in value}
+    packed[MARKER] = {'codec': codec, 'data': base64.b64encode(compress(encoded, codec)).decode()}
+
+    return packed
+
+def unpack(value):
+    if not is_packed(value):
+        return value
+
+    envelope = value[MARKER]
+
+    return json.loads(decompress(base64.b64decode(envelope['data']), envelope['codec']))
+
+class CompressedJSONField(models.JSONField):
+    """
+    CONTENT_COMPRESSION_THRESHOLD 이상인 값을 CONTENT_COMPRESSION(zlib, zstd) 으로 압축해 저장하는 JSONField.
+    읽을 때 압축을 풀기 때문에 사용하는 쪽에서는 JSONField 와 같습니다. 압축하지 않은 기존 행도 그대로 읽습니다.
+    content__<key> 조회는 keep 의 key 에서만 동작합니다.
+    """
+    def __init__(self, *args, keep=(), **kwargs):
+        self.keep = list(keep)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+
+        if self.keep:
+            kwargs['keep'] = self.keep
+
+        return name, path, args, kwargs
+
+    def get_prep_value(self, value):
+        return super().get_prep_value(pack(value, self.keep))
+
+    def from_db_value(self, value, expression, connection):
+        return unpack(super().from_db_value(value, expression, connection))
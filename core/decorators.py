@@ -1,7 +1,6 @@
 import jwt
 
-from django.http  import JsonResponse
-
+from core.responses     import FastJsonResponse
 from users.models       import User
 from global_variable    import SECRET_KEY, ALGORITHM
 
@@ -16,15 +15,15 @@ def login_required(func):
             return func(self, request, *args, **kwargs)
 
         except jwt.InvalidTokenError:
-            return JsonResponse({'message': 'INVALID_TOKEN'}, status=401)
+            return FastJsonResponse({'message': 'INVALID_TOKEN'}, status=401)
         except jwt.exceptions.DecodeError:
-            return JsonResponse({'message': 'DECODE_ERROR'}, status=400)
+            return FastJsonResponse({'message': 'DECODE_ERROR'}, status=400)
         except jwt.ExpiredSignatureError:
-            return JsonResponse({'message': 'EXPIRED_TOKEN'}, status=401)
+            return FastJsonResponse({'message': 'EXPIRED_TOKEN'}, status=401)
         except User.DoesNotExist:
-            return JsonResponse({'message': 'USER_DOES_NOT_EXISTS'}, status=401)
+            return FastJsonResponse({'message': 'USER_DOES_NOT_EXISTS'}, status=401)
         except KeyError:
-            return JsonResponse({'message': 'KEY_ERROR'}, status=400)
+            return FastJsonResponse({'message': 'KEY_ERROR'}, status=400)
 
     return wrapper
 
@@ -38,19 +37,19 @@ def admin_only(func):
             request.user = user
             
             if not role == 'admin':
-                return JsonResponse({'message': 'UNAUTHORIZED'}, status=401)
+                return FastJsonResponse({'message': 'UNAUTHORIZED'}, status=401)
 
             return func(self, request, *args, **kwargs)
 
         except jwt.InvalidTokenError:
-            return JsonResponse({'message': 'INVALID_TOKEN'}, status=401)
+            return FastJsonResponse({'message': 'INVALID_TOKEN'}, status=401)
         except jwt.exceptions.DecodeError:
-            return JsonResponse({'message': 'DECODE_ERROR'}, status=400)
+            return FastJsonResponse({'message': 'DECODE_ERROR'}, status=400)
         except jwt.ExpiredSignatureError:
-            return JsonResponse({'message': 'EXPIRED_TOKEN'}, status=401)
+            return FastJsonResponse({'message': 'EXPIRED_TOKEN'}, status=401)
         except User.DoesNotExist:
-            return JsonResponse({'message': 'USER_DOES_NOT_EXISTS'}, status=401)
+            return FastJsonResponse({'message': 'USER_DOES_NOT_EXISTS'}, status=401)
         except KeyError:
-            return JsonResponse({'message': 'KEY_ERROR'}, status=400)
+            return FastJsonResponse({'message': 'KEY_ERROR'}, status=400)
 
     return wrapper
\ No newline at end of file
@@ -0,0 +1,54 @@
+import json, math
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+django_encoder = DjangoJSONEncoder()
+
+# orjson 과 표준 json 모두 공백 없이 인코딩하므로 응답을 이어 붙일 때도 같은 구분자를 사용합니다.
+ITEM_SEPARATOR = b','
+KEY_SEPARATOR  = b':'
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+def finite(data):
+    # orjson 처럼 NaN, Infinity 를 null 로 바꿉니다.
+    if isinstance(data, float) and not math.isfinite(data):
+        return None
+    if isinstance(data, dict):
+        return {key: finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [finite(value) for value in data]
+
+    return data
+
+def json_dumps(data):
+    try:
+        encoded = json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'), ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        encoded = json.dumps(finite(data), cls=DjangoJSONEncoder, separators=(',', ':'), ensure_ascii=False)
+
+    return encoded.encode()
+
+def dumps(data):
+    """
+    DjangoJSONEncoder 와 같은 값 형식(Decimal -> 문자열, datetime -> 밀리초 ISO 8601)으로 인코딩한 bytes 를 반환합니다.
+    date/datetime 은 orjson 기본 형식(마이크로초) 대신 DjangoJSONEncoder.default 로 넘깁니다.
+
+    JsonResponse 와 본문 형식이 다르며, orjson 설치 여부와 관계없이 같은 형식으로 씁니다.
+    - 공백 없이, 한글을 \\uXXXX 대신 UTF-8 그대로 씁니다. (JsonResponse(json_dumps_params={'separators': (',', ':'), 'ensure_ascii': False}) 와 동일)
+    - NaN, Infinity 는 null 로 씁니다. (JsonResponse 는 JSON 이 아닌 NaN 을 그대로 씁니다)
+    orjson 이 없거나, 64bit 를 넘는 정수처럼 orjson 이 인코딩하지 못하는 값은 표준 json 으로 같은 형식을 만듭니다.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=django_encoder.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+
+    return json_dumps(data)
@@ -0,0 +1,17 @@
+class InvalidFields(ValueError):
+    pass
+
+def parse_fields(value, allowed):
+    """
+    ?fields=id,position_title 형태의 값을 allowed 순서대로 정렬한 목록으로 바꿉니다.
+    값이 없으면 allowed 전체를 반환합니다.
+    """
+    if not value:
+        return list(allowed)
+
+    requested = {field.strip() for field in value.split(',') if field.strip()}
+
+    if not requested or requested - set(allowed):
+        raise InvalidFields(value)
+
+    return [field for field in allowed if field in requested]
@@ -0,0 +1,104 @@
+import base64, json
+
+from datetime import date, datetime, time
+
+from django.core.exceptions       import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models             import Q
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT     = 100
+
+class InvalidCursor(ValueError):
+    pass
+
+class InvalidLimit(ValueError):
+    pass
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder 는 datetime 을 밀리초까지만 남기므로, 같은 밀리초 안의 행을 건너뛰지 않도록 마이크로초까지 기록합니다.
+    """
+    def default(self, value):
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+
+        return super().default(value)
+
+class KeysetPaginator:
+    """
+    ordering 의 마지막 행 값을 cursor 로 인코딩해 다음 페이지를 WHERE 조건으로 조회합니다.
+    OFFSET 을 쓰지 않으므로 페이지 깊이와 관계없이 비용이 일정합니다.
+    ordering 의 마지막 필드는 유일해야 합니다. (ex. '-id')
+    """
+    def __init__(self, ordering, limit=DEFAULT_LIMIT):
+        self.ordering = []
+
+        for field in ordering:
+            if field.lstrip('-') not in [ordered.lstrip('-') for ordered in self.ordering]:
+                self.ordering.append(field)
+
+        self.limit = limit
+
+    @staticmethod
+    def parse_limit(value):
+        try:
+            limit = int(value) if value else DEFAULT_LIMIT
+        except (TypeError, ValueError):
+            raise InvalidLimit(value)
+
+        if limit < 1:
+            raise InvalidLimit(value)
+
+        return min(limit, MAX_LIMIT)
+
+    def encode_cursor(self, item):
+        values  = [getattr(item, field.lstrip('-')) for field in self.ordering]
+        payload = json.dumps(values, cls=CursorEncoder, separators=(',', ':'))
+
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            values  = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        except (ValueError, TypeError):
+            raise InvalidCursor(cursor)
+
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursor(cursor)
+
+        return values
+
+    def cursor_filter(self, values):
+        q = Q()
+
+        for index, field in enumerate(self.ordering):
+            name   = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+
+            condition = Q(**{f'{name}__{lookup}': values[index]})
+
+            for prev_field, prev_value in zip(self.ordering[:index], values[:index]):
+                condition &= Q(**{prev_field.lstrip('-'): prev_value})
+
+            q |= condition
+
+        return q
+
+    def paginate(self, queryset, cursor=None):
+        queryset = queryset.order_by(*self.ordering)
+
+        if cursor:
+            try:
+                queryset = queryset.filter(self.cursor_filter(self.decode_cursor(cursor)))
+            except (ValidationError, TypeError, ValueError):
+                raise InvalidCursor(cursor)
+
+        items = list(queryset[:self.limit + 1])
+
+        if len(items) > self.limit:
+            items = items[:self.limit]
+            return items, self.encode_cursor(items[-1])
+
+        return items, None
@@ -0,0 +1,87 @@
+from django.db.models import prefetch_related_objects
+from django.http      import HttpResponse, StreamingHttpResponse
+
+from core.encoders   import dumps, ITEM_SEPARATOR, KEY_SEPARATOR
+from core.pagination import KeysetPaginator
+
+DEFAULT_CHUNK_SIZE = 500
+
+def iter_chunks(queryset, ordering, chunk_size=DEFAULT_CHUNK_SIZE, prefetch=()):
+    """
+    queryset 을 ordering 기준 keyset 조회로 chunk_size 개씩 읽습니다.
+    MySQL 드라이버는 iterator() 결과도 클라이언트에 모두 버퍼링하므로, 쿼리 단위로 끊어 읽어야
+    메모리 사용량이 chunk 크기로 제한됩니다. prefetch 는 chunk 마다 한 번씩 조회합니다.
+    """
+    paginator = KeysetPaginator(ordering, limit=chunk_size)
+    cursor    = None
+
+    while True:
+        chunk, cursor = paginator.paginate(queryset, cursor)
+
+        if prefetch:
+            prefetch_related_objects(chunk, *prefetch)
+
+        yield chunk
+
+        if not cursor:
+            break
+
+def iter_json_fragments(key, chunks):
+    """
+    chunks: 이미 인코딩된 JSON bytes 목록들
+    """
+    yield b'{' + dumps(key) + KEY_SEPARATOR + b'['
+
+    separator = b''
+
+    for chunk in chunks:
+        if chunk:
+            yield separator + ITEM_SEPARATOR.join(chunk)
+            separator = ITEM_SEPARATOR
+
+    yield b']}'
+
+def iter_json_array(key, chunks, serialize):
+    return iter_json_fragments(key, ([dumps(serialize(item)) for item in chunk] for chunk in chunks))
+
+class FastJsonResponse(HttpResponse):
+    """
+    JsonResponse 대신 사용하는 응답 클래스입니다. core.encoders.dumps 로 인코딩합니다.
+    """
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError('In order to allow non-dict objects to be serialized set the safe parameter to False.')
+
+        kwargs.setdefault('content_type', 'application/json')
+
+        super().__init__(dumps(data), **kwargs)
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """
+    {key: [...]} 형태의 응답을 chunk 단위로 인코딩해 내려줍니다.
+    FastJsonResponse 와 같은 encoder, 구분자를 사용하므로 결과 본문은 동일합니다.
+    serialize 가 없으면 chunks 의 항목을 이미 인코딩된 JSON bytes 로 보고 그대로 이어 붙입니다.
+    """
+    def __init__(self, key, chunks, serialize=None, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+
+        if serialize is None:
+            content = iter_json_fragments(key, chunks)
+        else:
+            content = iter_json_array(key, chunks, serialize)
+
+        super().__init__(content, **kwargs)
+
+def encode_json_array(fragments):
+    return b'[' + ITEM_SEPARATOR.join(fragments) + b']'
+
+class EncodedJsonResponse(HttpResponse):
+    """
+    {key: value} 의 value 가 이미 인코딩된 JSON bytes 인 응답입니다. 구분자가 같아 FastJsonResponse 와 본문이 동일합니다.
+    """
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+
+        content = b'{' + ITEM_SEPARATOR.join(dumps(key) + KEY_SEPARATOR + value for key, value in data.items()) + b'}'
+
+        super().__init__(content, **kwargs)
@@ -0,0 +1,56 @@
+import os, threading
+
+import boto3
+
+from boto3.s3.transfer import TransferConfig
+from botocore.config   import Config
+from django.conf       import settings
+
+from global_variable import AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
+
+lock    = threading.Lock()
+clients = {}
+
+def create_s3_client():
+    return boto3.session.Session().client(
+        's3',
+        aws_access_key_id     = AWS_ACCESS_KEY_ID,
+        aws_secret_access_key = AWS_SECRET_ACCESS_KEY,
+        endpoint_url          = settings.S3_ENDPOINT_URL,
+        region_name           = settings.S3_REGION_NAME,
+        config                = Config(
+            signature_version    = 's3v4',
+            max_pool_connections = settings.S3_MAX_POOL_CONNECTIONS,
+            retries              = {'max_attempts': 3, 'mode': 'standard'}
+        )
+    )
+
+def get_s3_client():
+    """
+    프로세스마다 하나의 S3 client 를 만들어 재사용합니다. boto3 client 는 스레드 간에 공유해도 안전하며,
+    연결은 max_pool_connections 개까지 풀에 유지됩니다. fork 된 프로세스는 부모의 연결을 쓰지 않도록 새로 만듭니다.
+    """
+    pid    = os.getpid()
+    client = clients.get(pid)
+
+    if client is None:
+        with lock:
+            client = clients.get(pid)
+
+            if client is None:
+                clients.clear()
+                client = clients[pid] = create_s3_client()
+
+    return client
+
+def reset_s3_client():
+    with lock:
+        clients.clear()
+
+def get_transfer_config():
+    return TransferConfig(
+        multipart_threshold = settings.S3_MULTIPART_THRESHOLD,
+        multipart_chunksize = settings.S3_MULTIPART_CHUNKSIZE,
+        max_concurrency     = settings.S3_MAX_CONCURRENCY,
+        use_threads         = True
+    )
@@ -1,8 +1,8 @@
-from django.http import JsonResponse
+from core.responses import FastJsonResponse
 
 from rest_framework.views import APIView
 
 
 class HelloWorld(APIView):
     def get(self, request):
-        return JsonResponse({"hello": "world"}, status=200)
+        return FastJsonResponse({"hello": "world"}, status=200)
@@ -1,6 +1,22 @@
-from django.apps import AppConfig
+from django.apps               import AppConfig
+from django.db.models.signals import post_migrate, post_save
+
+
+def reinstall_sqlite_fulltext_index(sender, using, **kwargs):
+    # SQLite 는 ALTER 시 테이블을 재생성하면서 트리거를 지우므로 migrate 후 다시 설치합니다.
+    from django.db       import connections
+    from recruits.search import install_fulltext_index
+
+    if connections[using].vendor == 'sqlite':
+        install_fulltext_index(connections[using])
 
 
 class RecruitsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'recruits'
+
+    def ready(self):
+        from recruits.fragments import regenerate_recruit_fragment
+
+        post_migrate.connect(reinstall_sqlite_fulltext_index, sender=self)
+        post_save.connect(regenerate_recruit_fragment, sender='recruits.Recruit', dispatch_uid='recruit_fragment')
@@ -0,0 +1,62 @@
+from django.conf  import settings
+from django.db    import transaction
+from django.utils import timezone
+
+from recruits.models import Recruit, RecruitStack, RecruitApplication, ArchivedRecruit, ArchivedRecruitStack, ArchivedRecruitApplication
+from recruits.cache  import bump_version
+
+DEFAULT_BATCH_SIZE = 500
+
+ARCHIVED_FIELDS = [field.attname for field in ArchivedRecruit._meta.concrete_fields if field.name != 'archived_at']
+
+def local_today():
+    # USE_TZ=False 이면 timezone.localdate() 를 쓸 수 없지만 now() 가 이미 TIME_ZONE 기준의 시각입니다.
+    return timezone.localdate() if settings.USE_TZ else timezone.now().date()
+
+def archive_recruits(expired_before, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    deadline 이 expired_before 보다 이전인 공고를 기술스택, 지원서 연결과 함께 archived_recruits 로 옮깁니다.
+    batch_size 개씩 하나의 transaction 으로 옮기고 recruits 에서 삭제하며, 옮긴 공고 수를 반환합니다.
+    지원서는 archived_recruits_applications 로 계속 연결되고(application.archived_recruits), 공고별 지원서 수
+    (application_counters) 는 공고와 함께 삭제됩니다.
+    """
+    archived = 0
+
+    while True:
+        with transaction.atomic():
+            recruits = list(
+                Recruit.objects.select_for_update()
+                               .filter(deadline__lt=expired_before)
+                               .order_by('id')[:batch_size]
+            )
+
+            if not recruits:
+                break
+
+            recruit_ids = [recruit.id for recruit in recruits]
+
+            ArchivedRecruit.objects.bulk_create([
+                ArchivedRecruit(**{field: getattr(recruit, field) for field in ARCHIVED_FIELDS})
+                for recruit in recruits
+            ])
+            ArchivedRecruitStack.objects.bulk_create([
+                ArchivedRecruitStack(recruit_id=recruit_id, stack_id=stack_id)
+                for recruit_id, stack_id in RecruitStack.objects.filter(recruit_id__in=recruit_ids)
+                                                                .order_by('id')
+                                                                .values_list('recruit_id', 'stack_id')
+            ])
+            ArchivedRecruitApplication.objects.bulk_create([
+                ArchivedRecruitApplication(recruit_id=recruit_id, application_id=application_id)
+                for recruit_id, application_id in RecruitApplication.objects.filter(recruit_id__in=recruit_ids)
+                                                                            .order_by('id')
+                                                                            .values_list('recruit_id', 'application_id')
+            ])
+
+            Recruit.objects.filter(id__in=recruit_ids).delete()
+
+        archived += len(recruit_ids)
+
+    if archived:
+        bump_version()
+
+    return archived
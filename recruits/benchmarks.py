@@ -0,0 +1,61 @@
+import random, statistics, time
+
+from django.core.management.base import CommandError
+from django.db                   import connections, DEFAULT_DB_ALIAS
+
+from recruits.models import Recruit
+
+BENCH_AUTHOR = '__bench__'
+
+TITLE_WORDS = [
+    '백엔드', '프론트엔드', '데이터', '엔지니어', '개발자', '디자이너', '영상', '편집자',
+    '마케터', '기획자', 'backend', 'frontend', 'python', 'django', 'react', 'devops',
+]
+DESCRIPTION_WORDS = TITLE_WORDS + ['스톡폴리오', '채용', '우대사항', '자격요건', '근무지', '복지', 'aws', 'docker']
+
+def benchmark_connection(database):
+    """
+    벤치마크는 recruits 의 인덱스를 지우고 데이터를 대량으로 넣으므로 DATABASES 에 'BENCHMARK': True 로 표시한 DB 에서만 실행합니다.
+    default 는 표시가 있어도 거절합니다.
+    """
+    if database == DEFAULT_DB_ALIAS or not connections.databases.get(database, {}).get('BENCHMARK'):
+        raise CommandError(f"{database} 는 벤치마크용 DB 가 아닙니다. DATABASES 에 'BENCHMARK': True 로 표시한 별도 DB 를 --database 로 지정하세요.")
+
+    return connections[database]
+
+def generate_recruits(rows, database='default', batch_size=5000):
+    """
+    벤치마크용 채용공고를 rows 개 생성합니다. author 가 BENCH_AUTHOR 이므로 delete_recruits() 로 지울 수 있습니다.
+    """
+    for start in range(0, rows, batch_size):
+        Recruit.objects.using(database).bulk_create([
+            Recruit(
+                position       = random.choice(['developer', 'designer', 'editor']),
+                position_title = ' '.join(random.sample(TITLE_WORDS, 3)),
+                description    = ' '.join(random.choices(DESCRIPTION_WORDS, k=40)),
+                work_type      = '정규직',
+                career_type    = random.choice(['N', 'C', 'NC']),
+                job_openings   = '1',
+                author         = BENCH_AUTHOR,
+                deadline       = f'20{random.randint(22, 30)}-{random.randint(1, 12):02}-{random.randint(1, 28):02}',
+                minimum_salary = random.randint(0, 50) * 100,
+                maximum_salary = random.randint(50, 100) * 100,
+            )
+            for _ in range(min(batch_size, rows - start))
+        ])
+
+def delete_recruits(database='default'):
+    Recruit.objects.using(database).filter(author=BENCH_AUTHOR).delete()
+
+def measure(queryset, repeat, limit=20):
+    """
+    queryset 의 첫 페이지(limit 개)를 repeat 번 조회한 시간의 중앙값(ms)을 반환합니다.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        list(queryset.values_list('id', flat=True)[:limit])
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings)
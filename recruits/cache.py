@@ -0,0 +1,86 @@
+import hashlib, json, time
+
+from django.core.cache import caches
+from django.http       import HttpResponse
+
+# 공고가 바뀌면 bump_version 으로 버전을 올려 모든 캐시 응답을 무효화합니다. 버전은 default 캐시에 있으므로
+# 여러 프로세스(gunicorn worker, 서버)가 서로의 무효화를 보려면 default 가 Redis, Memcached 처럼 공유되는 backend 여야 합니다.
+# LocMemCache 는 프로세스마다 따로라서 다른 프로세스는 FRESH_TIMEOUT + STALE_TIMEOUT 동안 이전 응답을 내려줄 수 있습니다. (단일 프로세스 개발용)
+VERSION_KEY = 'recruits:version'
+
+# 저장 후 FRESH_TIMEOUT 동안은 그대로 응답하고, 그 뒤 STALE_TIMEOUT 동안은 한 worker 가 갱신하는 동안 이전 응답을 내려줍니다.
+# 항목은 캐시에 FRESH_TIMEOUT + STALE_TIMEOUT 동안 남습니다.
+FRESH_TIMEOUT = 30
+STALE_TIMEOUT = 60 * 10
+LOCK_TIMEOUT  = 10
+
+def _cache():
+    return caches['default']
+
+def _initial_version():
+    # 버전 키가 evict 된 뒤 다시 만들어져도 이전 버전 값과 겹치지 않도록 시간 기반으로 시작합니다.
+    return int(time.time() * 1000)
+
+def get_version():
+    cache   = _cache()
+    version = cache.get(VERSION_KEY)
+
+    if version is None:
+        cache.add(VERSION_KEY, _initial_version(), timeout=None)
+        version = cache.get(VERSION_KEY)
+
+    return version
+
+def bump_version():
+    try:
+        _cache().incr(VERSION_KEY)
+    except ValueError:
+        _cache().add(VERSION_KEY, _initial_version(), timeout=None)
+
+def make_key(prefix, params):
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    return f'{prefix}:{digest}'
+
+def cached_response(prefix, params, build):
+    """
+    build() 가 만든 200 응답 본문을 params 기준으로 캐싱합니다.
+    버전이 바뀌었거나 FRESH_TIMEOUT 이 지난 항목은 lock 을 잡은 요청 하나만 다시 만들고,
+    나머지 요청은 이전 응답을 그대로 내려줍니다. (stale-while-revalidate)
+    """
+    cache   = _cache()
+    key     = make_key(prefix, params)
+    version = get_version()
+    entry   = cache.get(key)
+
+    if entry is not None:
+        is_fresh = entry['version'] == version and entry['expires_at'] > time.time()
+
+        if is_fresh or not cache.add(f'{key}:lock', 1, timeout=LOCK_TIMEOUT):
+            return _to_response(entry)
+
+    try:
+        response = build()
+
+        if response.status_code == 200:
+            cache.set(key, {
+                'version'     : version,
+                'expires_at'  : time.time() + FRESH_TIMEOUT,
+                'content'     : response.content,
+                'content_type': response['Content-Type'],
+                'etag'        : response.get('ETag'),
+            }, timeout=FRESH_TIMEOUT + STALE_TIMEOUT)
+
+        return response
+
+    finally:
+        if entry is not None:
+            cache.delete(f'{key}:lock')
+
+def _to_response(entry):
+    response = HttpResponse(entry['content'], content_type=entry['content_type'], status=200)
+
+    if entry['etag']:
+        response['ETag'] = entry['etag']
+
+    return response
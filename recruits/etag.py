@@ -0,0 +1,62 @@
+import hashlib, json
+
+from django.http        import HttpResponseNotModified
+from django.utils.cache import parse_etags
+
+from recruits.models      import Recruit
+from recruits.serializers import RECRUIT_FIELDS
+
+def make_etag(rows, fields, page=None):
+    """
+    rows: (recruit_id, updated_at, stack_names) 목록, fields: 응답에 포함한 필드 목록
+    page: 목록 응답의 (정렬, limit, next_cursor). 행이 같아도 다음 페이지가 생기면 다른 값이 됩니다.
+    응답 필드, 공고 수정 시각, 기술스택 구성이 같으면 같은 값을 반환합니다. stacks 를 응답하지 않으면 스택 구성은 넣지 않습니다.
+    """
+    s = hashlib.sha1(f"{','.join(fields)}|".encode())
+
+    if page is not None:
+        s.update(f"{json.dumps(page)}|".encode())
+
+    for recruit_id, updated_at, stack_names in rows:
+        s.update(f"{recruit_id}:{updated_at.isoformat()}:{stack_names if 'stacks' in fields else []};".encode())
+
+    return f'"{s.hexdigest()}"'
+
+def recruits_etag(recruits, fields=RECRUIT_FIELDS, page=None):
+    # stacks 를 응답하지 않으면 stack_names 를 읽지 않으므로 지연 로딩되지 않습니다.
+    return make_etag(
+        [(recruit.id, recruit.updated_at, recruit.stack_names if 'stacks' in fields else []) for recruit in recruits],
+        fields,
+        page
+    )
+
+def recruit_etag(recruit, fields=RECRUIT_FIELDS):
+    return recruits_etag([recruit], fields)
+
+def lookup_recruit_etag(recruit_id, fields=RECRUIT_FIELDS, model=Recruit):
+    """
+    description 을 읽지 않고 recruits.updated_at, stack_names 만으로 ETag 를 계산합니다.
+    공고가 없으면 None 을 반환합니다.
+    """
+    row = model.objects.filter(id=recruit_id).values_list('updated_at', 'stack_names').first()
+
+    if row is None:
+        return None
+
+    return make_etag([(recruit_id, *row)], fields)
+
+def etag_matches(request, etag):
+    if_none_match = request.headers.get('If-None-Match')
+
+    if not (if_none_match and etag):
+        return False
+
+    etags = [tag[2:] if tag.startswith('W/') else tag for tag in parse_etags(if_none_match)]
+
+    return '*' in etags or etag in etags
+
+def not_modified(etag):
+    response = HttpResponseNotModified()
+    response['ETag'] = etag
+
+    return response
@@ -0,0 +1,56 @@
+from django.core.cache import caches
+from django.db         import transaction
+
+from core.encoders        import dumps
+from recruits.models      import Recruit
+from recruits.serializers import RECRUIT_FIELDS, serialize_recruit
+
+CACHE_ALIAS = 'recruit_fragments'
+KEY_PREFIX  = 'recruits:fragment'
+
+FULL_FIELDS = list(RECRUIT_FIELDS)
+
+def fragment_cache():
+    return caches[CACHE_ALIAS]
+
+def fragment_key(recruit_id, updated_at):
+    # 수정되면 updated_at 이 바뀌므로 이전 조각은 다시 읽히지 않고 만료됩니다.
+    return f"{KEY_PREFIX}:{recruit_id}:{updated_at.isoformat()}"
+
+def encode_recruit(recruit):
+    return dumps(serialize_recruit(recruit, FULL_FIELDS))
+
+def get_fragments(recruits):
+    """
+    공고 목록의 전체 필드 JSON 조각을 순서대로 반환합니다.
+    캐시에 없는 공고만 인코딩해 한 번에 저장합니다.
+    """
+    keys      = [fragment_key(recruit.id, recruit.updated_at) for recruit in recruits]
+    fragments = fragment_cache().get_many(keys)
+    missing   = {key: encode_recruit(recruit) for key, recruit in zip(keys, recruits) if key not in fragments}
+
+    if missing:
+        fragment_cache().set_many(missing)
+        fragments.update(missing)
+
+    return [fragments[key] for key in keys]
+
+def get_fragment(recruit):
+    return get_fragments([recruit])[0]
+
+def forget_fragments(recruits):
+    """
+    updated_at 을 바꾸지 않는 bulk_update 뒤에 호출해 조각을 지웁니다.
+    """
+    fragment_cache().delete_many([fragment_key(recruit.id, recruit.updated_at) for recruit in recruits])
+
+def refresh_fragment(recruit_id):
+    # view 에서 저장한 인스턴스는 Decimal, date 가 문자열/정수로 남아 있을 수 있어 DB 값으로 다시 인코딩합니다.
+    recruit = Recruit.objects.filter(id=recruit_id).first()
+
+    if recruit:
+        fragment_cache().set(fragment_key(recruit.id, recruit.updated_at), encode_recruit(recruit))
+
+def regenerate_recruit_fragment(sender, instance, **kwargs):
+    # rollback 된 변경이 캐시에 남지 않도록 commit 이후에 다시 만듭니다.
+    transaction.on_commit(lambda: refresh_fragment(instance.id))
@@ -0,0 +1,163 @@
+import codecs, csv, json, uuid
+
+from itertools import islice
+
+from django.db import connection, transaction
+
+from recruits.models      import Recruit, RecruitStack
+from recruits.serializers import RecruitCreateBodySerializer
+from recruits.stacks      import stack_resolver, unique_stack_names
+from recruits.cache       import bump_version
+
+CAREER_TYPE_CHOICES = {
+    "신입": "N",
+    "경력": "C",
+    "신입/경력": "NC",
+}
+
+DEFAULT_BATCH_SIZE = 500
+MAX_ERRORS         = 100
+
+def iter_jsonl(lines):
+    for line in lines:
+        line = line.strip()
+
+        if not line:
+            continue
+
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+def iter_csv(lines):
+    # stacks 컬럼은 "python,django" 처럼 콤마로 구분합니다. 빈 칸은 serializer 기본값을 사용합니다.
+    for row in csv.DictReader(lines):
+        row = {key: value for key, value in row.items() if key and value not in (None, "")}
+
+        if "stacks" in row:
+            row["stacks"] = [stack.strip() for stack in row["stacks"].split(",") if stack.strip()]
+
+        yield row
+
+def read_rows(stream, format):
+    lines = codecs.iterdecode(stream, 'utf-8')
+
+    if format == 'csv':
+        return iter_csv(lines)
+
+    return iter_jsonl(lines)
+
+class RecruitImporter:
+    """
+    행 단위 iterator 를 batch_size 만큼씩 검증해 recruits, recruits_stacks 에 bulk_create 합니다.
+    한 번에 한 batch 만 메모리에 올리므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    def __init__(self, author, batch_size=DEFAULT_BATCH_SIZE):
+        self.author     = author
+        self.batch_size = batch_size
+        self.created    = 0
+        self.failed     = 0
+        self.errors     = []
+
+    def run(self, rows):
+        numbered = enumerate(rows, start=1)
+        last     = 0
+
+        while True:
+            batch = []
+
+            try:
+                for number, row in islice(numbered, self.batch_size):
+                    batch.append((number, row))
+            except UnicodeDecodeError:
+                # 깨진 행 앞까지 읽은 행은 처리하고, 그 다음 행부터는 읽을 수 없으므로 오류 하나로 기록합니다.
+                self.import_batch(batch)
+                self.add_error((batch[-1][0] if batch else last) + 1, "INVALID_ENCODING")
+                break
+
+            if not batch:
+                break
+
+            self.import_batch(batch)
+
+            last = batch[-1][0]
+
+        return {"created": self.created, "failed": self.failed, "errors": self.errors}
+
+    def add_error(self, row, errors):
+        self.failed += 1
+
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"row": row, "errors": errors})
+
+    def import_batch(self, batch):
+        valid = []
+
+        for number, row in batch:
+            if not isinstance(row, dict):
+                self.add_error(number, "INVALID_ROW")
+                continue
+
+            serializer = RecruitCreateBodySerializer(data=row)
+
+            if serializer.is_valid():
+                valid.append(serializer.validated_data)
+            else:
+                self.add_error(number, serializer.errors)
+
+        if not valid:
+            return
+
+        with transaction.atomic():
+            stack_names = list(dict.fromkeys(name for data in valid for name in data["stacks"]))
+            stack_ids   = dict(zip(stack_names, stack_resolver.resolve(stack_names)))
+
+            recruits = self.bulk_create_recruits([
+                Recruit(
+                    position       = data["position"],
+                    position_title = data["position_title"],
+                    description    = data["description"],
+                    stack_names    = unique_stack_names(data["stacks"]),
+                    work_type      = data["work_type"],
+                    career_type    = CAREER_TYPE_CHOICES[data["career_type"]],
+                    job_openings   = data["job_openings"],
+                    author         = self.author,
+                    deadline       = data["deadline"],
+                    minimum_salary = data["minimum_salary"],
+                    maximum_salary = data["maximum_salary"]
+                )
+                for data in valid
+            ])
+
+            RecruitStack.objects.bulk_create([
+                RecruitStack(recruit_id=recruit.id, stack_id=stack_id)
+                for recruit, data in zip(recruits, valid)
+                for stack_id in dict.fromkeys(stack_ids[name] for name in data["stacks"])
+            ])
+
+        self.created += len(recruits)
+        bump_version()
+
+    def bulk_create_recruits(self, recruits):
+        if connection.features.can_return_rows_from_bulk_insert:
+            return Recruit.objects.bulk_create(recruits)
+
+        # MySQL 은 bulk insert 후 id 를 돌려주지 않으므로 batch 전용 author 로 넣고 id 를 조회한 뒤 되돌립니다.
+        # 한 INSERT 안의 auto increment 값은 행 순서대로 증가하므로 id 순서가 입력 순서와 같습니다.
+        marker = f"import:{uuid.uuid4().hex[:22]}"
+
+        for recruit in recruits:
+            recruit.author = marker
+
+        Recruit.objects.bulk_create(recruits)
+
+        ids = Recruit.objects.filter(author=marker).order_by('id').values_list('id', flat=True)
+
+        for recruit, recruit_id in zip(recruits, ids):
+            recruit.id     = recruit_id
+            recruit.author = self.author
+
+        Recruit.objects.filter(author=marker).update(author=self.author)
+
+        return recruits
@@ -0,0 +1,18 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from recruits.archive import archive_recruits, local_today, DEFAULT_BATCH_SIZE
+
+class Command(BaseCommand):
+    help = "마감일이 --days 일 이상 지난 공고를 archived_recruits 로 옮깁니다. cron 등으로 주기적으로 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30)
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        expired_before = local_today() - timedelta(days=options['days'])
+        archived       = archive_recruits(expired_before, options['batch_size'])
+
+        self.stdout.write(f"archived: {archived} (deadline < {expired_before})")
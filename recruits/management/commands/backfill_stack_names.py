@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db.models            import Prefetch
+
+from core.responses  import iter_chunks
+from recruits.cache  import bump_version
+from recruits.fragments import forget_fragments
+from recruits.models import Recruit, RecruitStack
+
+class Command(BaseCommand):
+    help = (
+        "recruits_stacks 를 기준으로 recruits.stack_names 를 채웁니다. 이미 같은 값인 공고는 건너뜁니다. "
+        "stack_names 는 요청 순서로 저장하므로 남아있는 이름의 순서는 유지하고, 없는 이름만 recruits_stacks 순서로 뒤에 붙입니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        prefetch = Prefetch(
+            'recruitstack_set',
+            queryset = RecruitStack.objects.select_related('stack').only('recruit_id', 'stack__name').order_by('id')
+        )
+        updated = 0
+
+        for chunk in iter_chunks(Recruit.objects.only('id', 'updated_at', 'stack_names'), ['id'], options['batch_size'], [prefetch]):
+            changed = []
+
+            for recruit in chunk:
+                linked      = list(dict.fromkeys(item.stack.name for item in recruit.recruitstack_set.all()))
+                stack_names = [name for name in recruit.stack_names if name in linked]
+                stack_names = stack_names + [name for name in linked if name not in stack_names]
+
+                if recruit.stack_names != stack_names:
+                    recruit.stack_names = stack_names
+                    changed.append(recruit)
+
+            Recruit.objects.bulk_update(changed, ['stack_names'])
+            forget_fragments(changed)
+            updated += len(changed)
+
+        if updated:
+            bump_version()
+
+        self.stdout.write(f"updated: {updated}")
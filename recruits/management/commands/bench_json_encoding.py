@@ -0,0 +1,72 @@
+import random, statistics, time
+
+from datetime import date, datetime
+from decimal  import Decimal
+
+from django.core.management.base import BaseCommand
+from django.http                 import JsonResponse
+
+from core.encoders       import orjson
+from core.responses      import FastJsonResponse
+from recruits.benchmarks import TITLE_WORDS, DESCRIPTION_WORDS
+
+def make_recruit(recruit_id):
+    return {
+        "id"             : recruit_id,
+        "position"       : random.choice(['developer', 'designer', 'editor']),
+        "position_title" : ' '.join(random.sample(TITLE_WORDS, 3)),
+        "work_type"      : "정규직",
+        "career_type"    : random.choice(["신입", "경력", "신입/경력"]),
+        "author"         : "admin@stockers.com",
+        "job_openings"   : "1",
+        "description"    : ' '.join(random.choices(DESCRIPTION_WORDS, k=40)),
+        "minimum_salary" : Decimal(f"{random.randint(0, 50) * 100}.00"),
+        "maximum_salary" : Decimal(f"{random.randint(50, 100) * 100}.00"),
+        "deadline"       : date(2030, random.randint(1, 12), random.randint(1, 28)),
+        "created_at"     : datetime(2021, 8, random.randint(1, 28), 12, 0, 0, random.randint(0, 999999)),
+        "updated_at"     : datetime(2021, 9, random.randint(1, 28), 12, 0, 0, random.randint(0, 999999)),
+        "stacks"         : random.sample(['python', 'django', 'mysql', 'aws', 'docker', 'react'], 3),
+    }
+
+def make_application_content():
+    return {
+        "personal"  : {"name": "홍길동", "email": "user@stockers.com", "phone": "010-0000-0000"},
+        "careers"   : [{"company": "스톡폴리오", "years": random.randint(1, 10), "current": False} for _ in range(3)],
+        "portfolio" : {"portfolioUrl": None, "links": ["https://github.com", "https://example.com"]},
+        "answers"   : [' '.join(random.choices(DESCRIPTION_WORDS, k=30)) for _ in range(4)],
+    }
+
+def measure(response_class, data, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response_class(data)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings)
+
+class Command(BaseCommand):
+    help = "JsonResponse(DjangoJSONEncoder) 와 FastJsonResponse 의 인코딩 시간 비교 벤치마크"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[20, 100, 1000])
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        random.seed(0)
+
+        self.stdout.write(f"encoder: {'orjson ' + orjson.__version__ if orjson else 'json (fallback)'}")
+        self.stdout.write(f"{'payload':<24}{'JsonResponse(ms)':>18}{'FastJsonResponse(ms)':>22}{'speedup':>10}")
+
+        for rows in options['rows']:
+            payloads = {
+                f"recruits x {rows}"     : {"results": [make_recruit(i) for i in range(rows)], "next_cursor": None},
+                f"applications x {rows}" : {"results": [{"content": make_application_content()} for _ in range(rows)]},
+            }
+
+            for name, data in payloads.items():
+                stdlib = measure(JsonResponse, data, options['repeat'])
+                fast   = measure(FastJsonResponse, data, options['repeat'])
+
+                self.stdout.write(f"{name:<24}{stdlib:>18.3f}{fast:>22.3f}{stdlib / fast:>9.1f}x")
@@ -0,0 +1,72 @@
+import random
+
+from django.core.management.base import BaseCommand
+
+from recruits.benchmarks import benchmark_connection, generate_recruits, delete_recruits, measure
+from recruits.models     import Recruit
+from recruits.views      import RecruitListView
+
+class Command(BaseCommand):
+    help = "채용공고 정렬/필터 인덱스 적용 전후의 EXPLAIN 과 조회 시간을 출력합니다. 생성한 데이터는 종료 시 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--database', required=True, help="DATABASES 에 'BENCHMARK': True 로 표시한 DB")
+        parser.add_argument('--keep', action='store_true', help="생성한 데이터를 삭제하지 않습니다.")
+
+    def queries(self, database):
+        recruits = Recruit.objects.using(database)
+        queries  = {
+            f"sort={sort}": recruits.order_by(ordering, '-created_at', '-id')
+            for sort, ordering in RecruitListView.sort_dict.items()
+        }
+        queries["admin career_type"]                = recruits.filter(career_type='C')
+        queries["admin career_type+position_title"] = recruits.filter(career_type='C', position_title='백엔드 개발자 python')
+        queries["admin position_title"]             = recruits.filter(position_title='백엔드 개발자 python')
+
+        return queries
+
+    def handle(self, *args, **options):
+        database   = options['database']
+        connection = benchmark_connection(database)
+        indexes    = Recruit._meta.indexes
+        random.seed(0)
+
+        self.stdout.write(f"backend: {connection.vendor}, rows: {options['rows']}")
+
+        try:
+            generate_recruits(options['rows'], database, options['batch_size'])
+
+            with connection.schema_editor() as schema_editor:
+                for index in indexes:
+                    schema_editor.remove_index(Recruit, index)
+
+            self.report("before", database, options['repeat'])
+
+            with connection.schema_editor() as schema_editor:
+                for index in indexes:
+                    schema_editor.add_index(Recruit, index)
+
+            self.report("after", database, options['repeat'])
+
+        finally:
+            existing = connection.introspection.get_constraints(connection.cursor(), Recruit._meta.db_table)
+
+            with connection.schema_editor() as schema_editor:
+                for index in indexes:
+                    if index.name not in existing:
+                        schema_editor.add_index(Recruit, index)
+
+            if not options['keep']:
+                delete_recruits(database)
+
+    def report(self, label, database, repeat):
+        self.stdout.write(f"\n===== {label} =====")
+
+        for name, queryset in self.queries(database).items():
+            page = queryset.values_list('id', flat=True)[:20]
+
+            self.stdout.write(f"\n[{name}] {measure(queryset, repeat):.2f} ms")
+            self.stdout.write(page.explain())
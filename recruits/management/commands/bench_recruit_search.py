@@ -0,0 +1,50 @@
+import random
+
+from django.core.management.base import BaseCommand
+
+from recruits.benchmarks import benchmark_connection, generate_recruits, delete_recruits, measure
+from recruits.models     import Recruit
+from recruits.search     import search_recruits
+
+class Command(BaseCommand):
+    help = "채용공고 검색(icontains vs n-gram 전문 검색) 벤치마크. 생성한 데이터는 종료 시 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000])
+        parser.add_argument('--keywords', nargs='+', default=['엔지니어', '백엔드 개발자', 'django', '편집'])
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--database', required=True, help="DATABASES 에 'BENCHMARK': True 로 표시한 DB")
+        parser.add_argument('--keep', action='store_true', help="생성한 데이터를 삭제하지 않습니다.")
+
+    def handle(self, *args, **options):
+        database   = options['database']
+        connection = benchmark_connection(database)
+        random.seed(0)
+
+        self.stdout.write(f"backend: {connection.vendor}")
+
+        try:
+            generated = 0
+
+            for rows in sorted(options['rows']):
+                generate_recruits(rows - generated, database, options['batch_size'])
+                generated = rows
+
+                self.stdout.write(f"\n[{rows} rows]")
+                self.stdout.write(f"{'keyword':<16}{'icontains(ms)':>16}{'fulltext(ms)':>16}{'matches':>10}")
+
+                for keyword in options['keywords']:
+                    base      = Recruit.objects.using(database).order_by('-created_at', '-id')
+                    icontains = base.filter(position_title__icontains=keyword)
+                    fulltext  = search_recruits(base, keyword)
+
+                    self.stdout.write(
+                        f"{keyword:<16}"
+                        f"{measure(icontains, options['repeat']):>16.2f}"
+                        f"{measure(fulltext, options['repeat']):>16.2f}"
+                        f"{fulltext.count():>10}"
+                    )
+        finally:
+            if not options['keep']:
+                delete_recruits(database)
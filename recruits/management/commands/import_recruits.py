@@ -0,0 +1,34 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from recruits.importer import RecruitImporter, read_rows, DEFAULT_BATCH_SIZE
+
+class Command(BaseCommand):
+    help = "JSONL/CSV 파일의 채용공고를 batch 단위로 등록합니다. 파일 경로 대신 - 를 주면 stdin 을 읽습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=['jsonl', 'csv'], default=None)
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--author', required=True, help="등록자 이메일")
+
+    def handle(self, *args, **options):
+        path   = options['path']
+        format = options['format'] or ('csv' if path.endswith('.csv') else 'jsonl')
+
+        if options['batch_size'] < 1:
+            raise CommandError("batch-size 는 1 이상이어야 합니다.")
+
+        importer = RecruitImporter(author=options['author'], batch_size=options['batch_size'])
+
+        if path == '-':
+            result = importer.run(read_rows(sys.stdin.buffer, format))
+        else:
+            with open(path, 'rb') as stream:
+                result = importer.run(read_rows(stream, format))
+
+        for error in result['errors']:
+            self.stderr.write(f"row {error['row']}: {error['errors']}")
+
+        self.stdout.write(f"created: {result['created']}, failed: {result['failed']}")
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+from recruits.search import install_fulltext_index, uninstall_fulltext_index
+
+def forwards(apps, schema_editor):
+    install_fulltext_index(schema_editor.connection)
+
+def backwards(apps, schema_editor):
+    uninstall_fulltext_index(schema_editor.connection)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruits', '0002_alter_recruit_position'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.5 on 2026-10-18 15:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruits', '0003_recruit_fulltext_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='recruit',
+            index=models.Index(fields=['deadline', '-created_at', '-id'], name='recruits_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recruit',
+            index=models.Index(fields=['-maximum_salary', '-created_at', '-id'], name='recruits_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recruit',
+            index=models.Index(fields=['-created_at', '-id'], name='recruits_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recruit',
+            index=models.Index(fields=['career_type', 'position_title'], name='recruits_career_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recruit',
+            index=models.Index(fields=['position_title'], name='recruits_title_idx'),
+        ),
+    ]
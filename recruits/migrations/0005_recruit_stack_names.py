@@ -0,0 +1,18 @@
+# Generated by Django 3.2.5 on 2026-10-18 15:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruits', '0004_recruit_sort_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recruit',
+            name='stack_names',
+            field=models.JSONField(default=list),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 3.2.5 on 2026-10-18 15:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0001_initial'),
+        ('recruits', '0005_recruit_stack_names'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedRecruit',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('position', models.CharField(max_length=20)),
+                ('position_title', models.CharField(max_length=50)),
+                ('description', models.TextField()),
+                ('stack_names', models.JSONField(default=list)),
+                ('work_type', models.CharField(max_length=10)),
+                ('career_type', models.CharField(choices=[('N', '신입'), ('C', '경력'), ('NC', '신입/경력')], default='NC', max_length=3)),
+                ('job_openings', models.CharField(max_length=10)),
+                ('author', models.CharField(max_length=30)),
+                ('deadline', models.DateField()),
+                ('minimum_salary', models.DecimalField(decimal_places=2, default=0, max_digits=13)),
+                ('maximum_salary', models.DecimalField(decimal_places=2, default=0, max_digits=13)),
+            ],
+            options={
+                'db_table': 'archived_recruits',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedRecruitStack',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recruit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruits.archivedrecruit')),
+                ('stack', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruits.stack')),
+            ],
+            options={
+                'db_table': 'archived_recruits_stacks',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedRecruitApplication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='applications.application')),
+                ('recruit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruits.archivedrecruit')),
+            ],
+            options={
+                'db_table': 'archived_recruits_applications',
+            },
+        ),
+        migrations.AddField(
+            model_name='archivedrecruit',
+            name='applications',
+            field=models.ManyToManyField(related_name='archived_recruits', through='recruits.ArchivedRecruitApplication', to='applications.Application'),
+        ),
+        migrations.AddField(
+            model_name='archivedrecruit',
+            name='stacks',
+            field=models.ManyToManyField(related_name='archived_recruits', through='recruits.ArchivedRecruitStack', to='recruits.Stack'),
+        ),
+    ]
@@ -13,6 +13,7 @@ class Recruit(TimeStampModel):
     position_title = models.CharField(max_length=50, null=False)
     description    = models.TextField()
     stacks         = models.ManyToManyField('Stack', through='RecruitStack', related_name='recruits')
+    stack_names    = models.JSONField(default=list)
     applications   = models.ManyToManyField('applications.Application', through='RecruitApplication', related_name='recruits')
     work_type      = models.CharField(max_length=10, null=False)
     career_type    = models.CharField(max_length=3, choices=TYPE_CHOICES, default='NC')
@@ -24,6 +25,14 @@ class Recruit(TimeStampModel):
     
     class Meta:
         db_table = 'recruits'
+        # RecruitListView.sort_dict 의 정렬(+ created_at, id tiebreak)과 관리자 지원목록 필터에 맞춘 인덱스
+        indexes  = [
+            models.Index(fields=['deadline', '-created_at', '-id'], name='recruits_deadline_idx'),
+            models.Index(fields=['-maximum_salary', '-created_at', '-id'], name='recruits_salary_idx'),
+            models.Index(fields=['-created_at', '-id'], name='recruits_created_idx'),
+            models.Index(fields=['career_type', 'position_title'], name='recruits_career_title_idx'),
+            models.Index(fields=['position_title'], name='recruits_title_idx'),
+        ]
 
 class Stack(models.Model):
     name    = models.CharField(max_length=256, null=False)
@@ -44,4 +53,41 @@ class RecruitApplication(models.Model):
     application = models.ForeignKey('applications.Application', on_delete=models.CASCADE)
 
     class Meta:
-        db_table = 'recruits_applications'
\ No newline at end of file
+        db_table = 'recruits_applications'
+
+class ArchivedRecruit(models.Model):
+    # 마감 후 오래된 공고를 recruits 에서 옮겨 보관합니다. id 는 원래 공고의 id 를 그대로 사용합니다.
+    id             = models.BigIntegerField(primary_key=True)
+    created_at     = models.DateTimeField()
+    updated_at     = models.DateTimeField()
+    archived_at    = models.DateTimeField(auto_now_add=True)
+    position       = models.CharField(max_length=20, null=False)
+    position_title = models.CharField(max_length=50, null=False)
+    description    = models.TextField()
+    stacks         = models.ManyToManyField('Stack', through='ArchivedRecruitStack', related_name='archived_recruits')
+    stack_names    = models.JSONField(default=list)
+    applications   = models.ManyToManyField('applications.Application', through='ArchivedRecruitApplication', related_name='archived_recruits')
+    work_type      = models.CharField(max_length=10, null=False)
+    career_type    = models.CharField(max_length=3, choices=Recruit.TYPE_CHOICES, default='NC')
+    job_openings   = models.CharField(max_length=10, null=False)
+    author         = models.CharField(max_length=30, null=False)
+    deadline       = models.DateField(null=False)
+    minimum_salary = models.DecimalField(max_digits=13, decimal_places=2, null=False, default=0)
+    maximum_salary = models.DecimalField(max_digits=13, decimal_places=2, null=False, default=0)
+
+    class Meta:
+        db_table = 'archived_recruits'
+
+class ArchivedRecruitStack(models.Model):
+    recruit = models.ForeignKey('ArchivedRecruit', on_delete=models.CASCADE)
+    stack   = models.ForeignKey('Stack', on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'archived_recruits_stacks'
+
+class ArchivedRecruitApplication(models.Model):
+    recruit     = models.ForeignKey('ArchivedRecruit', on_delete=models.CASCADE)
+    application = models.ForeignKey('applications.Application', on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'archived_recruits_applications'
@@ -0,0 +1,117 @@
+from django.db                    import connections
+from django.db.models             import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+# MySQL ngram_token_size 기본값, SQLite fts5 trigram 토크나이저 기준
+MYSQL_NGRAM_SIZE  = 2
+SQLITE_NGRAM_SIZE = 3
+
+MYSQL_FULLTEXT_INDEX = 'recruits_title_description_ngram'
+SQLITE_FTS_TABLE     = 'recruits_fts'
+
+SQLITE_FTS_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE}
+    USING fts5(position_title, description, content='recruits', content_rowid='id', tokenize='trigram')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai AFTER INSERT ON recruits BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, position_title, description)
+        VALUES (new.id, new.position_title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad AFTER DELETE ON recruits BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, position_title, description)
+        VALUES ('delete', old.id, old.position_title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au AFTER UPDATE ON recruits BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, position_title, description)
+        VALUES ('delete', old.id, old.position_title, old.description);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, position_title, description)
+        VALUES (new.id, new.position_title, new.description);
+    END
+    """,
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+# DB alias -> fts5 테이블 존재 여부. 검색마다 introspection 하지 않도록 프로세스에서 한 번만 확인합니다.
+sqlite_fts_tables = {}
+
+def install_fulltext_index(connection):
+    sqlite_fts_tables.pop(connection.alias, None)
+
+    if connection.vendor == 'mysql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = 'recruits' AND index_name = %s",
+                [MYSQL_FULLTEXT_INDEX]
+            )
+            if cursor.fetchone()[0]:
+                return
+
+            cursor.execute(
+                f"ALTER TABLE recruits ADD FULLTEXT INDEX {MYSQL_FULLTEXT_INDEX} "
+                "(position_title, description) WITH PARSER ngram"
+            )
+
+    if connection.vendor == 'sqlite':
+        # fts5 trigram 토크나이저는 SQLite 3.34 이상에서만 지원합니다. 없으면 icontains 로 검색합니다.
+        if connection.Database.sqlite_version_info < (3, 34):
+            return
+
+        with connection.cursor() as cursor:
+            for sql in SQLITE_FTS_SQL:
+                cursor.execute(sql)
+
+def uninstall_fulltext_index(connection):
+    sqlite_fts_tables.pop(connection.alias, None)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            cursor.execute(f"ALTER TABLE recruits DROP INDEX {MYSQL_FULLTEXT_INDEX}")
+
+        if connection.vendor == 'sqlite':
+            for suffix in ['ai', 'ad', 'au']:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {SQLITE_FTS_TABLE}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+
+def _phrase(keyword):
+    return '"' + keyword.replace('"', '""') + '"'
+
+def _has_sqlite_fts(connection):
+    if not connection.alias in sqlite_fts_tables:
+        sqlite_fts_tables[connection.alias] = SQLITE_FTS_TABLE in connection.introspection.table_names()
+
+    return sqlite_fts_tables[connection.alias]
+
+def search_recruits(queryset, keyword):
+    """
+    position_title, description 에서 keyword 를 검색합니다.
+    MySQL 은 ngram FULLTEXT 인덱스, SQLite 는 fts5 trigram 테이블을 사용하고,
+    n-gram 크기보다 짧은 검색어나 인덱스가 없는 DB 는 icontains 로 처리합니다.
+    """
+    keyword = keyword.strip()
+
+    if not keyword:
+        return queryset
+
+    connection = connections[queryset.db]
+
+    if connection.vendor == 'mysql' and len(keyword) >= MYSQL_NGRAM_SIZE:
+        return queryset.filter(RawSQL(
+            "MATCH (recruits.position_title, recruits.description) AGAINST (%s IN BOOLEAN MODE)",
+            [_phrase(keyword)],
+            output_field = BooleanField()
+        ))
+
+    if connection.vendor == 'sqlite' and len(keyword) >= SQLITE_NGRAM_SIZE and _has_sqlite_fts(connection):
+        return queryset.filter(id__in=RawSQL(
+            f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s",
+            [_phrase(keyword)]
+        ))
+
+    return queryset.filter(Q(position_title__icontains=keyword) | Q(description__icontains=keyword))
@@ -10,12 +10,13 @@ class RecruitSerializer(serializers.ModelSerializer):
                   'stacks', 'career_type', 'work_type', 'author', 'job_openings','deadline', 'minimum_salary', 'maximum_salary']
 
 class RecruitCreateBodySerializer(serializers.Serializer):
-    position       = serializers.CharField()
-    position_title = serializers.CharField()
+    # 일괄 등록이 행 단위로 오류를 보고할 수 있도록 Recruit, Stack 컬럼 길이와 같은 제한을 둡니다.
+    position       = serializers.CharField(max_length=20)
+    position_title = serializers.CharField(max_length=50)
     description    = serializers.CharField()
-    stacks         = serializers.ListField()
-    job_openings   = serializers.CharField()
-    work_type      = serializers.CharField()
+    stacks         = serializers.ListField(child=serializers.CharField(max_length=256))
+    job_openings   = serializers.CharField(max_length=10)
+    work_type      = serializers.CharField(max_length=10)
     career_type    = serializers.ChoiceField(choices=("신입", "경력", "신입/경력"), default="신입/경력")
     deadline       = serializers.DateField(default="9999-12-31")
     minimum_salary = serializers.DecimalField(max_digits=13, decimal_places=2, default=0)
@@ -24,4 +25,40 @@ class RecruitCreateBodySerializer(serializers.Serializer):
 
 class RecruitQuerySerializer(serializers.Serializer):
     position_title = serializers.CharField(allow_blank=True, allow_null=True, default="")
-    sort           = serializers.CharField(allow_blank=True, allow_null=True, default="")
\ No newline at end of file
+    sort           = serializers.CharField(allow_blank=True, allow_null=True, default="")
+    cursor         = serializers.CharField(allow_blank=True, allow_null=True, default="")
+    limit          = serializers.IntegerField(allow_null=True, default=20, min_value=1, max_value=100)
+    stream         = serializers.BooleanField(default=False)
+    fields         = serializers.CharField(allow_blank=True, allow_null=True, default="", help_text="ex) id,position_title,stacks")
+    open_only      = serializers.BooleanField(default=False, help_text="마감일이 지나지 않은 공고만 조회")
+
+# 응답 필드 -> (값, 필요한 recruits 컬럼). stacks 는 recruits_stacks 대신 비정규화된 stack_names 를 읽습니다.
+RECRUIT_FIELDS = {
+    "id"             : (lambda recruit: recruit.id, 'id'),
+    "position"       : (lambda recruit: recruit.position, 'position'),
+    "position_title" : (lambda recruit: recruit.position_title, 'position_title'),
+    "work_type"      : (lambda recruit: recruit.work_type, 'work_type'),
+    "career_type"    : (lambda recruit: recruit.get_career_type_display(), 'career_type'),
+    "author"         : (lambda recruit: recruit.author, 'author'),
+    "job_openings"   : (lambda recruit: recruit.job_openings, 'job_openings'),
+    "description"    : (lambda recruit: recruit.description, 'description'),
+    "minimum_salary" : (lambda recruit: recruit.minimum_salary, 'minimum_salary'),
+    "maximum_salary" : (lambda recruit: recruit.maximum_salary, 'maximum_salary'),
+    "deadline"       : (lambda recruit: recruit.deadline, 'deadline'),
+    "created_at"     : (lambda recruit: recruit.created_at, 'created_at'),
+    "updated_at"     : (lambda recruit: recruit.updated_at, 'updated_at'),
+    "stacks"         : (lambda recruit: recruit.stack_names, 'stack_names'),
+}
+
+def recruit_queryset(fields=RECRUIT_FIELDS, ordering=(), model=Recruit):
+    """
+    fields 에 필요한 컬럼만 읽는 queryset 을 만듭니다. (ETag 계산용 updated_at, ordering 컬럼 포함)
+    보관된 공고는 model=ArchivedRecruit 로 같은 필드를 조회합니다.
+    """
+    columns  = {'id', 'updated_at'} | {field.lstrip('-') for field in ordering}
+    columns |= {RECRUIT_FIELDS[field][1] for field in fields}
+
+    return model.objects.only(*columns)
+
+def serialize_recruit(recruit, fields=RECRUIT_FIELDS):
+    return {field: RECRUIT_FIELDS[field][0](recruit) for field in fields}
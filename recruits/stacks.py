@@ -0,0 +1,99 @@
+import hashlib, threading
+
+from collections import OrderedDict
+
+from django.db import transaction
+
+from recruits.models import Stack, RecruitStack
+
+def make_hash_id(stack_name):
+    s = hashlib.sha3_256()
+    s.update(stack_name.encode())
+
+    return s.hexdigest()
+
+class StackResolver:
+    """
+    기술스택 이름 목록을 stacks.id 목록으로 바꿉니다.
+    캐시에 없는 hash_id 는 한 번의 hash_id__in 조회로 찾고, 없는 스택은 bulk_create 로 한 번에 만듭니다.
+    hash_id -> id 매핑은 프로세스 내 LRU 에 maxsize 개까지 보관합니다.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.cache   = OrderedDict()
+        self.lock    = threading.Lock()
+
+    def get(self, hash_id):
+        with self.lock:
+            if hash_id not in self.cache:
+                return None
+
+            self.cache.move_to_end(hash_id)
+            return self.cache[hash_id]
+
+    def remember(self, mapping):
+        with self.lock:
+            for hash_id, stack_id in mapping.items():
+                self.cache[hash_id] = stack_id
+                self.cache.move_to_end(hash_id)
+
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+    def resolve(self, stack_names):
+        names = OrderedDict()
+
+        for stack_name in stack_names:
+            names.setdefault(make_hash_id(stack_name), stack_name)
+
+        ids     = {hash_id: self.get(hash_id) for hash_id in names}
+        missing = [hash_id for hash_id, stack_id in ids.items() if stack_id is None]
+
+        if missing:
+            found = dict(Stack.objects.filter(hash_id__in=missing).values_list('hash_id', 'id'))
+            to_create = [hash_id for hash_id in missing if hash_id not in found]
+
+            if to_create:
+                Stack.objects.bulk_create(
+                    [Stack(hash_id=hash_id, name=names[hash_id]) for hash_id in to_create],
+                    ignore_conflicts = True
+                )
+                found.update(Stack.objects.filter(hash_id__in=to_create).values_list('hash_id', 'id'))
+
+            ids.update(found)
+
+            # rollback 된 스택 id 가 캐시에 남지 않도록 commit 이후에 기록합니다.
+            transaction.on_commit(lambda: self.remember(found))
+
+        return [ids[hash_id] for hash_id in names]
+
+stack_resolver = StackResolver()
+
+def unique_stack_names(stack_names):
+    """
+    recruits.stack_names 에 저장할 순서가 유지된 중복 없는 이름 목록
+    """
+    return list(dict.fromkeys(stack_names))
+
+def add_recruit_stacks(recruit, stack_ids):
+    RecruitStack.objects.bulk_create([RecruitStack(recruit=recruit, stack_id=stack_id) for stack_id in stack_ids])
+
+def sync_recruit_stacks(recruit, stack_ids):
+    """
+    현재 연결된 stack id 와 비교해 빠진 id 만 삭제하고 새로운 id 만 추가합니다.
+    변경이 없으면 recruits_stacks 에 쓰지 않습니다.
+    """
+    current = set(RecruitStack.objects.filter(recruit=recruit).values_list('stack_id', flat=True))
+
+    stack_ids_to_remove = current - set(stack_ids)
+    stack_ids_to_add    = [stack_id for stack_id in stack_ids if stack_id not in current]
+
+    if stack_ids_to_remove:
+        RecruitStack.objects.filter(recruit=recruit, stack_id__in=stack_ids_to_remove).delete()
+
+    if stack_ids_to_add:
+        add_recruit_stacks(recruit, stack_ids_to_add)
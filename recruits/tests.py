@@ -1,3 +1,678 @@
-from django.test import TestCase
+import json, jwt, shutil, tempfile
 
-# Create your tests here.
+from datetime      import date, datetime, timedelta
+from decimal       import Decimal
+from io            import StringIO
+from unittest      import mock, skipIf
+
+from django.core.cache                    import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.management               import call_command, CommandError
+from django.core.management.sql           import emit_post_migrate_signal
+from django.db                            import connection
+from django.http                          import JsonResponse
+from django.test                          import TestCase, SimpleTestCase, Client, override_settings
+from django.test.utils                    import CaptureQueriesContext
+
+from core.encoders        import dumps, orjson
+from core.pagination      import KeysetPaginator
+from core.responses       import FastJsonResponse, iter_chunks, DEFAULT_CHUNK_SIZE
+from global_variable      import SECRET_KEY, ALGORITHM
+from users.models         import User
+from recruits.models      import Recruit, RecruitStack, Stack
+from recruits.stacks      import StackResolver, stack_resolver
+from recruits.cache       import VERSION_KEY, bump_version
+from recruits.search      import search_recruits, SQLITE_FTS_TABLE
+from recruits.fragments   import fragment_cache, fragment_key, encode_recruit
+from recruits.serializers import serialize_recruit
+
+def create_recruits(count, step=10, **fields):
+    """
+    step(µs) 간격으로 같은 밀리초 안에 몰려 만든 공고 (bulk import 로 들어온 데이터와 같은 모양)
+    """
+    recruits = Recruit.objects.bulk_create([
+        Recruit(**dict({
+            'position'       : 'developer',
+            'position_title' : f'백엔드 개발자 {number}',
+            'description'    : '설명',
+            'work_type'      : '정규직',
+            'career_type'    : 'C',
+            'job_openings'   : '1',
+            'author'         : 'admin@stockers.com',
+            'deadline'       : '2030-12-31',
+        }, **fields))
+        for number in range(count)
+    ])
+
+    for number, recruit in enumerate(Recruit.objects.order_by('id')):
+        Recruit.objects.filter(id=recruit.id).update(created_at=datetime(2021, 8, 20, 12, 0, 0, 100000 + number * step))
+
+    return recruits
+
+class KeysetPaginationTest(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        create_recruits(60)
+
+        self.ids = set(Recruit.objects.values_list('id', flat=True))
+
+    def test_paginator_does_not_skip_rows_in_same_millisecond(self):
+        paginator = KeysetPaginator(['-created_at', '-id'], limit=7)
+        cursor    = None
+        ids       = []
+
+        while True:
+            recruits, cursor = paginator.paginate(Recruit.objects.all(), cursor)
+            ids += [recruit.id for recruit in recruits]
+
+            if not cursor:
+                break
+
+        self.assertEqual(len(ids), 60)
+        self.assertEqual(set(ids), self.ids)
+
+    def test_list_api_follows_cursor_over_every_row(self):
+        cursor = ''
+        ids    = []
+
+        while True:
+            response = Client().get(f'/recruits?limit=7&fields=id&cursor={cursor}').json()
+            ids     += [recruit['id'] for recruit in response['results']]
+            cursor   = response['next_cursor']
+
+            if not cursor:
+                break
+
+        self.assertEqual(sorted(ids), sorted(self.ids))
+
+    def test_invalid_cursor(self):
+        self.assertEqual(Client().get('/recruits?cursor=invalid').json()['message'], 'INVALID_CURSOR')
+
+class StreamChunkTest(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        create_recruits(DEFAULT_CHUNK_SIZE + 100, step=1)
+
+        self.ids = sorted(Recruit.objects.values_list('id', flat=True))
+
+    def test_iter_chunks_returns_every_row(self):
+        chunks = list(iter_chunks(Recruit.objects.all(), ['-created_at', '-id'], chunk_size=DEFAULT_CHUNK_SIZE))
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(sorted(recruit.id for chunk in chunks for recruit in chunk), self.ids)
+
+    def test_stream_returns_every_row(self):
+        response = Client().get('/recruits?stream=true&fields=id')
+        results  = json.loads(b''.join(response.streaming_content))['results']
+
+        self.assertEqual(sorted(recruit['id'] for recruit in results), self.ids)
+
+class RecruitPatchStacksTest(TestCase):
+    def setUp(self):
+        stack_resolver.clear()
+
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+
+        self.body = {
+            "position"       : "developer",
+            "position_title" : "백엔드 개발자",
+            "description"    : "설명",
+            "stacks"         : ["python", "django", "mysql"],
+            "job_openings"   : "1",
+            "work_type"      : "정규직",
+            "career_type"    : "경력",
+            "deadline"       : "2030-12-31",
+            "minimum_salary" : 3000,
+            "maximum_salary" : 5000
+        }
+        self.client.post('/recruits', json.dumps(self.body), content_type='application/json')
+        self.recruit = Recruit.objects.get()
+
+    def patch(self, stacks):
+        return self.client.patch(
+            f'/recruits/{self.recruit.id}',
+            json.dumps(dict(self.body, stacks=stacks)),
+            content_type = 'application/json'
+        )
+
+    def stack_writes(self, queries):
+        return [
+            query['sql'] for query in queries
+            if 'recruits_stacks' in query['sql'] and not query['sql'].startswith('SELECT')
+        ]
+
+    def test_patch_with_same_stacks_does_not_write_stacks(self):
+        # user, recruit, savepoint, stacks, update recruit, recruits_stacks, release savepoint
+        with self.assertNumQueries(7), CaptureQueriesContext(connection) as queries:
+            response = self.patch(["mysql", "python", "django"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.stack_writes(queries), [])
+
+    def test_patch_with_changed_stacks_writes_only_difference(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.patch(["python", "django", "docker"])
+
+        writes = self.stack_writes(queries)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(writes), 2)
+        self.assertTrue(writes[0].startswith('DELETE'))
+        self.assertTrue(writes[1].startswith('INSERT'))
+        self.assertEqual(
+            set(RecruitStack.objects.filter(recruit=self.recruit).values_list('stack__name', flat=True)),
+            {"python", "django", "docker"}
+        )
+
+    def test_backfill_keeps_request_order(self):
+        self.patch(["mysql", "python"])
+
+        call_command('backfill_stack_names', stdout=StringIO())
+
+        self.assertEqual(Recruit.objects.get().stack_names, ["mysql", "python"])
+
+        # 비어있거나 recruits_stacks 와 다른 값은 recruits_stacks 순서로 채웁니다.
+        Recruit.objects.update(stack_names=["python", "java"])
+        output = StringIO()
+
+        call_command('backfill_stack_names', stdout=output)
+
+        self.assertEqual(Recruit.objects.get().stack_names, ["python", "mysql"])
+        self.assertIn("updated: 1", output.getvalue())
+
+class StackResolverTest(TestCase):
+    def resolve(self, resolver, names):
+        with self.captureOnCommitCallbacks(execute=True):
+            return resolver.resolve(names)
+
+    def test_cached_stacks_are_not_queried(self):
+        resolver = StackResolver()
+
+        # 없는 스택 조회, bulk_create, 만든 스택 id 조회
+        with self.assertNumQueries(3):
+            ids = self.resolve(resolver, ["python", "django", "python"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.resolve(resolver, ["django", "python"]), ids[::-1])
+
+        # 캐시에 없는 스택만 조회합니다.
+        with self.assertNumQueries(1):
+            self.assertEqual(StackResolver().resolve(["python"]), ids[:1])
+
+    def test_lru_evicts_least_recently_used(self):
+        resolver = StackResolver(maxsize=2)
+
+        self.resolve(resolver, ["python", "django"])
+        self.resolve(resolver, ["python"])
+        self.resolve(resolver, ["mysql"])
+
+        with self.assertNumQueries(0):
+            resolver.resolve(["python", "mysql"])
+
+        with self.assertNumQueries(1):
+            resolver.resolve(["django"])
+
+    def test_rolled_back_ids_are_not_cached(self):
+        resolver = StackResolver()
+
+        with self.captureOnCommitCallbacks(execute=False):
+            resolver.resolve(["python"])
+
+        self.assertIsNone(resolver.get(next(iter(Stack.objects.values_list('hash_id', flat=True)))))
+
+class RecruitImportTest(TestCase):
+    def setUp(self):
+        stack_resolver.clear()
+        caches['default'].clear()
+
+        admin       = User.objects.create(email='admin@stockers.com', password='password', role='admin')
+        self.client = Client(HTTP_AUTHORIZATION=jwt.encode({'user_id': admin.id, 'role': 'admin'}, SECRET_KEY, ALGORITHM))
+
+    def row(self, **fields):
+        return dict({
+            "position"       : "developer",
+            "position_title" : "백엔드 개발자",
+            "description"    : "설명",
+            "stacks"         : ["python", "django"],
+            "job_openings"   : "1",
+            "work_type"      : "정규직",
+            "career_type"    : "경력",
+            "deadline"       : "2030-12-31",
+        }, **fields)
+
+    def post(self, body, query=''):
+        response = self.client.post(f'/recruits/import?{query}', body, content_type='application/octet-stream')
+
+        self.assertEqual(response.status_code, 201)
+
+        return response.json()
+
+    def jsonl(self, rows):
+        return '\n'.join(json.dumps(row, ensure_ascii=False) for row in rows).encode()
+
+    def test_good_rows_are_created_with_stacks(self):
+        result = self.post(self.jsonl([
+            self.row(),
+            self.row(position_title="프론트엔드 개발자", stacks=["react", "python", "react"]),
+            self.row(position_title="데이터 엔지니어", stacks=[]),
+        ]), 'batch_size=2')
+
+        self.assertEqual([result['created'], result['failed']], [3, 0])
+        self.assertEqual(sorted(Stack.objects.values_list('name', flat=True)), ['django', 'python', 'react'])
+        self.assertEqual(
+            dict(Recruit.objects.values_list('position_title', 'stack_names')),
+            {"백엔드 개발자": ["python", "django"], "프론트엔드 개발자": ["react", "python"], "데이터 엔지니어": []}
+        )
+        self.assertEqual(RecruitStack.objects.filter(recruit__position_title="프론트엔드 개발자").count(), 2)
+        self.assertEqual(RecruitStack.objects.filter(stack__name='python').count(), 2)
+
+    def test_bad_rows_are_reported_without_failing_batch(self):
+        result = self.post(self.jsonl([
+            self.row(),
+            self.row(position="p" * 21),
+            self.row(position_title="t" * 51, job_openings="1" * 11, work_type="w" * 11),
+            self.row(career_type="인턴"),
+            "not an object",
+        ]) + b'\n{broken json\n' + self.jsonl([self.row(position_title="마지막")]))
+
+        self.assertEqual([result['created'], result['failed']], [2, 5])
+        self.assertEqual([error['row'] for error in result['errors']], [2, 3, 4, 5, 6])
+        self.assertEqual(list(result['errors'][0]['errors']), ['position'])
+        self.assertEqual(sorted(result['errors'][1]['errors']), ['job_openings', 'position_title', 'work_type'])
+        self.assertEqual(sorted(Recruit.objects.values_list('position_title', flat=True)), ["마지막", "백엔드 개발자"])
+
+    def test_csv_rows(self):
+        body = (
+            'position,position_title,description,stacks,job_openings,work_type,career_type\n'
+            'developer,백엔드 개발자,설명,"python, django",1,정규직,경력\n'
+            'developer,,설명,,1,정규직,경력\n'
+        ).encode()
+
+        result = self.post(body, 'file_format=csv')
+
+        self.assertEqual([result['created'], result['failed']], [1, 1])
+        self.assertEqual(Recruit.objects.get().stack_names, ['python', 'django'])
+
+    def test_rows_before_invalid_encoding_are_reported(self):
+        body   = self.jsonl([self.row(), self.row(position_title="두번째")]) + b'\n\xff\xfe\n' + self.jsonl([self.row()])
+        result = self.post(body, 'batch_size=10')
+
+        self.assertEqual([result['created'], result['failed']], [2, 1])
+        self.assertEqual(result['errors'], [{'row': 3, 'errors': 'INVALID_ENCODING'}])
+
+class RecruitCacheTest(TestCase):
+    def cache_settings(self):
+        return {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'recruit-cache-test'}
+
+    def setUp(self):
+        settings = override_settings(CACHES={
+            'default'          : self.cache_settings(),
+            'recruit_fragments': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'recruit-cache-test-fragments'},
+        })
+        settings.enable()
+
+        self.addCleanup(settings.disable)
+        self.addCleanup(lambda: caches['default'].clear())
+
+        caches['default'].clear()
+        create_recruits(2)
+
+    def ids(self):
+        return [recruit['id'] for recruit in Client().get('/recruits?fields=id').json()['results']]
+
+    def test_response_is_cached_until_version_changes(self):
+        ids = self.ids()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.ids(), ids)
+
+        # bulk_create 는 버전을 올리지 않으므로 이전 응답이 그대로 나옵니다.
+        create_recruits(1)
+
+        self.assertEqual(len(self.ids()), 2)
+
+        bump_version()
+
+        self.assertEqual(len(self.ids()), 3)
+
+class FileRecruitCacheTest(RecruitCacheTest):
+    def cache_settings(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        return {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': self.directory}
+
+    def test_bump_from_other_process_invalidates_response(self):
+        # 같은 디렉터리를 보는 다른 cache 객체는 다른 프로세스와 같습니다.
+        other = FileBasedCache(self.directory, {})
+        ids   = self.ids()
+
+        create_recruits(1)
+        other.incr(VERSION_KEY)
+
+        self.assertEqual(len(self.ids()), len(ids) + 1)
+
+class RecruitETagTest(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        create_recruits(1, description='긴 설명', stack_names=['python'])
+
+        self.recruit = Recruit.objects.get()
+        self.client  = Client()
+
+    def test_detail_returns_304_without_loading_description(self):
+        etag = self.client.get(f'/recruits/{self.recruit.id}')['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/recruits/{self.recruit.id}', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('description', queries[0]['sql'])
+
+    def test_etag_depends_on_fields(self):
+        full = self.client.get(f'/recruits/{self.recruit.id}')['ETag']
+        ids  = self.client.get(f'/recruits/{self.recruit.id}?fields=id')['ETag']
+
+        self.assertNotEqual(full, ids)
+        self.assertEqual(self.client.get(f'/recruits/{self.recruit.id}?fields=id', HTTP_IF_NONE_MATCH=full).status_code, 200)
+        self.assertEqual(self.client.get(f'/recruits/{self.recruit.id}?fields=id', HTTP_IF_NONE_MATCH=ids).status_code, 304)
+        self.assertNotEqual(self.client.get('/recruits')['ETag'], self.client.get('/recruits?fields=id')['ETag'])
+
+    def test_etag_changes_with_stacks_only_when_stacks_are_returned(self):
+        full  = self.client.get(f'/recruits/{self.recruit.id}')['ETag']
+        title = self.client.get(f'/recruits/{self.recruit.id}?fields=position_title')['ETag']
+
+        Recruit.objects.filter(id=self.recruit.id).update(stack_names=['django'])
+
+        self.assertEqual(self.client.get(f'/recruits/{self.recruit.id}', HTTP_IF_NONE_MATCH=full).status_code, 200)
+        self.assertEqual(self.client.get(f'/recruits/{self.recruit.id}?fields=position_title', HTTP_IF_NONE_MATCH=title).status_code, 304)
+
+    def test_list_returns_304(self):
+        etag = self.client.get('/recruits')['ETag']
+
+        self.assertEqual(self.client.get('/recruits', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_list_returns_304_on_cache_miss_without_loading_description(self):
+        etag = self.client.get('/recruits')['ETag']
+
+        caches['default'].clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/recruits', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse([query for query in queries if 'description' in query['sql']])
+
+    def test_list_etag_changes_when_page_gains_next_page(self):
+        first = self.client.get('/recruits?limit=1')
+
+        self.assertIsNone(first.json()['next_cursor'])
+
+        # 기존 행 뒤에 정렬되는 공고가 추가되면 첫 페이지의 행은 같지만 next_cursor 가 생깁니다.
+        create_recruits(1)
+        Recruit.objects.exclude(id=self.recruit.id).update(created_at=self.recruit.created_at - timedelta(days=1))
+        bump_version()
+
+        for _ in range(2):
+            response = self.client.get('/recruits?limit=1', HTTP_IF_NONE_MATCH=first['ETag'])
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['results'], first.json()['results'])
+            self.assertIsNotNone(response.json()['next_cursor'])
+            self.assertNotEqual(response['ETag'], first['ETag'])
+
+    def test_list_etag_depends_on_sort_and_limit(self):
+        etag = self.client.get('/recruits')['ETag']
+
+        self.assertEqual(self.client.get('/recruits?limit=5', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertEqual(self.client.get('/recruits?sort=deadline-ascend', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+@skipIf(
+    connection.vendor != 'sqlite' or connection.Database.sqlite_version_info < (3, 34),
+    "fts5 trigram 토크나이저가 필요합니다."
+)
+class RecruitSearchTest(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        create_recruits(1, position_title='백엔드 개발자', description='쿠버네티스 운영 경험')
+        create_recruits(1, position_title='프론트엔드 개발자', description='리액트')
+
+        self.backend, self.frontend = Recruit.objects.order_by('id')
+
+    def search(self, keyword):
+        with CaptureQueriesContext(connection) as queries:
+            ids = list(search_recruits(Recruit.objects.order_by('id'), keyword).values_list('id', flat=True))
+
+        return ids, queries[-1]['sql']
+
+    def test_fts_matches_title_and_description(self):
+        ids, sql = self.search('쿠버네티스')
+
+        self.assertEqual(ids, [self.backend.id])
+        self.assertIn(SQLITE_FTS_TABLE, sql)
+        self.assertEqual(self.search('엔드 개발')[0], [self.backend.id, self.frontend.id])
+
+        results = Client().get('/recruits?position_title=쿠버네티스&fields=id').json()['results']
+
+        self.assertEqual(results, [{'id': self.backend.id}])
+
+    def test_fts_table_is_checked_once_per_alias(self):
+        self.search('쿠버네티스')
+
+        with mock.patch.object(connection.introspection, 'table_names') as table_names:
+            ids, sql = self.search('쿠버네티스')
+
+        table_names.assert_not_called()
+        self.assertIn(SQLITE_FTS_TABLE, sql)
+        self.assertEqual(ids, [self.backend.id])
+
+    def test_short_keyword_uses_icontains(self):
+        ids, sql = self.search('리액')
+
+        self.assertEqual(ids, [self.frontend.id])
+        self.assertNotIn(SQLITE_FTS_TABLE, sql)
+
+    def test_index_follows_update_and_delete(self):
+        self.frontend.description = '쿠버네티스'
+        self.frontend.save()
+        self.backend.delete()
+
+        self.assertEqual(self.search('쿠버네티스')[0], [self.frontend.id])
+
+    def test_triggers_are_reinstalled_after_migrate(self):
+        # ALTER 로 recruits 가 재생성되면 트리거가 사라집니다.
+        with connection.cursor() as cursor:
+            for suffix in ['ai', 'ad', 'au']:
+                cursor.execute(f"DROP TRIGGER {SQLITE_FTS_TABLE}_{suffix}")
+
+        create_recruits(1, position_title='데이터 엔지니어', description='스파크')
+
+        self.assertEqual(self.search('스파크')[0], [])
+
+        emit_post_migrate_signal(verbosity=0, interactive=False, db='default')
+        create_recruits(1, position_title='데이터 엔지니어', description='스파크 스트리밍')
+
+        self.assertEqual(len(self.search('스파크')[0]), 2)
+
+class RecruitFieldsTest(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        create_recruits(2, description='긴 설명', stack_names=['python'])
+
+        self.recruit = Recruit.objects.order_by('id').first()
+        self.client  = Client()
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+
+        return response, [query['sql'] for query in queries if 'FROM "recruits"' in query['sql']]
+
+    def test_list_returns_only_requested_fields(self):
+        # 요청 순서와 관계없이 RECRUIT_FIELDS 순서로 내려줍니다.
+        response, queries = self.get('/recruits?fields=stacks,position_title,id')
+
+        self.assertEqual(list(response.json()['results'][0]), ['id', 'position_title', 'stacks'])
+        self.assertEqual(response.json()['results'][0]['stacks'], ['python'])
+        self.assertTrue(queries)
+        self.assertFalse(any('"description"' in sql for sql in queries))
+
+    def test_stream_and_detail_return_only_requested_fields(self):
+        response, queries = self.get('/recruits?stream=true&fields=id,deadline')
+        results           = json.loads(b''.join(response.streaming_content))['results']
+
+        self.assertEqual([list(result) for result in results], [['id', 'deadline']] * 2)
+        self.assertFalse(any('"description"' in sql for sql in queries))
+
+        response, queries = self.get(f'/recruits/{self.recruit.id}?fields=position_title')
+
+        self.assertEqual(response.json()['result'], {'position_title': self.recruit.position_title})
+        self.assertFalse(any('"description"' in sql for sql in queries))
+
+    def test_description_is_read_when_requested(self):
+        response, queries = self.get(f'/recruits/{self.recruit.id}?fields=id,description')
+
+        self.assertEqual(response.json()['result'], {'id': self.recruit.id, 'description': '긴 설명'})
+        self.assertTrue(any('"description"' in sql for sql in queries))
+
+    def test_invalid_fields(self):
+        for url in [
+            '/recruits?fields=id,password',
+            '/recruits?fields=,',
+            '/recruits?stream=true&fields=author_email',
+            f'/recruits/{self.recruit.id}?fields=content',
+        ]:
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['message'], 'INVALID_FIELDS')
+
+class RecruitFragmentTest(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        fragment_cache().clear()
+        create_recruits(3, description='설명', stack_names=['python', 'django'], minimum_salary=Decimal('3000.50'))
+
+        self.client = Client()
+
+    def test_fragments_match_freshly_serialized_recruits(self):
+        response = self.client.get('/recruits?limit=2')
+        ids      = [result['id'] for result in response.json()['results']]
+        recruits = sorted(Recruit.objects.filter(id__in=ids), key=lambda recruit: ids.index(recruit.id))
+        expected = FastJsonResponse({
+            'results'    : [serialize_recruit(recruit) for recruit in recruits],
+            'next_cursor': response.json()['next_cursor']
+        })
+
+        self.assertEqual(response.content, expected.content)
+
+        # 두 번째 요청은 캐시된 조각으로 같은 본문을 만듭니다.
+        caches['default'].clear()
+
+        self.assertEqual(fragment_cache().get(fragment_key(recruits[0].id, recruits[0].updated_at)), encode_recruit(recruits[0]))
+        self.assertEqual(self.client.get('/recruits?limit=2').content, expected.content)
+
+        detail = self.client.get(f'/recruits/{recruits[0].id}')
+
+        self.assertEqual(detail.content, FastJsonResponse({'result': serialize_recruit(recruits[0])}).content)
+
+    def test_fragment_is_rebuilt_on_save(self):
+        recruit = Recruit.objects.order_by('id').first()
+
+        self.client.get(f'/recruits/{recruit.id}')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            recruit.position_title = '수정된 공고'
+            recruit.save()
+
+        recruit = Recruit.objects.get(id=recruit.id)
+
+        self.assertEqual(fragment_cache().get(fragment_key(recruit.id, recruit.updated_at)), encode_recruit(recruit))
+        self.assertEqual(
+            self.client.get(f'/recruits/{recruit.id}').content,
+            FastJsonResponse({'result': serialize_recruit(recruit)}).content
+        )
+
+    def test_rolled_back_save_does_not_cache_fragment(self):
+        recruit = Recruit.objects.order_by('id').first()
+
+        with self.captureOnCommitCallbacks(execute=False):
+            recruit.position_title = '취소된 수정'
+            recruit.save()
+
+        self.assertIsNone(fragment_cache().get(fragment_key(recruit.id, recruit.updated_at)))
+
+class RecruitBenchmarkGuardTest(SimpleTestCase):
+    def test_benchmarks_refuse_unmarked_databases(self):
+        # 인덱스를 지우고 데이터를 넣기 전에 거절합니다.
+        for command in ['bench_recruit_indexes', 'bench_recruit_search']:
+            for database in ['default', 'unknown']:
+                with self.assertRaises(CommandError):
+                    call_command(command, database=database, stdout=StringIO())
+
+COMPACT = {'separators': (',', ':'), 'ensure_ascii': False}
+
+class FastJsonResponseTest(SimpleTestCase):
+    data = {
+        "result": {
+            "id"             : 1,
+            "position_title" : "백엔드 개발자",
+            "minimum_salary" : Decimal("3000.00"),
+            "maximum_salary" : Decimal("5000.50"),
+            "deadline"       : date(2030, 12, 31),
+            "created_at"     : datetime(2021, 8, 20, 13, 5, 7, 123456),
+            "updated_at"     : datetime(2021, 8, 20, 13, 5, 7),
+            "stacks"         : ["python", "django"],
+            "content"        : {
+                "personal"  : {"name": "홍길동", "email": "user@stockers.com"},
+                "careers"   : [{"company": "스톡폴리오", "years": 3, "rate": 0.5, "current": True}],
+                "portfolio" : {"portfolioUrl": None, "links": []},
+            },
+        }
+    }
+
+    def encode_without_orjson(self, data):
+        with mock.patch('core.encoders.orjson', None):
+            return dumps(data)
+
+    def test_fallback_matches_compact_json_response(self):
+        # JsonResponse 기본값과 달리 공백 없이 UTF-8 로 인코딩합니다.
+        self.assertEqual(self.encode_without_orjson(self.data), JsonResponse(self.data, json_dumps_params=COMPACT).content)
+        self.assertNotEqual(self.encode_without_orjson(self.data), JsonResponse(self.data).content)
+
+    def test_fallback_writes_nan_as_null(self):
+        data = {'rate': float('nan'), 'values': [float('inf'), 1.5]}
+
+        self.assertEqual(self.encode_without_orjson(data), b'{"rate":null,"values":[null,1.5]}')
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_and_fallback_write_same_bytes(self):
+        data = dict(self.data, rate=float('nan'), max=float('-inf'))
+
+        self.assertEqual(dumps(data), self.encode_without_orjson(data))
+        self.assertEqual(dumps(self.data), JsonResponse(self.data, json_dumps_params=COMPACT).content)
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_falls_back_on_big_integer(self):
+        data = dict(self.data, big=2 ** 64, negative=-2 ** 70, rate=float('nan'))
+
+        self.assertEqual(dumps(data), self.encode_without_orjson(data))
+        self.assertIn(b'"big":18446744073709551616', dumps(data))
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_writes_nan_as_null(self):
+        data = {'rate': float('nan'), 'max': float('inf')}
+
+        self.assertEqual(dumps(data), b'{"rate":null,"max":null}')
+
+    def test_response_decodes_to_json_response_data(self):
+        response = FastJsonResponse(self.data, status=200)
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), json.loads(JsonResponse(self.data).content))
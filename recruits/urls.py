@@ -1,10 +1,12 @@
 from django.urls import path
 
-from applications.views import ApplicationView
-from recruits.views     import RecruitListView, RecruitView
+from applications.views import ApplicationView, ApplicationUploadView
+from recruits.views     import RecruitListView, RecruitView, RecruitImportView
 
 urlpatterns = [
     path('', RecruitListView.as_view()),
+    path('/import', RecruitImportView.as_view()),
     path('/<int:recruit_id>', RecruitView.as_view()),
     path('/<int:recruit_id>/applications', ApplicationView.as_view()),
+    path('/<int:recruit_id>/applications/upload', ApplicationUploadView.as_view()),
 ]
\ No newline at end of file
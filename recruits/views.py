@@ -1,6 +1,6 @@
-import json, sys, hashlib, sha3
+import json, sys
 
-from django.http  import JsonResponse
+from django.db    import transaction
 
 from rest_framework.views import APIView
 
@@ -8,9 +8,20 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg       import openapi
 
 from global_variable import ADMIN_TOKEN
-from recruits.models import Recruit, Stack, RecruitStack
+from recruits.models import Recruit, ArchivedRecruit
 from core.decorators import admin_only
-from recruits.serializers import RecruitSerializer, RecruitQuerySerializer, RecruitCreateBodySerializer
+from core.pagination import KeysetPaginator, InvalidCursor, InvalidLimit
+from core.responses  import FastJsonResponse, StreamingJsonResponse, EncodedJsonResponse, encode_json_array, iter_chunks
+from core.encoders   import dumps
+from core.fields     import parse_fields, InvalidFields
+from recruits.search import search_recruits
+from recruits.cache  import cached_response, bump_version
+from recruits.stacks import stack_resolver, unique_stack_names, add_recruit_stacks, sync_recruit_stacks
+from recruits.importer import RecruitImporter, read_rows, DEFAULT_BATCH_SIZE
+from recruits.fragments import FULL_FIELDS, get_fragments, get_fragment
+from recruits.archive import local_today
+from recruits.etag   import recruit_etag, recruits_etag, lookup_recruit_etag, etag_matches, not_modified
+from recruits.serializers import RecruitSerializer, RecruitQuerySerializer, RecruitCreateBodySerializer, RECRUIT_FIELDS, recruit_queryset, serialize_recruit
 
 class RecruitListView(APIView):
     parameter_token = openapi.Parameter (
@@ -23,53 +34,125 @@ class RecruitListView(APIView):
 
     recruits_get_response = openapi.Response("results", RecruitSerializer)
 
+    sort_dict = {
+        "deadline-ascend" : "deadline",
+        "salary-descend"  : "-maximum_salary",
+        "created-descend" : "-created_at",
+    }
+
     @swagger_auto_schema(
         query_serializer = RecruitQuerySerializer,
         responses = {
             "200": recruits_get_response,
+            "304": "NOT_MODIFIED",
             "404": "NOT_FOUND"
         },
         operation_id = "채용공고 목록 조회",
         operation_description = "채용공고 목록을 조회합니다. 포지션별 필터링, 마감일/연봉 기준 정렬\n" +
-                                "position_title: developer, designer, ..\n" +
+                                "position_title: developer, designer, .. (공고 제목/설명 전문 검색)\n" +
                                 "sort    : deadline-ascend, salary-descend\n" +
+                                "cursor  : 이전 응답의 next_cursor (다음 페이지 조회)\n" +
+                                "limit   : 페이지 크기 (기본 20, 최대 100)\n" +
+                                "stream  : true 이면 페이지 없이 전체 목록을 스트리밍으로 내려줍니다.\n" +
+                                "fields  : 응답에 포함할 필드 (ex. id,position_title,deadline)\n" +
+                                "open_only: true 이면 마감일이 지나지 않은 공고만 조회합니다.\n" +
                                 "DEFAULT : 모든 포지션, 최신순"
     )
     def get(self, request):
-        position_title = request.GET.get("position_title", "")
-        sort           = request.GET.get("sort", "created-descend")
-
-        sort_dict = {
-            "deadline-ascend" : "deadline",
-            "salary-descend"  : "-maximum_salary",
-            "created-descend" : "-created_at",
+        params = {
+            "position_title" : request.GET.get("position_title", "").strip(),
+            "sort"           : request.GET.get("sort", "created-descend"),
+            "cursor"         : request.GET.get("cursor", None),
+            "limit"          : request.GET.get("limit", None),
+            "fields"         : request.GET.get("fields", ""),
+            "open_only"      : request.GET.get("open_only") in ["true", "1"],
         }
 
-        recruits = (Recruit.objects.prefetch_related('stacks')
-                                    .filter(position_title__icontains=position_title)
-                                    .order_by(sort_dict[sort], '-created_at')
-                    )
-            
-        results = [
-            {
-                "id"             : recruit.id,
-                "position"       : recruit.position,
-                "position_title" : recruit.position_title,
-                "work_type"      : recruit.work_type,
-                "career_type"    : recruit.get_career_type_display(),
-                "author"         : recruit.author,
-                "job_openings"   : recruit.job_openings,
-                "description"    : recruit.description,
-                "minimum_salary" : recruit.minimum_salary,
-                "maximum_salary" : recruit.maximum_salary,
-                "deadline"       : recruit.deadline,
-                "created_at"     : recruit.created_at,
-                "updated_at"     : recruit.updated_at,
-                "stacks"        : [ stack.name for stack in recruit.stacks.all() ]
-            }
-            for recruit in recruits
-        ]
-        return JsonResponse({"results": results}, status=200)
+        if request.GET.get("stream") in ["true", "1"]:
+            return self.stream_list(params["position_title"], params["sort"], params["fields"], params["open_only"])
+
+        response = cached_response("recruits:list", params, lambda: self.get_list(**params, request=request))
+
+        if response.status_code == 200 and etag_matches(request, response.get("ETag")):
+            return not_modified(response["ETag"])
+
+        return response
+
+    def filter_open(self, queryset, open_only):
+        # recruits_deadline_idx 의 선두 컬럼(deadline) 범위 조건으로 조회합니다.
+        if open_only:
+            return queryset.filter(deadline__gte=local_today())
+
+        return queryset
+
+    def get_list(self, position_title, sort, cursor, limit, fields, open_only, request=None):
+        if not sort in self.sort_dict:
+            return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
+
+        try:
+            fields    = parse_fields(fields, RECRUIT_FIELDS)
+            paginator = KeysetPaginator(
+                ordering = [self.sort_dict[sort], '-created_at', '-id'],
+                limit    = KeysetPaginator.parse_limit(limit)
+            )
+
+            if request is not None and request.headers.get("If-None-Match"):
+                # 캐시에 없는 조건부 요청은 id, updated_at, stack_names 만 읽어 ETag 를 비교하고,
+                # 일치하지 않을 때만 description 등 전체 컬럼을 읽습니다.
+                rows, next_cursor = paginator.paginate(
+                    search_recruits(self.filter_open(recruit_queryset(["id", "stacks"], paginator.ordering), open_only), position_title),
+                    cursor
+                )
+                etag = recruits_etag(rows, fields, [paginator.ordering, paginator.limit, next_cursor])
+
+                if etag_matches(request, etag):
+                    return not_modified(etag)
+
+                by_id    = recruit_queryset(fields, paginator.ordering).in_bulk([row.id for row in rows])
+                recruits = [by_id[row.id] for row in rows if row.id in by_id]
+            else:
+                recruits, next_cursor = paginator.paginate(
+                    search_recruits(self.filter_open(recruit_queryset(fields, paginator.ordering), open_only), position_title),
+                    cursor
+                )
+
+        except InvalidFields:
+            return FastJsonResponse({"message": "INVALID_FIELDS"}, status=400)
+        except InvalidLimit:
+            return FastJsonResponse({"message": "INVALID_LIMIT"}, status=400)
+        except InvalidCursor:
+            return FastJsonResponse({"message": "INVALID_CURSOR"}, status=400)
+
+        if fields == FULL_FIELDS:
+            response = EncodedJsonResponse(
+                {"results": encode_json_array(get_fragments(recruits)), "next_cursor": dumps(next_cursor)},
+                status = 200
+            )
+        else:
+            results  = [serialize_recruit(recruit, fields) for recruit in recruits]
+            response = FastJsonResponse({"results": results, "next_cursor": next_cursor}, status=200)
+
+        response["ETag"] = recruits_etag(recruits, fields, [paginator.ordering, paginator.limit, next_cursor])
+
+        return response
+
+    def stream_list(self, position_title, sort, fields, open_only):
+        if not sort in self.sort_dict:
+            return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
+
+        try:
+            fields = parse_fields(fields, RECRUIT_FIELDS)
+        except InvalidFields:
+            return FastJsonResponse({"message": "INVALID_FIELDS"}, status=400)
+
+        ordering = [self.sort_dict[sort], '-created_at', '-id']
+        queryset = self.filter_open(recruit_queryset(fields, ordering), open_only)
+        chunks   = iter_chunks(search_recruits(queryset, position_title), ordering)
+
+        if fields == FULL_FIELDS:
+            return StreamingJsonResponse("results", (get_fragments(chunk) for chunk in chunks), status=200)
+
+        return StreamingJsonResponse("results", chunks, lambda recruit: serialize_recruit(recruit, fields), status=200)
 
     @swagger_auto_schema (
         manual_parameters = [parameter_token],
@@ -106,39 +189,34 @@ class RecruitListView(APIView):
             author = request.user.email
 
             if not (career_type in career_type_choices):
-                return JsonResponse({"message": "BAD_REQUEST"}, status=400)
-
-            stacks = []
-            
-            for stack_name in stack_names:
-                s = hashlib.sha3_256()
-                s.update(stack_name.encode())
-                hash_id = s.hexdigest()
-
-                object, is_created = Stack.objects.get_or_create(hash_id=hash_id, name=stack_name)
-                stacks.append(object)
-
-            
-            recruit = Recruit.objects.create(
-                position       = position,
-                position_title = position_title,
-                description    = description,
-                work_type      = work_type,
-                career_type    = career_type_choices[career_type],
-                job_openings   = job_openings,
-                author         = author,
-                deadline       = deadline if deadline else "9999-12-31",
-                minimum_salary = minimum_salary if minimum_salary else 0,
-                maximum_salary = maximum_salary if maximum_salary else 0
-            )
-            recruit.stacks.add(*stacks)
-
-            return JsonResponse({"message": "SUCCESS"}, status=201)
+                return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
+
+            with transaction.atomic():
+                stack_ids = stack_resolver.resolve(stack_names)
+
+                recruit = Recruit.objects.create(
+                    position       = position,
+                    position_title = position_title,
+                    description    = description,
+                    stack_names    = unique_stack_names(stack_names),
+                    work_type      = work_type,
+                    career_type    = career_type_choices[career_type],
+                    job_openings   = job_openings,
+                    author         = author,
+                    deadline       = deadline if deadline else "9999-12-31",
+                    minimum_salary = minimum_salary if minimum_salary else 0,
+                    maximum_salary = maximum_salary if maximum_salary else 0
+                )
+                add_recruit_stacks(recruit, stack_ids)
+
+            bump_version()
+
+            return FastJsonResponse({"message": "SUCCESS"}, status=201)
 
         except KeyError:
-            return JsonResponse({"message": "KEY_ERROR"}, status=400)
+            return FastJsonResponse({"message": "KEY_ERROR"}, status=400)
         except TypeError:
-            return JsonResponse({"message": "TYPE_ERROR"}, status=400)
+            return FastJsonResponse({"message": "TYPE_ERROR"}, status=400)
 
 class RecruitView(APIView):
     parameter_token = openapi.Parameter (
@@ -149,41 +227,60 @@ class RecruitView(APIView):
                                         default     = ADMIN_TOKEN
     )
 
+    parameter_fields = openapi.Parameter (
+                                        "fields",
+                                        openapi.IN_QUERY,
+                                        description = "응답에 포함할 필드 (ex. id,position_title,stacks)",
+                                        type        = openapi.TYPE_STRING
+    )
+
     recruit_get_response = openapi.Response("result", RecruitSerializer)
 
     @swagger_auto_schema(
+        manual_parameters = [parameter_fields],
         responses = {
             "200": recruit_get_response,
+            "304": "NOT_MODIFIED",
+            "400": "INVALID_FIELDS",
             "404": "NOT_FOUND"
         },
         operation_id = "채용공고 상세 조회",
-        operation_description = "특정 채용공고 정보를 조회합니다."
+        operation_description = "특정 채용공고 정보를 조회합니다. 보관(archive)된 공고도 id 로 조회할 수 있습니다."
     )
     def get(self, request, recruit_id):
         try:
-            recruit = Recruit.objects.prefetch_related('stacks').get(id=recruit_id)
-
-            result = {
-                "id"             : recruit.id,
-                "position"       : recruit.position,
-                "position_title" : recruit.position_title,
-                "work_type"      : recruit.work_type,
-                "career_type"    : recruit.get_career_type_display(),
-                "author"         : recruit.author,
-                "job_openings"   : recruit.job_openings,
-                "description"    : recruit.description,
-                "minimum_salary" : recruit.minimum_salary,
-                "maximum_salary" : recruit.maximum_salary,
-                "deadline"       : recruit.deadline,
-                "created_at"     : recruit.created_at,
-                "updated_at"     : recruit.updated_at,
-                "stacks"         : [ stack.name for stack in recruit.stacks.all() ]
-            }
+            fields = parse_fields(request.GET.get("fields", ""), RECRUIT_FIELDS)
+
+            if request.headers.get("If-None-Match"):
+                etag = (
+                    lookup_recruit_etag(recruit_id, fields)
+                    or lookup_recruit_etag(recruit_id, fields, model=ArchivedRecruit)
+                )
+
+                if etag_matches(request, etag):
+                    return not_modified(etag)
+
+            recruit = (
+                recruit_queryset(fields).filter(id=recruit_id).first()
+                or recruit_queryset(fields, model=ArchivedRecruit).filter(id=recruit_id).first()
+            )
+
+            if not recruit:
+                return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
+
+            if fields == FULL_FIELDS:
+                response = EncodedJsonResponse({"result": get_fragment(recruit)}, status=200)
+            else:
+                response = FastJsonResponse({"result": serialize_recruit(recruit, fields)}, status=200)
 
-            return JsonResponse({"result": result}, status=200)
+            response["ETag"] = recruit_etag(recruit, fields)
 
+            return response
+
+        except InvalidFields:
+            return FastJsonResponse({"message": "INVALID_FIELDS"}, status=400)
         except Recruit.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
+            return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
 
     @swagger_auto_schema (
         manual_parameters = [parameter_token],
@@ -223,47 +320,34 @@ class RecruitView(APIView):
             author = request.user.email
 
             if not (career_type in career_type_choices):
-                return JsonResponse({"message": "BAD_REQUEST"}, status=400)
-
-            stacks_to_add = []
-            
-            for stack_name in stack_names:
-                s = hashlib.sha3_256()
-                s.update(stack_name.encode())
-                hash_id = s.hexdigest()
-
-                object, is_created = Stack.objects.get_or_create(hash_id=hash_id, name=stack_name)
-                stacks_to_add.append(object)
-
-            recruit.position       = position
-            recruit.position_title = position_title
-            recruit.description    = description
-            recruit.work_type      = work_type
-            recruit.career_type    = career_type_choices[career_type]
-            recruit.job_openings   = job_openings
-            recruit.author         = author
-            recruit.deadline       = deadline if deadline else "9999-12-31"
-            recruit.minimum_salary = minimum_salary if minimum_salary else 0
-            recruit.maximum_salary = maximum_salary if maximum_salary else 0
-            recruit.save()
-
-            items = RecruitStack.objects.select_related("stack").filter(recruit=recruit)
-            
-            stacks_to_remove = []
-
-            for item in items:
-                if not item.stack in stacks_to_add:
-                    stacks_to_remove.append(item.stack)
-            
-            recruit.stacks.remove(*stacks_to_remove)
-            recruit.stacks.add(*stacks_to_add)
-
-            return JsonResponse({"message": "SUCCESS"}, status=200)
+                return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
+
+            with transaction.atomic():
+                stack_ids = stack_resolver.resolve(stack_names)
+
+                recruit.position       = position
+                recruit.position_title = position_title
+                recruit.description    = description
+                recruit.stack_names    = unique_stack_names(stack_names)
+                recruit.work_type      = work_type
+                recruit.career_type    = career_type_choices[career_type]
+                recruit.job_openings   = job_openings
+                recruit.author         = author
+                recruit.deadline       = deadline if deadline else "9999-12-31"
+                recruit.minimum_salary = minimum_salary if minimum_salary else 0
+                recruit.maximum_salary = maximum_salary if maximum_salary else 0
+                recruit.save()
+
+                sync_recruit_stacks(recruit, stack_ids)
+
+            bump_version()
+
+            return FastJsonResponse({"message": "SUCCESS"}, status=200)
 
         except Recruit.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, stauts=404)
+            return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
         except TypeError:
-            return JsonResponse({"message": "TYPE_ERROR"}, status=400)
+            return FastJsonResponse({"message": "TYPE_ERROR"}, status=400)
 
     @swagger_auto_schema(
         manual_parameters = [parameter_token],
@@ -281,7 +365,59 @@ class RecruitView(APIView):
             recruit = Recruit.objects.get(id=recruit_id)
             recruit.delete()
 
-            return JsonResponse({"meessage": "SUCCESS"}, status=200)
+            bump_version()
+
+            return FastJsonResponse({"meessage": "SUCCESS"}, status=200)
 
         except Recruit.DoesNotExist:
-            return JsonResponse({"message": "NOT_FOUND"}, status=404)
\ No newline at end of file
+            return FastJsonResponse({"message": "NOT_FOUND"}, status=404)
+
+class RecruitImportView(APIView):
+    parameter_token = openapi.Parameter (
+                                        "Authorization", 
+                                        openapi.IN_HEADER, 
+                                        description = "access_token", 
+                                        type        = openapi.TYPE_STRING,
+                                        default     = ADMIN_TOKEN
+    )
+    parameter_format = openapi.Parameter (
+                                        "file_format",
+                                        openapi.IN_QUERY,
+                                        description = "jsonl(기본값) 또는 csv",
+                                        type        = openapi.TYPE_STRING
+    )
+    parameter_batch_size = openapi.Parameter (
+                                        "batch_size",
+                                        openapi.IN_QUERY,
+                                        description = "한 번에 저장할 공고 수",
+                                        type        = openapi.TYPE_INTEGER,
+                                        default     = DEFAULT_BATCH_SIZE
+    )
+
+    @swagger_auto_schema (
+        manual_parameters = [parameter_token, parameter_format, parameter_batch_size],
+        responses = {
+            "201": "SUCCESS",
+            "400": "BAD_REQUEST",
+            "401": "UNAUTHORIZED"
+        },
+        operation_id = "(관리자 전용) 채용공고 일괄 등록",
+        operation_description = "body에 JSONL(한 줄에 공고 하나) 또는 CSV 형식의 공고 목록을 담아 보내주세요.\n" +
+                                "각 행은 채용공고 생성 body와 같은 필드를 가지며, CSV의 stacks는 콤마로 구분합니다."
+    )
+    @admin_only
+    def post(self, request):
+        file_format = request.GET.get("file_format", "jsonl")
+
+        try:
+            batch_size = int(request.GET.get("batch_size", DEFAULT_BATCH_SIZE))
+        except ValueError:
+            return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
+
+        if not (file_format in ["jsonl", "csv"] and batch_size > 0):
+            return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
+
+        importer = RecruitImporter(author=request.user.email, batch_size=batch_size)
+        result   = importer.run(read_rows(request.stream or [], file_format))
+
+        return FastJsonResponse({"message": "SUCCESS", **result}, status=201)
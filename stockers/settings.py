@@ -83,6 +83,7 @@ WSGI_APPLICATION = 'stockers.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
+# bench_recruit_indexes, bench_recruit_search 는 'BENCHMARK': True 로 표시한 default 이외의 DB 에서만 실행됩니다.
 
 DATABASES = DATABASES
 
@@ -130,6 +131,76 @@ SWAGGER_SETTINGS = {
     'USE_SESSION_AUTH': False,
 }
 
+# Cache
+# recruits.cache 의 응답 캐시/버전 카운터가 사용합니다. 여러 프로세스가 캐시를 공유해야 하면
+# 'django.core.cache.backends.filebased.FileBasedCache' 로 바꿔주세요.
+# recruit_fragments 는 공고별로 미리 인코딩한 JSON 을 보관하므로 공고 수보다 넉넉하게 MAX_ENTRIES 를 잡습니다.
+
+# recruits.cache 의 목록 캐시 무효화(버전)는 default 캐시로 프로세스 사이에 전달됩니다.
+# 여러 프로세스로 운영할 때는 default 를 Redis, Memcached 같은 공유 backend 로 바꿔야 합니다.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'stockers',
+    },
+    'recruit_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'stockers-recruit-fragments',
+        'TIMEOUT': 60 * 60 * 24,
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+        },
+    },
+}
+
+# Portfolio upload
+# 지원서 포트폴리오 파일은 요청 중에 UPLOAD_SPOOL_DIR 에 저장하고 run_upload_worker 가 저장소로 올립니다.
+# 워커는 요청을 받은 서버와 같은 UPLOAD_SPOOL_DIR 을 볼 수 있어야 합니다.
+# PORTFOLIO_STORAGE 가 'local' 이면 S3 대신 PORTFOLIO_LOCAL_ROOT 에 저장합니다. (테스트/로컬 개발용)
+
+PORTFOLIO_STORAGE    = 's3'
+PORTFOLIO_BUCKET     = 'stockers-bucket'
+PORTFOLIO_URL_PREFIX = 'stockfolio.coo6llienldy.ap-northeast-2.rds.amazonaws.com/'
+PORTFOLIO_LOCAL_ROOT = BASE_DIR / 'media' / 'portfolios'
+UPLOAD_SPOOL_DIR     = BASE_DIR / 'spool' / 'uploads'
+
+# True 이면 지원서 요청의 포트폴리오 파일을 spool 에 쓰지 않고 받는 대로 multipart upload 로 저장소에 올립니다.
+# (applications.uploads.PortfolioUploadHandler) 버킷에 AbortIncompleteMultipartUpload lifecycle 규칙을 먼저 두어
+# 취소하지 못한 업로드도 정리되도록 한 뒤 켭니다. 켜기 전까지는 spool + run_upload_worker 로 올립니다.
+PORTFOLIO_STREAM_UPLOADS = False
+
+# presigned URL 로 S3 에 직접 올리는 포트폴리오의 크기, 형식 제한과 URL 유효 시간(초)
+
+PORTFOLIO_MAX_SIZE        = 50 * 1024 * 1024
+PORTFOLIO_PRESIGN_EXPIRES = 10 * 60
+PORTFOLIO_CONTENT_TYPES   = [
+    'application/pdf',
+    'application/zip',
+    'application/vnd.ms-powerpoint',
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    'image/jpeg',
+    'image/png',
+]
+
+# S3
+# core.s3 의 프로세스 공용 client 설정입니다. S3_ENDPOINT_URL 에 MinIO, moto_server 같은 로컬 S3 주소를 넣을 수 있습니다.
+# S3_MULTIPART_THRESHOLD 보다 큰 파일은 S3_MULTIPART_CHUNKSIZE 단위로 나눠 S3_MAX_CONCURRENCY 개 스레드로 올립니다.
+# 스트리밍 업로드도 S3_MULTIPART_CHUNKSIZE(S3 최소 5MB) 단위로 part 를 올립니다.
+
+S3_ENDPOINT_URL         = None
+S3_REGION_NAME          = None
+S3_MAX_POOL_CONNECTIONS = 20
+S3_MULTIPART_THRESHOLD  = 8 * 1024 * 1024
+S3_MULTIPART_CHUNKSIZE  = 8 * 1024 * 1024
+S3_MAX_CONCURRENCY      = 4
+
+# Application.content
+# 인코딩한 크기가 CONTENT_COMPRESSION_THRESHOLD(byte) 이상인 지원서 내용을 CONTENT_COMPRESSION 으로 압축해 저장합니다.
+# 'zstd' 는 zstandard 가 설치된 경우에만 사용하고, 없으면 'zlib' 을 사용합니다.
+
+CONTENT_COMPRESSION           = 'zlib'
+CONTENT_COMPRESSION_THRESHOLD = 8 * 1024
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/dev/ref/settings/#default-auto-field
 
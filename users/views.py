@@ -1,19 +1,21 @@
 import json, bcrypt, jwt, binascii, os, sendgrid
 
 from django.utils         import timezone
-from django.http          import JsonResponse
 from drf_yasg             import openapi
 from drf_yasg.utils       import swagger_auto_schema
 from rest_framework.views import APIView
 
 from sendgrid.helpers.mail import *
 
-from core.decorators   import login_required
-from global_variable   import SECRET_KEY, ALGORITHM, SENDGRID_API_KEY, EMAIL_DOMAIN
-from users.models      import User, UserTemp
-from recruits.models   import Recruit
-from users.validation  import validate_email, validate_password
-from users.serializers import SigninBodySerializer, SignupBodySerializer, MyPageGetSerializer, MyPagePatchBodySerializer, VerificationSerializer, VerificationResponseSerializer, ChangePasswordSerializer
+from core.decorators          import login_required
+from core.responses           import FastJsonResponse
+from global_variable          import SECRET_KEY, ALGORITHM, SENDGRID_API_KEY, EMAIL_DOMAIN
+from users.models             import User, UserTemp
+from recruits.models          import Recruit, ArchivedRecruit
+from users.validation         import validate_email, validate_password
+from applications.models      import Application
+from applications.serializers import find_application
+from users.serializers        import SigninBodySerializer, SignupBodySerializer, MyPageGetSerializer, MyPagePatchBodySerializer, VerificationSerializer, VerificationResponseSerializer, ChangePasswordSerializer
 
 class SignupView(APIView):
     @swagger_auto_schema (
@@ -31,19 +33,19 @@ class SignupView(APIView):
             data = json.loads(request.body)
 
             if not validate_email(data['email']):
-                return JsonResponse({'message': 'INVALID_EMAIL_FORMAT'}, status=400)
+                return FastJsonResponse({'message': 'INVALID_EMAIL_FORMAT'}, status=400)
 
             if User.objects.filter(email=data['email']).exists():
-                return JsonResponse({'message': 'ALREADY_EXISTED_EMAIL'}, status=400)           
+                return FastJsonResponse({'message': 'ALREADY_EXISTED_EMAIL'}, status=400)           
             
             if not validate_password(data['password']):
-                return JsonResponse({'message': 'INVALID_PASSWORD_FORMAT'}, status=400)
+                return FastJsonResponse({'message': 'INVALID_PASSWORD_FORMAT'}, status=400)
             
             password       = data['password']
             password_check = data['password_check'] 
             
             if password != password_check:
-                return JsonResponse({'message': 'BAD_REQUEST'}, status=400) 
+                return FastJsonResponse({'message': 'BAD_REQUEST'}, status=400) 
 
             encoded_password = data['password'].encode('utf-8')
             hashed_password  = bcrypt.hashpw(encoded_password, bcrypt.gensalt())
@@ -55,17 +57,18 @@ class SignupView(APIView):
 
             access_token = jwt.encode({'user_id': user.id, 'role': user.role}, SECRET_KEY, ALGORITHM)
 
-            return JsonResponse({'message': 'SUCCESS', 'access_token': access_token}, status=201)
+            return FastJsonResponse({'message': 'SUCCESS', 'access_token': access_token}, status=201)
 
         except KeyError:
-            return JsonResponse({'message': 'KEY_ERROR'}, status=400)
+            return FastJsonResponse({'message': 'KEY_ERROR'}, status=400)
 
 class SigninView(APIView):
     @swagger_auto_schema (
         request_body = SigninBodySerializer,
         responses = {
             "200": "SUCCESS",
-            "400": "BAD_REQUEST"
+            "400": "BAD_REQUEST",
+            "404": "NOT_FOUND"
         },
         operation_id = "로그인",
         operation_description = "이메일과 비밀번호 입력이 필요합니다."
@@ -74,10 +77,14 @@ class SigninView(APIView):
         data     = json.loads(request.body)
         email    = data['email']
         password = data['password']
-        recruit  = Recruit.objects.get(id=data['recruit_id'])
+        recruit_id = data['recruit_id']
+
+        # 마감되어 보관(archive)된 공고에서도 로그인할 수 있습니다.
+        if not (Recruit.objects.filter(id=recruit_id).exists() or ArchivedRecruit.objects.filter(id=recruit_id).exists()):
+            return FastJsonResponse({'message': 'NOT_FOUND'}, status=404)
 
         if not (validate_email(email) and validate_password(password)):
-            return JsonResponse({'message': 'BAD_REQUEST'}, status=400)          
+            return FastJsonResponse({'message': 'BAD_REQUEST'}, status=400)          
 
         user, is_created = User.objects.get_or_create(email= email)
 
@@ -88,18 +95,21 @@ class SigninView(APIView):
 
             access_token = jwt.encode({'user_id': user.id, 'role': user.role}, SECRET_KEY, ALGORITHM)
 
-            return JsonResponse({'access_token': access_token, 'is_applied': False}, status=200)
+            return FastJsonResponse({'access_token': access_token, 'is_applied': False}, status=200)
         
         encoded_password = password.encode('utf-8')
         hashed_password  = user.password.encode('utf-8')
 
         if bcrypt.checkpw(encoded_password, hashed_password):
             access_token = jwt.encode({'user_id': user.id, 'role': user.role}, SECRET_KEY, ALGORITHM)
-            is_applied   = recruit.applications.filter(user=user).exists()
+            try:
+                is_applied = bool(find_application(user, recruit_id))
+            except Application.DoesNotExist:
+                is_applied = False
 
-            return JsonResponse({'access_token': access_token, 'is_applied': is_applied}, status=200)
+            return FastJsonResponse({'access_token': access_token, 'is_applied': is_applied}, status=200)
 
-        return JsonResponse({'message': 'INVALID_PASSWORD'}, status=400)            
+        return FastJsonResponse({'message': 'INVALID_PASSWORD'}, status=400)            
 
 class VerificationView(APIView):
     verification_response = openapi.Response("SUCCESS", VerificationResponseSerializer)
@@ -120,7 +130,7 @@ class VerificationView(APIView):
             email = data['email']
 
             if not User.objects.filter(email=email).exists():
-                return JsonResponse({'message': 'NOT_FOUND'}, status=404)
+                return FastJsonResponse({'message': 'NOT_FOUND'}, status=404)
             
             code = binascii.hexlify(os.urandom(4)).decode()
 
@@ -150,10 +160,10 @@ class VerificationView(APIView):
             }
             sg.client.mail.send.post(request_body=data)
 
-            return JsonResponse({'email': email, 'code': code}, status=200)
+            return FastJsonResponse({'email': email, 'code': code}, status=200)
 
         except KeyError:
-            return JsonResponse({'message': 'KEY_ERROR'}, status=400)
+            return FastJsonResponse({'message': 'KEY_ERROR'}, status=400)
 
     @swagger_auto_schema (
         request_body = ChangePasswordSerializer,
@@ -175,11 +185,11 @@ class VerificationView(APIView):
             user_temp = UserTemp.objects.get(email=email)
             
             if user_temp.code != code:
-                return JsonResponse({'message': 'INVALID_CODE'}, status=400)
+                return FastJsonResponse({'message': 'INVALID_CODE'}, status=400)
             if user_temp.expired_at < timezone.now():
-                return JsonResponse({'message': 'EXPIRED_CODE'}, status=401)
+                return FastJsonResponse({'message': 'EXPIRED_CODE'}, status=401)
             if not validate_password(new_password):
-                return JsonResponse({'message': 'BAD_REQUEST'}, status=400)
+                return FastJsonResponse({'message': 'BAD_REQUEST'}, status=400)
 
             hashed_password  = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt())
 
@@ -187,14 +197,14 @@ class VerificationView(APIView):
             user.password = hashed_password.decode('utf-8')
             user.save()
 
-            return JsonResponse({'message': 'SUCCESS'}, status=200)
+            return FastJsonResponse({'message': 'SUCCESS'}, status=200)
 
         except User.DoesNotExist:
-            return JsonResponse({'message': 'NOT_FOUND'}, status=404)
+            return FastJsonResponse({'message': 'NOT_FOUND'}, status=404)
         except UserTemp.DoesNotExist:
-            return JsonResponse({'message': 'NOT_FOUND'}, status=404)
+            return FastJsonResponse({'message': 'NOT_FOUND'}, status=404)
         except KeyError:
-            return JsonResponse({'message': 'KEY_ERROR'}, status=400)
+            return FastJsonResponse({'message': 'KEY_ERROR'}, status=400)
 
 class UserMyPageView(APIView):
     parameter_token = openapi.Parameter (
@@ -226,7 +236,7 @@ class UserMyPageView(APIView):
             "updated_at": user.updated_at,
         }
 
-        return JsonResponse({"result": result}, status=200)
+        return FastJsonResponse({"result": result}, status=200)
 
     @swagger_auto_schema (
         manual_parameters = [parameter_token],
@@ -248,13 +258,13 @@ class UserMyPageView(APIView):
         new_password_check = data["new_password_check"]
 
         if not (new_password and new_password_check):
-            return JsonResponse({"message": "KEY_ERROR"}, status=400)
+            return FastJsonResponse({"message": "KEY_ERROR"}, status=400)
 
         if not new_password == new_password_check:
-            return JsonResponse({"message": "BAD_REQUEST"}, status=400)
+            return FastJsonResponse({"message": "BAD_REQUEST"}, status=400)
 
         if not validate_password(new_password):
-            return JsonResponse({"message": "INVALID_PASSWORD"}, status=400)
+            return FastJsonResponse({"message": "INVALID_PASSWORD"}, status=400)
 
         encoded_new_password = new_password.encode('utf-8')
         hashed_new_password  = bcrypt.hashpw(encoded_new_password, bcrypt.gensalt()).decode('utf-8')
@@ -262,4 +272,4 @@ class UserMyPageView(APIView):
         user.password = hashed_new_password
         user.save()
 
-        return JsonResponse({"message": "SUCCESS"}, status=200)
+        return FastJsonResponse({"message": "SUCCESS"}, status=200)